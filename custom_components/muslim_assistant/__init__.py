@@ -7,16 +7,25 @@ tracking, Adhan and Quran audio playback, and more.
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_LATITUDE,
     CONF_LONGITUDE,
+    CONF_TIME_ZONE,
     EVENT_HOMEASSISTANT_STARTED,
 )
-from homeassistant.core import Event, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_AUTO_ADHAN,
@@ -28,42 +37,96 @@ from .const import (
     CONF_NOTIFY_SERVICE,
     CONF_SCHOOL,
     DOMAIN,
+    EVENT_PRAYER_TIME,
+    PLACES_STORAGE_KEY,
+    PLACES_STORAGE_VERSION,
     PLATFORMS,
+    PRAYER_FAJR,
+    PRAYER_ISHA,
+    PRAYER_SUNRISE,
+    PRAYERS,
 )
 from .coordinator import MuslimAssistantCoordinator
+from .hub import async_get_hub
+from .scheduler import PrayerScheduler
+from .tasbih import async_remove_tasbih_store
 
 _LOGGER = logging.getLogger(__name__)
 
-NEXT_PRAYER_ENTITY = "sensor.muslim_assistant_next_prayer"
-RAMADAN_ENTITY = "sensor.muslim_assistant_ramadan_tracker"
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the resources shared by every Muslim Assistant entry."""
+    async_get_hub(hass)
+    return True
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an entry from an older config flow version."""
+    if entry.version < 3:
+        # Older entries took their coordinates from Home Assistant's
+        # location, so its time zone is theirs too; store it with them
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**entry.data, CONF_TIME_ZONE: hass.config.time_zone},
+            version=3,
+        )
+        _LOGGER.debug("Migrated %s to version 3", entry.title)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Muslim Assistant from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
+    time_zone_name = entry.options.get(
+        CONF_TIME_ZONE, entry.data[CONF_TIME_ZONE]
+    )
+    if (time_zone := dt_util.get_time_zone(time_zone_name)) is None:
+        raise ConfigEntryError(f"Unknown time zone {time_zone_name}")
+
     coordinator = MuslimAssistantCoordinator(
         hass,
         entry=entry,
         latitude=entry.data.get(CONF_LATITUDE, hass.config.latitude),
         longitude=entry.data.get(CONF_LONGITUDE, hass.config.longitude),
+        time_zone=time_zone,
         calc_method=entry.data.get(CONF_CALC_METHOD, "ISNA"),
         school=entry.data.get(CONF_SCHOOL, "Standard"),
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    # Sources are independent of each other; refresh them concurrently
+    await asyncio.gather(
+        coordinator.async_config_entry_first_refresh(),
+        *(
+            source_coordinator.async_config_entry_first_refresh()
+            for source_coordinator in coordinator.source_coordinators
+        ),
+    )
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    # Restore the tasbih counter without delaying setup
+    hass.async_create_background_task(
+        coordinator.tasbih.async_load(), f"{DOMAIN}_tasbih_restore"
+    )
+
+    # Build or open the offline Quran without delaying setup
+    coordinator.hub.async_load_corpus()
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Fire muslim_assistant_prayer_time at each exact prayer instant
+    entry.async_on_unload(PrayerScheduler(hass, coordinator).async_start())
+
     # Register services
     from .services import async_register_services
 
     await async_register_services(hass)
 
     # Set up internal automations based on user options
-    _async_setup_automations(hass, entry)
+    _async_setup_automations(hass, entry, coordinator)
 
     # Listen for options updates to reload coordinator
     entry.async_on_unload(entry.add_update_listener(async_update_options))
@@ -81,200 +144,168 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 def _async_setup_automations(
-    hass: HomeAssistant, entry: ConfigEntry
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: MuslimAssistantCoordinator,
 ) -> None:
     """Set up internal automations based on user options.
 
     These run inside the integration -- no external automations.yaml needed.
     The user enables them from Configure > Automations.
-    On options change, the integration reloads and re-registers listeners.
+    On options change, the integration reloads and re-registers them.
+
+    Every enabled automation is an action keyed by the prayer that
+    triggers it. A single listener for this entry's prayer time events
+    dispatches each event to the actions for that prayer only.
     """
     options = entry.options
+    actions: dict[str, list[Callable[[Event], Awaitable[None]]]] = {}
+
+    def _add_action(
+        prayers: Iterable[str], action: Callable[[Event], Awaitable[None]]
+    ) -> None:
+        for prayer in prayers:
+            actions.setdefault(prayer, []).append(action)
+
+    async def _async_notify(title: str, message: str) -> None:
+        """Send a message through the configured notify service."""
+        service_parts = options.get(CONF_NOTIFY_SERVICE, "").split(".", 1)
+        if len(service_parts) == 2:
+            await hass.services.async_call(
+                service_parts[0],
+                service_parts[1],
+                {"title": title, "message": message},
+                blocking=False,
+            )
 
     # ── Auto-play Adhan at every prayer time ──
     if options.get(CONF_AUTO_ADHAN, False):
 
-        async def _handle_adhan_on_prayer(event: Event) -> None:
-            """Play Adhan when the next prayer changes."""
-            if event.data.get("entity_id") != NEXT_PRAYER_ENTITY:
-                return
-            old_state = event.data.get("old_state")
-            new_state = event.data.get("new_state")
-            if (
-                old_state
-                and new_state
-                and old_state.state != new_state.state
-                and new_state.state not in ("unknown", "unavailable")
-                and new_state.state != "Sunrise"
-            ):
-                _LOGGER.info("Auto-playing Adhan for %s", new_state.state)
-                await hass.services.async_call(
-                    DOMAIN, "play_adhan", blocking=False
-                )
+        async def _play_adhan(event: Event) -> None:
+            """Play Adhan at the prayer time."""
+            _LOGGER.info("Auto-playing Adhan for %s", event.data["prayer"])
+            await hass.services.async_call(
+                DOMAIN,
+                "play_adhan",
+                {"config_entry_id": entry.entry_id},
+                blocking=False,
+            )
 
-        unsub = hass.bus.async_listen("state_changed", _handle_adhan_on_prayer)
-        entry.async_on_unload(unsub)
+        _add_action(
+            [prayer for prayer in PRAYERS if prayer != PRAYER_SUNRISE],
+            _play_adhan,
+        )
         _LOGGER.debug("Automation enabled: auto-play Adhan at prayer times")
 
     # ── Prayer time mobile notification ──
-    if options.get(CONF_AUTO_NOTIFY, False):
-        notify_service = options.get(CONF_NOTIFY_SERVICE, "")
-
-        if notify_service:
-
-            async def _handle_prayer_notification(event: Event) -> None:
-                """Send notification when prayer time arrives."""
-                if event.data.get("entity_id") != NEXT_PRAYER_ENTITY:
-                    return
-                old_state = event.data.get("old_state")
-                new_state = event.data.get("new_state")
-                if (
-                    old_state
-                    and new_state
-                    and old_state.state != new_state.state
-                    and new_state.state not in ("unknown", "unavailable")
-                ):
-                    prayer_name = new_state.state
-                    prayer_time = new_state.attributes.get("time", "")
-                    service_parts = notify_service.split(".", 1)
-                    if len(service_parts) == 2:
-                        await hass.services.async_call(
-                            service_parts[0],
-                            service_parts[1],
-                            {
-                                "title": f"Prayer Time: {prayer_name}",
-                                "message": (
-                                    f"It's time for {prayer_name} prayer"
-                                    f" at {prayer_time}"
-                                ),
-                            },
-                            blocking=False,
-                        )
-
-            unsub = hass.bus.async_listen(
-                "state_changed", _handle_prayer_notification
-            )
-            entry.async_on_unload(unsub)
-            _LOGGER.debug(
-                "Automation enabled: prayer notifications via %s",
-                notify_service,
+    if options.get(CONF_AUTO_NOTIFY, False) and options.get(
+        CONF_NOTIFY_SERVICE
+    ):
+
+        async def _notify_prayer(event: Event) -> None:
+            """Send notification when prayer time arrives."""
+            prayer_name = event.data["prayer"]
+            await _async_notify(
+                f"Prayer Time: {prayer_name}",
+                f"It's time for {prayer_name} prayer at {event.data['time']}",
             )
 
+        _add_action(PRAYERS, _notify_prayer)
+        _LOGGER.debug(
+            "Automation enabled: prayer notifications via %s",
+            options[CONF_NOTIFY_SERVICE],
+        )
+
     # ── Play Quran after Fajr ──
     if options.get(CONF_AUTO_QURAN_FAJR, False):
-        _fajr_played_today: set[str] = set()
+        pending_quran: list[CALLBACK_TYPE] = []
 
-        async def _handle_quran_after_fajr(event: Event) -> None:
+        async def _play_quran_after_fajr(event: Event) -> None:
             """Play Surah Al-Mulk 15 minutes after Fajr."""
-            if event.data.get("entity_id") != NEXT_PRAYER_ENTITY:
-                return
-            old_state = event.data.get("old_state")
-            new_state = event.data.get("new_state")
-            if (
-                old_state
-                and new_state
-                and old_state.state == "Fajr"
-                and new_state.state != "Fajr"
-            ):
-                today = datetime.now().strftime("%Y-%m-%d")
-                if today in _fajr_played_today:
-                    return
-                _fajr_played_today.add(today)
-                # Clean old dates
-                _fajr_played_today.discard(
-                    (datetime.now().replace(day=datetime.now().day - 1)).strftime(
-                        "%Y-%m-%d"
-                    )
-                )
-                _LOGGER.info("Auto-playing Quran after Fajr (Surah Al-Mulk)")
-                import asyncio
 
-                await asyncio.sleep(900)  # 15 minutes
+            async def _play(now: datetime) -> None:
+                pending_quran.clear()
+                _LOGGER.info("Auto-playing Quran after Fajr (Surah Al-Mulk)")
                 await hass.services.async_call(
                     DOMAIN,
                     "play_quran",
-                    {"surah_number": 67},
+                    {
+                        "surah_number": 67,
+                        "config_entry_id": entry.entry_id,
+                    },
                     blocking=False,
                 )
 
-        unsub = hass.bus.async_listen(
-            "state_changed", _handle_quran_after_fajr
-        )
-        entry.async_on_unload(unsub)
+            pending_quran.append(
+                async_call_later(hass, timedelta(minutes=15), _play)
+            )
+
+        @callback
+        def _cancel_pending_quran() -> None:
+            while pending_quran:
+                pending_quran.pop()()
+
+        entry.async_on_unload(_cancel_pending_quran)
+        _add_action([PRAYER_FAJR], _play_quran_after_fajr)
         _LOGGER.debug("Automation enabled: Quran after Fajr")
 
     # ── Surah Al-Kahf on Friday ──
     if options.get(CONF_AUTO_KAHF_FRIDAY, False):
-        _kahf_played_today: set[str] = set()
 
-        async def _handle_kahf_friday(event: Event) -> None:
+        async def _play_kahf_friday(event: Event) -> None:
             """Play Surah Al-Kahf on Friday mornings."""
-            if event.data.get("entity_id") != NEXT_PRAYER_ENTITY:
+            today = dt_util.now(coordinator.time_zone)
+            if today.weekday() != 4:  # Friday = 4
                 return
-            now = datetime.now()
-            if now.weekday() != 4:  # Friday = 4
-                return
-            today = now.strftime("%Y-%m-%d")
-            if today in _kahf_played_today:
-                return
-            new_state = event.data.get("new_state")
-            if new_state and new_state.state == "Dhuhr":
-                _kahf_played_today.add(today)
-                _LOGGER.info("Auto-playing Surah Al-Kahf (Friday)")
-                await hass.services.async_call(
-                    DOMAIN,
-                    "play_quran",
-                    {"surah_number": 18},
-                    blocking=False,
-                )
+            _LOGGER.info("Auto-playing Surah Al-Kahf (Friday)")
+            await hass.services.async_call(
+                DOMAIN,
+                "play_quran",
+                {
+                    "surah_number": 18,
+                    "config_entry_id": entry.entry_id,
+                },
+                blocking=False,
+            )
 
-        unsub = hass.bus.async_listen(
-            "state_changed", _handle_kahf_friday
-        )
-        entry.async_on_unload(unsub)
+        _add_action([PRAYER_SUNRISE], _play_kahf_friday)
         _LOGGER.debug("Automation enabled: Surah Al-Kahf on Fridays")
 
     # ── Suhoor reminder during Ramadan ──
-    if options.get(CONF_AUTO_SUHOOR, False):
-        notify_service = options.get(CONF_NOTIFY_SERVICE, "")
-
-        if notify_service:
-
-            async def _handle_suhoor_reminder(event: Event) -> None:
-                """Send Suhoor reminder when Fajr is the next prayer."""
-                if event.data.get("entity_id") != NEXT_PRAYER_ENTITY:
-                    return
-                new_state = event.data.get("new_state")
-                if not new_state or new_state.state != "Fajr":
-                    return
-                # Check if Ramadan
-                ramadan_state = hass.states.get(RAMADAN_ENTITY)
-                if (
-                    not ramadan_state
-                    or not ramadan_state.attributes.get("is_ramadan")
-                ):
-                    return
-                fajr_time = new_state.attributes.get("time", "")
-                service_parts = notify_service.split(".", 1)
-                if len(service_parts) == 2:
-                    await hass.services.async_call(
-                        service_parts[0],
-                        service_parts[1],
-                        {
-                            "title": "Suhoor Reminder",
-                            "message": (
-                                f"Time to prepare for Suhoor! "
-                                f"Fasting begins at {fajr_time} (Fajr)."
-                            ),
-                        },
-                        blocking=False,
-                    )
-
-            unsub = hass.bus.async_listen(
-                "state_changed", _handle_suhoor_reminder
+    if options.get(CONF_AUTO_SUHOOR, False) and options.get(
+        CONF_NOTIFY_SERVICE
+    ):
+
+        async def _remind_suhoor(event: Event) -> None:
+            """Send Suhoor reminder after Isha, when Fajr is next."""
+            if not (coordinator.data or {}).get("ramadan", {}).get(
+                "is_ramadan"
+            ):
+                return
+            _, fajr_time = coordinator.next_prayer_time(dt_util.now())
+            fajr = fajr_time.strftime("%H:%M") if fajr_time else ""
+            await _async_notify(
+                "Suhoor Reminder",
+                f"Time to prepare for Suhoor! "
+                f"Fasting begins at {fajr} (Fajr).",
             )
-            entry.async_on_unload(unsub)
-            _LOGGER.debug("Automation enabled: Suhoor reminders during Ramadan")
+
+        _add_action([PRAYER_ISHA], _remind_suhoor)
+        _LOGGER.debug("Automation enabled: Suhoor reminders during Ramadan")
+
+    if not actions:
+        return
+
+    async def _async_dispatch(event: Event) -> None:
+        """Run the enabled actions for this entry's prayer."""
+        if event.data.get("entry_id") != entry.entry_id:
+            return
+        for action in actions.get(event.data.get("prayer"), ()):
+            await action(event)
+
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_PRAYER_TIME, _async_dispatch)
+    )
 
 
 async def _async_create_dashboard(hass: HomeAssistant) -> None:
@@ -306,8 +337,6 @@ async def _async_create_dashboard(hass: HomeAssistant) -> None:
             }
         )
 
-        import asyncio
-
         await asyncio.sleep(0.5)
 
         dashboard = dashboards.get("muslim-assistant")
@@ -332,6 +361,9 @@ async def async_unload_entry(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> bool:
     """Unload a config entry."""
+    # Publish and persist tasbih changes still held back for later
+    await hass.data[DOMAIN][entry.entry_id].tasbih.async_shutdown()
+
     unload_ok = await hass.config_entries.async_unload_platforms(
         entry, PLATFORMS
     )
@@ -339,3 +371,11 @@ async def async_unload_entry(
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete data persisted for a removed entry."""
+    await async_remove_tasbih_store(hass, entry.entry_id)
+    await Store(
+        hass, PLACES_STORAGE_VERSION, f"{PLACES_STORAGE_KEY}.{entry.entry_id}"
+    ).async_remove()
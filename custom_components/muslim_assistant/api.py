@@ -0,0 +1,192 @@
+"""HTTP client for the upstream APIs used by Muslim Assistant."""
+
+from __future__ import annotations
+
+import asyncio
+from email.utils import parsedate_to_datetime
+import hashlib
+from http import HTTPStatus
+import json
+import logging
+import time
+from typing import Any
+
+import aiohttp
+from aiohttp import hdrs
+from yarl import URL
+
+from .cache import ResponseCache
+from .const import (
+    HTTP_BACKOFF_INITIAL,
+    HTTP_BACKOFF_MAX,
+    HTTP_MAX_PER_HOST,
+    HTTP_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Responses that mean "come back later" rather than "this request is bad"
+BACKOFF_STATUSES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+
+class UpstreamBackoffError(aiohttp.ClientError):
+    """A request was skipped because its host asked us to back off."""
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class MuslimAssistantApiClient:
+    """Pooled HTTP client shared by every Muslim Assistant config entry.
+
+    Requests go through Home Assistant's shared aiohttp session, whose
+    connector keeps connections alive and caches DNS lookups, so repeated
+    calls to the same upstream reuse an open TCP/TLS connection. On top
+    of that the client bounds concurrent requests per upstream host,
+    gives every request an explicit timeout and can serve responses from
+    a persistent cache, so restarts do not refetch immutable data.
+
+    A host that throttles (429) or whose gateway fails (503/504) is left
+    alone for its Retry-After, or for an exponential backoff when it
+    gives none; requests meanwhile fail fast with UpstreamBackoffError,
+    and a cached response is served instead where there is one.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        cache: ResponseCache,
+        max_per_host: int = HTTP_MAX_PER_HOST,
+    ) -> None:
+        """Initialize the client."""
+        self._session = session
+        self._cache = cache
+        self._max_per_host = max_per_host
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self._backoff_until: dict[str, float] = {}
+        self._backoff_delay: dict[str, float] = {}
+
+    def _host_limit(self, host: str) -> asyncio.Semaphore:
+        """Return the concurrency limit for a host."""
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(
+                self._max_per_host
+            )
+        return limit
+
+    def _back_off(self, host: str, retry_after: str | None) -> None:
+        """Stop contacting a host for a while."""
+        delay = _retry_after_seconds(retry_after)
+        if delay is None:
+            previous = self._backoff_delay.get(host)
+            delay = previous * 2 if previous else HTTP_BACKOFF_INITIAL
+        delay = min(delay, HTTP_BACKOFF_MAX)
+        self._backoff_delay[host] = delay
+        self._backoff_until[host] = time.monotonic() + delay
+        _LOGGER.warning(
+            "%s is throttling requests; backing off %ds", host, delay
+        )
+
+    async def async_get_json(
+        self,
+        url: str,
+        timeout: float = HTTP_TIMEOUT,
+        ttl: float | None = None,
+    ) -> Any:
+        """GET a URL and return the decoded JSON body.
+
+        With a `ttl`, the response is served from the persistent cache
+        while fresh and revalidated once stale.
+        """
+        return await self._async_request("GET", url, url, timeout, ttl)
+
+    async def async_post_json(
+        self,
+        url: str,
+        data: dict[str, Any],
+        timeout: float = HTTP_TIMEOUT,
+        ttl: float | None = None,
+    ) -> Any:
+        """POST form data to a URL and return the decoded JSON body."""
+        digest = hashlib.sha1(
+            json.dumps(data, sort_keys=True).encode()
+        ).hexdigest()
+        return await self._async_request(
+            "POST", url, f"POST {url} {digest}", timeout, ttl, data
+        )
+
+    async def _async_request(
+        self,
+        method: str,
+        url: str,
+        key: str,
+        timeout: float,
+        ttl: float | None,
+        data: dict[str, Any] | None = None,
+    ) -> Any:
+        """Perform a request, going through the cache when a TTL is set."""
+        entry: dict[str, Any] | None = None
+        headers: dict[str, str] = {}
+        if ttl is not None:
+            await self._cache.async_load()
+            entry = self._cache.get(key)
+            if entry is not None:
+                if self._cache.is_fresh(entry, ttl):
+                    return entry["data"]
+                if entry.get("etag"):
+                    headers[hdrs.IF_NONE_MATCH] = entry["etag"]
+                if entry.get("last_modified"):
+                    headers[hdrs.IF_MODIFIED_SINCE] = entry["last_modified"]
+
+        host = URL(url).host or ""
+        try:
+            if self._backoff_until.get(host, 0) > time.monotonic():
+                raise UpstreamBackoffError(f"Backing off from {host}")
+            async with self._host_limit(host):
+                async with self._session.request(
+                    method,
+                    url,
+                    data=data,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                ) as resp:
+                    if resp.status in BACKOFF_STATUSES:
+                        retry_after = resp.headers.get(hdrs.RETRY_AFTER)
+                        self._back_off(host, retry_after)
+                    else:
+                        self._backoff_delay.pop(host, None)
+                    if resp.status == HTTPStatus.NOT_MODIFIED and entry:
+                        self._cache.touch(key)
+                        return entry["data"]
+                    resp.raise_for_status()
+                    result = await resp.json()
+                    etag = resp.headers.get(hdrs.ETAG)
+                    last_modified = resp.headers.get(hdrs.LAST_MODIFIED)
+        except (aiohttp.ClientError, TimeoutError) as err:
+            if entry is None:
+                raise
+            _LOGGER.debug("Serving stale response for %s: %s", url, err)
+            return entry["data"]
+
+        if ttl is not None:
+            self._cache.set(key, result, etag, last_modified)
+        return result
+
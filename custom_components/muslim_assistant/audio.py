@@ -0,0 +1,285 @@
+"""Local audio cache and LAN proxy for Muslim Assistant.
+
+Adhan and Quran recordings are downloaded once into a size-bounded
+directory under `.storage` and served to speakers by Home Assistant's
+own web server, so every speaker in the house streams from the LAN
+instead of each one fetching the same file from a CDN.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.network import NoURLAvailableError, get_url
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    AUDIO_CACHE_DIR,
+    AUDIO_CACHE_MAX_BYTES,
+    AUDIO_CACHE_MAX_PENDING,
+    AUDIO_CACHE_SAVE_DELAY,
+    AUDIO_CACHE_STORAGE_KEY,
+    AUDIO_CACHE_STORAGE_VERSION,
+    AUDIO_DOWNLOAD_TIMEOUT,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+AUDIO_URL_PATH = f"/api/{DOMAIN}/audio"
+
+_CHUNK_SIZE = 1 << 16
+_SUFFIX = ".mp3"
+
+
+class AudioCache:
+    """Recordings cached on disk, least recently played evicted first.
+
+    Every remote URL handed out through `async_local_url` gets a stable
+    key, the SHA-1 of the URL. The index of keys, their remote URLs,
+    sizes and last use is persisted under `.storage`; the files live in
+    their own directory beside it. Downloads are single-flight: however
+    many speakers ask for a file at once, it is fetched one time.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, session: aiohttp.ClientSession
+    ) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._session = session
+        self._directory = Path(hass.config.path(".storage", AUDIO_CACHE_DIR))
+        self._store: Store[dict[str, Any]] = Store(
+            hass, AUDIO_CACHE_STORAGE_VERSION, AUDIO_CACHE_STORAGE_KEY
+        )
+        # Ordered least recently used first
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._downloads: dict[str, asyncio.Task[Path | None]] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load the index and create the cache directory once."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            stored = await self._store.async_load()
+            if stored:
+                entries = stored.get("entries", {})
+                self._entries = dict(
+                    sorted(entries.items(), key=lambda item: item[1]["used"])
+                )
+            await self._hass.async_add_executor_job(
+                lambda: self._directory.mkdir(parents=True, exist_ok=True)
+            )
+            self._loaded = True
+            _LOGGER.debug("Loaded %d cached recordings", len(self._entries))
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        """Return the cache key of a remote URL."""
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    async def async_local_url(self, url: str) -> str:
+        """Return a LAN URL that serves a remote recording.
+
+        Falls back to the remote URL when Home Assistant has no URL the
+        speakers could reach.
+        """
+        await self.async_load()
+        key = self._register(url)
+        try:
+            base_url = get_url(self._hass, prefer_external=False)
+        except NoURLAvailableError:
+            _LOGGER.debug("No local URL available; streaming %s directly", url)
+            return url
+        return f"{base_url}{AUDIO_URL_PATH}/{key}{_SUFFIX}"
+
+    async def async_prefetch(self, url: str) -> Path | None:
+        """Make sure a recording is on disk; return its path."""
+        await self.async_load()
+        return await self._async_fetch(self._register(url))
+
+    def remote_url(self, key: str) -> str | None:
+        """Return the remote URL behind a key, if known."""
+        entry = self._entries.get(key)
+        return entry["url"] if entry else None
+
+    def cached_path(self, key: str) -> Path | None:
+        """Return the file of a cached recording and mark it used."""
+        entry = self._entries.get(key)
+        if entry is None or not entry["size"]:
+            return None
+        self._touch(key)
+        return self._path(key)
+
+    @callback
+    def async_schedule_fetch(self, key: str) -> None:
+        """Download a recording in the background."""
+        if key not in self._downloads:
+            self._hass.async_create_background_task(
+                self._async_fetch(key), f"{DOMAIN}_audio_fetch"
+            )
+
+    def _register(self, url: str) -> str:
+        """Remember a remote URL and return its key."""
+        key = self.key_for(url)
+        if key not in self._entries:
+            self._entries[key] = {"url": url, "size": 0, "used": time.time()}
+            self._forget_stale_pending()
+            self._async_schedule_save()
+        return key
+
+    def _forget_stale_pending(self) -> None:
+        """Drop the oldest URLs never downloaded beyond the pending cap."""
+        pending = [
+            key
+            for key, entry in self._entries.items()
+            if not entry["size"] and key not in self._downloads
+        ]
+        for key in pending[: max(0, len(pending) - AUDIO_CACHE_MAX_PENDING)]:
+            del self._entries[key]
+
+    def _path(self, key: str) -> Path:
+        """Return where a recording is stored."""
+        return self._directory / f"{key}{_SUFFIX}"
+
+    def _touch(self, key: str) -> None:
+        """Move an entry to the most recently used end."""
+        entry = self._entries.pop(key)
+        entry["used"] = time.time()
+        self._entries[key] = entry
+        self._async_schedule_save()
+
+    async def _async_fetch(self, key: str) -> Path | None:
+        """Return a recording's file, downloading it if needed."""
+        if (path := self.cached_path(key)) is not None:
+            return path
+        download = self._downloads.get(key)
+        if download is None:
+            download = self._downloads[key] = asyncio.create_task(
+                self._async_download(key)
+            )
+            download.add_done_callback(
+                lambda _: self._downloads.pop(key, None)
+            )
+        return await asyncio.shield(download)
+
+    async def _async_download(self, key: str) -> Path | None:
+        """Download a recording to a temporary file, then move it in."""
+        entry = self._entries[key]
+        path = self._path(key)
+        partial = path.with_suffix(".part")
+        size = 0
+        try:
+            async with self._session.get(
+                entry["url"],
+                timeout=aiohttp.ClientTimeout(total=AUDIO_DOWNLOAD_TIMEOUT),
+            ) as resp:
+                resp.raise_for_status()
+                file = await self._hass.async_add_executor_job(
+                    partial.open, "wb"
+                )
+                try:
+                    async for chunk in resp.content.iter_chunked(_CHUNK_SIZE):
+                        await self._hass.async_add_executor_job(
+                            file.write, chunk
+                        )
+                        size += len(chunk)
+                finally:
+                    await self._hass.async_add_executor_job(file.close)
+            await self._hass.async_add_executor_job(os.replace, partial, path)
+        except (aiohttp.ClientError, TimeoutError, OSError) as err:
+            _LOGGER.warning("Could not cache %s: %s", entry["url"], err)
+            await self._hass.async_add_executor_job(
+                lambda: partial.unlink(missing_ok=True)
+            )
+            return None
+
+        if key not in self._entries:
+            # Evicted while downloading; nothing would ever delete the file
+            await self._hass.async_add_executor_job(
+                lambda: path.unlink(missing_ok=True)
+            )
+            return None
+
+        entry["size"] = size
+        self._touch(key)
+        _LOGGER.debug("Cached %s (%d bytes)", entry["url"], size)
+        await self._async_evict()
+        return path
+
+    async def _async_evict(self) -> None:
+        """Delete least recently used files beyond the size budget."""
+        total = sum(entry["size"] for entry in self._entries.values())
+        if total <= AUDIO_CACHE_MAX_BYTES:
+            return
+        newest = next(reversed(self._entries))
+        evicted = []
+        for key, entry in self._entries.items():
+            if total <= AUDIO_CACHE_MAX_BYTES or key == newest:
+                break
+            if entry["size"]:
+                total -= entry["size"]
+                evicted.append(key)
+        # Forget evicted URLs entirely; asking for one again re-registers it
+        paths = [self._path(key) for key in evicted]
+        for key in evicted:
+            del self._entries[key]
+        await self._hass.async_add_executor_job(
+            lambda: [path.unlink(missing_ok=True) for path in paths]
+        )
+        _LOGGER.debug("Evicted %d cached recordings", len(evicted))
+        self._async_schedule_save()
+
+    def _async_schedule_save(self) -> None:
+        """Write the index to disk after a quiet period."""
+        self._store.async_delay_save(
+            lambda: {"entries": self._entries}, AUDIO_CACHE_SAVE_DELAY
+        )
+
+
+class AudioProxyView(HomeAssistantView):
+    """Serve cached recordings to speakers on the local network.
+
+    Speakers cannot authenticate, so the view is open; it only serves
+    keys handed out by the integration, each the hash of a public URL.
+    A recording not cached yet redirects to its remote URL while it is
+    downloaded for next time. Range requests are answered by aiohttp's
+    FileResponse, so speakers can seek and resume.
+    """
+
+    url = f"{AUDIO_URL_PATH}/{{filename}}"
+    name = f"api:{DOMAIN}:audio"
+    requires_auth = False
+
+    def __init__(self, cache: AudioCache) -> None:
+        """Initialize the view."""
+        self._cache = cache
+
+    async def get(
+        self, request: web.Request, filename: str
+    ) -> web.StreamResponse:
+        """Serve a recording, or redirect while it is being cached."""
+        await self._cache.async_load()
+        key = filename.removesuffix(_SUFFIX)
+        if (path := self._cache.cached_path(key)) is not None:
+            return web.FileResponse(path)
+        if (url := self._cache.remote_url(key)) is None:
+            raise web.HTTPNotFound
+        self._cache.async_schedule_fetch(key)
+        raise web.HTTPFound(url)
+
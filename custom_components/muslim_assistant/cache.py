@@ -0,0 +1,201 @@
+"""Response and lookup caches for Muslim Assistant."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CACHE_MAX_BYTES,
+    CACHE_MAX_ENTRIES,
+    CACHE_MAX_ENTRY_BYTES,
+    CACHE_SAVE_DELAY,
+    CACHE_STORAGE_KEY,
+    CACHE_STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Upstream responses persisted under `.storage`, keyed by request.
+
+    Each entry holds the decoded JSON body, the time it was fetched and
+    any ETag/Last-Modified validators the upstream sent, so a stale entry
+    can be revalidated with a conditional request instead of refetched.
+
+    The whole store is rewritten on every save, so it is bounded by
+    size: responses over CACHE_MAX_ENTRY_BYTES (such as a whole surah in
+    two editions, which the offline corpus covers) are not kept, and the
+    oldest entries are evicted beyond CACHE_MAX_BYTES or
+    CACHE_MAX_ENTRIES.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, CACHE_STORAGE_VERSION, CACHE_STORAGE_KEY
+        )
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._bytes = 0
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load persisted entries once."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            stored = await self._store.async_load()
+            if stored:
+                for key, entry in stored.get("entries", {}).items():
+                    if "size" not in entry:
+                        entry["size"] = len(json_bytes(entry["data"]))
+                    self._add(key, entry)
+            self._loaded = True
+            _LOGGER.debug("Loaded %d cached responses", len(self._entries))
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached entry for a key, fresh or not."""
+        return self._entries.get(key)
+
+    @staticmethod
+    def is_fresh(entry: dict[str, Any], ttl: float) -> bool:
+        """Return True if an entry is younger than its TTL."""
+        return time.time() - entry["fetched"] < ttl
+
+    def set(
+        self,
+        key: str,
+        data: Any,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response body and its validators."""
+        self._remove(key)
+        self._add(
+            key,
+            {
+                "data": data,
+                "fetched": time.time(),
+                "etag": etag,
+                "last_modified": last_modified,
+                "size": len(json_bytes(data)),
+            },
+        )
+        self._async_schedule_save()
+
+    def touch(self, key: str) -> None:
+        """Mark an entry as revalidated (304 Not Modified)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry["fetched"] = time.time()
+            self._entries[key] = entry
+            self._async_schedule_save()
+
+    def _add(self, key: str, entry: dict[str, Any]) -> None:
+        """Add an entry as the newest, evicting the oldest beyond bounds."""
+        if entry["size"] > CACHE_MAX_ENTRY_BYTES:
+            return
+        self._entries[key] = entry
+        self._bytes += entry["size"]
+        while (
+            self._bytes > CACHE_MAX_BYTES
+            or len(self._entries) > CACHE_MAX_ENTRIES
+        ):
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry["size"]
+
+    def _async_schedule_save(self) -> None:
+        """Write the cache to disk after a quiet period."""
+        self._store.async_delay_save(
+            lambda: {"entries": self._entries}, CACHE_SAVE_DELAY
+        )
+
+
+class LookupCache:
+    """Results of async lookups, coalesced in flight and kept LRU.
+
+    Concurrent calls for the same key share one fetch. Completed results
+    are kept least recently used first and evicted once their total
+    size, measured as serialized JSON, exceeds `max_bytes`. Results are
+    shared between callers, who must not modify them. Empty results are
+    treated as failures and not kept.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize the cache."""
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def async_get(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the result for a key, fetching it at most once."""
+        if (entry := self._entries.get(key)) is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = self._in_flight[key] = asyncio.ensure_future(fetch())
+            task.add_done_callback(lambda done: self._finish(key, done))
+        # One caller giving up must not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        """Keep the result of a completed fetch."""
+        del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if not result:
+            return
+        size = len(json_bytes(result))
+        if size > self._max_bytes:
+            return
+        self._entries[key] = (result, size)
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters for tuning the cache size."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (
+                round((self.hits + self.coalesced) / lookups, 3)
+                if lookups
+                else 0.0
+            ),
+        }
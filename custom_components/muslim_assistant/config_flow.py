@@ -12,7 +12,12 @@ from homeassistant.config_entries import (
     ConfigFlow,
     OptionsFlowWithConfigEntry,
 )
-from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE, CONF_NAME
+from homeassistant.const import (
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    CONF_NAME,
+    CONF_TIME_ZONE,
+)
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.selector import (
@@ -22,6 +27,7 @@ from homeassistant.helpers.selector import (
     SelectSelectorConfig,
     SelectSelectorMode,
 )
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ADHAN_SOUNDS,
@@ -36,6 +42,8 @@ from .const import (
     CONF_CALC_METHOD,
     CONF_DHUHR_OFFSET,
     CONF_FAJR_OFFSET,
+    CONF_HIGH_LAT_RULE,
+    CONF_HIJRI_ADJUSTMENT,
     CONF_ISHA_OFFSET,
     CONF_MAGHRIB_OFFSET,
     CONF_NOTIFY_SERVICE,
@@ -44,9 +52,11 @@ from .const import (
     CONF_TARGET_PLAYER,
     DEFAULT_ADHAN,
     DEFAULT_CALC_METHOD,
+    DEFAULT_HIGH_LAT_RULE,
     DEFAULT_RECITER,
     DEFAULT_SCHOOL,
     DOMAIN,
+    HIGH_LAT_RULES,
     QURAN_RECITERS,
     SCHOOLS,
 )
@@ -57,7 +67,7 @@ _LOGGER = logging.getLogger(__name__)
 class MuslimAssistantConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Muslim Assistant."""
 
-    VERSION = 2
+    VERSION = 3
 
     @staticmethod
     @callback
@@ -76,6 +86,9 @@ class MuslimAssistantConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             lat = self.hass.config.latitude
             lon = self.hass.config.longitude
+            # Prayer times are computed in the zone of the coordinates;
+            # both come from Home Assistant's location here
+            time_zone = self.hass.config.time_zone
 
             await self.async_set_unique_id(f"{lat}_{lon}")
             self._abort_if_unique_id_configured()
@@ -84,6 +97,7 @@ class MuslimAssistantConfigFlow(ConfigFlow, domain=DOMAIN):
                 **user_input,
                 CONF_LATITUDE: lat,
                 CONF_LONGITUDE: lon,
+                CONF_TIME_ZONE: time_zone,
             }
 
             return self.async_create_entry(
@@ -186,14 +200,28 @@ class MuslimAssistantOptionsFlow(OptionsFlowWithConfigEntry):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle prayer time adjustment options."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            new_options = {**self.options, **user_input}
-            return self.async_create_entry(title="", data=new_options)
+            if dt_util.get_time_zone(user_input[CONF_TIME_ZONE]) is None:
+                errors[CONF_TIME_ZONE] = "invalid_time_zone"
+            else:
+                new_options = {**self.options, **user_input}
+                return self.async_create_entry(title="", data=new_options)
 
         return self.async_show_form(
             step_id="prayer_adjustments",
             data_schema=vol.Schema(
                 {
+                    vol.Required(
+                        CONF_TIME_ZONE,
+                        default=self.options.get(
+                            CONF_TIME_ZONE,
+                            self.config_entry.data.get(
+                                CONF_TIME_ZONE, self.hass.config.time_zone
+                            ),
+                        ),
+                    ): str,
                     vol.Optional(
                         CONF_FAJR_OFFSET,
                         default=self.options.get(CONF_FAJR_OFFSET, 0),
@@ -224,8 +252,26 @@ class MuslimAssistantOptionsFlow(OptionsFlowWithConfigEntry):
                     ): vol.All(
                         vol.Coerce(int), vol.Range(min=-30, max=30)
                     ),
+                    vol.Optional(
+                        CONF_HIGH_LAT_RULE,
+                        default=self.options.get(
+                            CONF_HIGH_LAT_RULE, DEFAULT_HIGH_LAT_RULE
+                        ),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=list(HIGH_LAT_RULES.keys()),
+                            mode=SelectSelectorMode.DROPDOWN,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_HIJRI_ADJUSTMENT,
+                        default=self.options.get(CONF_HIJRI_ADJUSTMENT, 0),
+                    ): vol.All(
+                        vol.Coerce(int), vol.Range(min=-2, max=2)
+                    ),
                 }
             ),
+            errors=errors,
         )
 
     async def async_step_automations(
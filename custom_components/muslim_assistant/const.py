@@ -17,6 +17,8 @@ CONF_ISHA_OFFSET = "isha_offset"
 CONF_QURAN_RECITER = "quran_reciter"
 CONF_ADHAN_SOUND = "adhan_sound"
 CONF_TARGET_PLAYER = "target_media_player"
+CONF_HIGH_LAT_RULE = "high_latitude_rule"
+CONF_HIJRI_ADJUSTMENT = "hijri_adjustment"
 
 # Automation options
 CONF_AUTO_ADHAN = "auto_play_adhan"
@@ -29,6 +31,7 @@ CONF_AUTO_SUHOOR = "auto_suhoor_reminder"
 # Defaults
 DEFAULT_CALC_METHOD = "ISNA"
 DEFAULT_SCHOOL = "Standard"
+DEFAULT_HIGH_LAT_RULE = "Angle Based"
 
 # Calculation Methods (from Aladhan API)
 CALC_METHODS = {
@@ -69,6 +72,42 @@ CALC_METHOD_MAP = {
     "Dubai": 16,
 }
 
+# Calculation parameters per method id. Angles are sun depression angles
+# in degrees, "*_minutes" are fixed intervals after Maghrib/sunset.
+# Mirrors the parameter set published by the Aladhan API.
+MIDNIGHT_STANDARD = "Standard"  # Sunset to Sunrise
+MIDNIGHT_JAFARI = "Jafari"  # Sunset to Fajr
+
+CALC_METHOD_PARAMS = {
+    0: {"fajr": 16, "isha": 14, "maghrib": 4, "midnight": MIDNIGHT_JAFARI},
+    1: {"fajr": 18, "isha": 18},
+    2: {"fajr": 15, "isha": 15},
+    3: {"fajr": 18, "isha": 17},
+    4: {"fajr": 18.5, "isha_minutes": 90},
+    5: {"fajr": 19.5, "isha": 17.5},
+    7: {"fajr": 17.7, "isha": 14, "maghrib": 4.5, "midnight": MIDNIGHT_JAFARI},
+    8: {"fajr": 19.5, "isha_minutes": 90},
+    9: {"fajr": 18, "isha": 17.5},
+    10: {"fajr": 18, "isha_minutes": 90},
+    11: {"fajr": 20, "isha": 18},
+    12: {"fajr": 12, "isha": 12},
+    13: {"fajr": 18, "isha": 17},
+    14: {"fajr": 16, "isha": 15},
+    15: {"fajr": 18, "isha": 18},
+    16: {"fajr": 18.2, "isha": 18.2},
+}
+
+# High latitude adjustment rules (Aladhan latitudeAdjustmentMethod ids)
+HIGH_LAT_MIDDLE_OF_NIGHT = 1
+HIGH_LAT_ONE_SEVENTH = 2
+HIGH_LAT_ANGLE_BASED = 3
+
+HIGH_LAT_RULES = {
+    "Middle of the Night": HIGH_LAT_MIDDLE_OF_NIGHT,
+    "One Seventh": HIGH_LAT_ONE_SEVENTH,
+    "Angle Based": HIGH_LAT_ANGLE_BASED,
+}
+
 # Schools
 SCHOOL_STANDARD = 0  # Shafi, Maliki, Hanbali
 SCHOOL_HANAFI = 1
@@ -105,15 +144,86 @@ ADJUSTABLE_PRAYERS = [
 ]
 
 # API endpoints
-ALADHAN_API_BASE = "https://api.aladhan.com/v1"
 QURAN_API_BASE = "https://api.alquran.cloud/v1"
 QURAN_CDN_BASE = "https://cdn.islamic.network/quran"
 OVERPASS_API = "https://overpass-api.de/api/interpreter"
 
+# Kaaba, Makkah (Qibla reference point)
+KAABA_LATITUDE = 21.4225241
+KAABA_LONGITUDE = 39.8261818
+
 # Update intervals (seconds)
-UPDATE_INTERVAL_PRAYER = 300  # 5 minutes
 UPDATE_INTERVAL_HIJRI = 3600  # 1 hour
-UPDATE_INTERVAL_QURAN = 86400  # 24 hours
+UPDATE_INTERVAL_QURAN = 3600  # 1 hour; the verse changes once a day
+UPDATE_INTERVAL_PLACES = 604800  # 1 week
+
+# Domain-wide resources shared by every entry
+DATA_HUB = f"{DOMAIN}_hub"
+
+# HTTP client
+HTTP_TIMEOUT = 10  # seconds, per request
+OVERPASS_TIMEOUT = 15  # seconds, Overpass queries are slower
+HTTP_MAX_PER_HOST = 4  # concurrent requests to one upstream host
+FETCH_DEADLINE = 20  # seconds, per independently fetched section
+HTTP_BACKOFF_INITIAL = 60  # seconds, after a throttled or failed gateway
+HTTP_BACKOFF_MAX = 3600  # seconds, also caps a server's Retry-After
+
+# Response cache (persisted under .storage)
+CACHE_STORAGE_KEY = f"{DOMAIN}.response_cache"
+CACHE_STORAGE_VERSION = 1
+CACHE_SAVE_DELAY = 30  # seconds
+CACHE_MAX_ENTRIES = 256
+CACHE_MAX_BYTES = 2 * 1024 * 1024  # whole store, rewritten on each save
+CACHE_MAX_ENTRY_BYTES = 256 * 1024  # larger responses are not persisted
+CACHE_TTL_FOREVER = float("inf")  # immutable data, e.g. Quran text
+
+# Offline Quran corpus
+QURAN_EDITION_ARABIC = "quran-uthmani"
+QURAN_EDITION_TRANSLATION = "en.asad"
+QURAN_PACK_FILE = f"{DOMAIN}.quran.bin"
+QURAN_PACK_TIMEOUT = 120  # seconds, per full-Quran edition download
+QURAN_LOOKUP_CACHE_BYTES = 4 * 1024 * 1024  # get_surah/get_ayah results
+
+# Nearby places
+PLACE_CATEGORY_MOSQUE = "mosque"
+PLACE_CATEGORY_HALAL = "halal"
+PLACE_CATEGORIES = [PLACE_CATEGORY_MOSQUE, PLACE_CATEGORY_HALAL]
+PLACES_FETCH_RADIUS_KM = 20  # fetched once a week, queried locally
+PLACES_SENSOR_RADIUS_KM = 5
+PLACES_SENSOR_LIMIT = 10
+PLACES_GRID_DEGREES = 0.05  # index cell size, about 5.5 km north-south
+PLACES_STORAGE_KEY = f"{DOMAIN}.places"  # suffixed with the entry id
+PLACES_STORAGE_VERSION = 1
+
+# Tasbih counter
+DEFAULT_TASBIH_TARGET = 33
+DEFAULT_TASBIH_DHIKR = "SubhanAllah"
+TASBIH_PUBLISH_COOLDOWN = 0.5  # seconds, at most two state writes a second
+TASBIH_STORAGE_KEY = f"{DOMAIN}.tasbih"  # suffixed with the entry id
+TASBIH_STORAGE_VERSION = 1
+TASBIH_SAVE_DELAY = 15  # seconds, at most one disk write per delay
+TASBIH_HISTORY_DAYS = 366  # days of daily totals kept per dhikr
+TASBIH_HISTORY_MAX_DHIKR = 20  # least recently counted dhikr dropped first
+
+# Audio cache and LAN proxy (files under .storage)
+AUDIO_CACHE_DIR = f"{DOMAIN}.audio"
+AUDIO_CACHE_STORAGE_KEY = f"{DOMAIN}.audio_cache"
+AUDIO_CACHE_STORAGE_VERSION = 1
+AUDIO_CACHE_SAVE_DELAY = 30  # seconds
+AUDIO_CACHE_MAX_BYTES = 512 * 1024 * 1024  # least recently played evicted
+AUDIO_CACHE_MAX_PENDING = 256  # URLs handed out but not downloaded yet
+AUDIO_DOWNLOAD_TIMEOUT = 300  # seconds, a full surah can be 100+ MB
+AUDIO_PREWARM_LEAD = 600  # seconds before a prayer to cache the Adhan
+SPEAKER_PREROLL_LEAD = 30  # seconds before a prayer to wake the speakers
+
+# Speaker fan-out
+SPEAKER_CALL_DEADLINE = 10  # seconds for one speaker to confirm a call
+SPEAKER_STATS_WINDOW = 20  # recent calls kept per speaker
+SPEAKER_SKIP_AFTER_FAILURES = 3  # consecutive failures before skipping
+SPEAKER_SKIP_COOLDOWN = 600  # seconds a failing speaker is skipped
+
+# Events
+EVENT_PRAYER_TIME = f"{DOMAIN}_prayer_time"
 
 # Platforms
 PLATFORMS = ["sensor", "media_player"]
@@ -149,6 +259,13 @@ ADHAN_SOUNDS = {
 
 DEFAULT_ADHAN = "Makkah (Mishary Alafasy)"
 
+ADHAN_AUDIO_URLS = {
+    "Makkah (Mishary Alafasy)": "https://cdn.aladhan.com/audio/adhaan/1.mp3",
+    "Madinah": "https://cdn.aladhan.com/audio/adhaan/2.mp3",
+    "Al-Aqsa": "https://cdn.aladhan.com/audio/adhaan/3.mp3",
+    "Egypt (Abdul Basit)": "https://cdn.aladhan.com/audio/adhaan/4.mp3",
+}
+
 # Audio bitrate for CDN
 AUDIO_BITRATE = 128
 
@@ -282,6 +399,21 @@ DAILY_DUAS = [
 
 # Quran Surah info
 SURAH_COUNT = 114
+AYAH_COUNT = 6236
+
+# Number of ayahs in each surah, in order
+SURAH_AYAH_COUNTS = (
+    7, 286, 200, 176, 120, 165, 206, 75, 129, 109, 123, 111,
+    43, 52, 99, 128, 111, 110, 98, 135, 112, 78, 118, 64,
+    77, 227, 93, 88, 69, 60, 34, 30, 73, 54, 45, 83,
+    182, 88, 75, 85, 54, 53, 89, 59, 37, 35, 38, 29,
+    18, 45, 60, 49, 62, 55, 78, 96, 29, 22, 24, 13,
+    14, 11, 11, 18, 12, 12, 30, 52, 52, 44, 28, 28,
+    20, 56, 40, 31, 50, 40, 46, 42, 29, 19, 36, 25,
+    22, 17, 19, 26, 30, 20, 15, 21, 11, 8, 8, 19,
+    5, 8, 8, 11, 11, 8, 3, 9, 5, 4, 7, 3,
+    6, 3, 5, 4, 5, 6,
+)
 
 # ── 99 Names of Allah (Asma ul Husna) ────────────────────────────
 
@@ -2,50 +2,91 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Coroutine
 import logging
-import math
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, tzinfo
+from pathlib import Path
+import time
 from typing import Any
 
-import aiohttp
+import numpy as np
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .api import MuslimAssistantApiClient
 from .const import (
-    ALADHAN_API_BASE,
-    AUDIO_BITRATE,
+    ADHAN_AUDIO_URLS,
     CALC_METHOD_MAP,
+    CALC_METHOD_PARAMS,
+    CALC_METHODS,
     CONF_ADHAN_SOUND,
     CONF_ASR_OFFSET,
     CONF_DHUHR_OFFSET,
     CONF_FAJR_OFFSET,
+    CONF_HIGH_LAT_RULE,
+    CONF_HIJRI_ADJUSTMENT,
     CONF_ISHA_OFFSET,
     CONF_MAGHRIB_OFFSET,
     CONF_QURAN_RECITER,
     DAILY_DUAS,
     DEFAULT_ADHAN,
+    DEFAULT_HIGH_LAT_RULE,
     DEFAULT_RECITER,
+    FETCH_DEADLINE,
+    HIGH_LAT_ANGLE_BASED,
+    HIGH_LAT_RULES,
+    HTTP_BACKOFF_MAX,
     ISLAMIC_QUOTES,
     NAMES_OF_ALLAH,
     OVERPASS_API,
+    OVERPASS_TIMEOUT,
+    PLACE_CATEGORY_HALAL,
+    PLACE_CATEGORY_MOSQUE,
+    PLACES_FETCH_RADIUS_KM,
+    PLACES_SENSOR_LIMIT,
+    PLACES_SENSOR_RADIUS_KM,
+    PLACES_STORAGE_KEY,
+    PLACES_STORAGE_VERSION,
     PRAYERS,
     PRAYER_ASR,
     PRAYER_DHUHR,
     PRAYER_FAJR,
     PRAYER_ISHA,
     PRAYER_MAGHRIB,
-    QURAN_API_BASE,
-    QURAN_CDN_BASE,
     QURAN_RECITERS,
     SCHOOLS,
-    SURAH_COUNT,
-    UPDATE_INTERVAL_PRAYER,
+    UPDATE_INTERVAL_HIJRI,
+    UPDATE_INTERVAL_PLACES,
+    UPDATE_INTERVAL_QURAN,
 )
+from .hijri import WEEKDAY_NAMES_AR, gregorian_to_hijri
+from .osm_import import import_places
+from .places import PlaceIndex, places_from_element
+from .prayer_times import TIMETABLE_COLUMNS
+from .qibla import calculate_qibla, degrees_to_cardinal
+from .hub import MuslimAssistantHub, async_get_hub
+from .quran import locate_ayah, quran_audio_url, verse_of_the_day
+from .tasbih import TasbihCounter
+from .timetable import DailyTimetable, YearTimetable
 
 _LOGGER = logging.getLogger(__name__)
 
+# Mosques, then halal food; matched to categories by place_categories
+_OVERPASS_SELECTORS = (
+    'node["amenity"="place_of_worship"]["religion"="muslim"]',
+    'way["amenity"="place_of_worship"]["religion"="muslim"]',
+    'node["cuisine"~"halal|muslim"]',
+    'node["diet:halal"="yes"]',
+    'node["halal"="yes"]',
+    'way["cuisine"~"halal|muslim"]',
+    'way["diet:halal"="yes"]',
+)
+
 # Mapping prayer names to offset config keys
 PRAYER_OFFSET_MAP = {
     PRAYER_FAJR: CONF_FAJR_OFFSET,
@@ -55,6 +96,9 @@ PRAYER_OFFSET_MAP = {
     PRAYER_ISHA: CONF_ISHA_OFFSET,
 }
 
+# Method id -> full method name, as reported in the Aladhan `meta` block
+METHOD_NAMES = {method_id: name for name, method_id in CALC_METHODS.items()}
+
 
 class MuslimAssistantCoordinator(DataUpdateCoordinator):
     """Coordinate data updates for Muslim Assistant."""
@@ -67,6 +111,7 @@ class MuslimAssistantCoordinator(DataUpdateCoordinator):
         entry: ConfigEntry,
         latitude: float,
         longitude: float,
+        time_zone: tzinfo,
         calc_method: str,
         school: str,
     ) -> None:
@@ -75,22 +120,56 @@ class MuslimAssistantCoordinator(DataUpdateCoordinator):
             hass,
             _LOGGER,
             name="Muslim Assistant",
-            update_interval=timedelta(seconds=UPDATE_INTERVAL_PRAYER),
+            # Prayer transitions are scheduled exactly by PrayerScheduler;
+            # polling only keeps time-of-day content (duas) current
+            update_interval=timedelta(seconds=UPDATE_INTERVAL_HIJRI),
             config_entry=entry,
         )
         self.latitude = latitude
         self.longitude = longitude
+        # Prayer times and their dates are local to the coordinates, which
+        # need not share Home Assistant's time zone
+        self.time_zone = time_zone
         self.calc_method = calc_method
         self.calc_method_id = CALC_METHOD_MAP.get(calc_method, 2)
         self.school_id = SCHOOLS.get(school, 0)
         self.school = school
         self._entry = entry
+        self.hub: MuslimAssistantHub = async_get_hub(hass)
+        self.api: MuslimAssistantApiClient = self.hub.api
+        self._timetables: dict[int, YearTimetable] = {}
+        self._daily: dict[date, DailyTimetable] = {}
+        self.tasbih = TasbihCounter(hass, entry.entry_id, time_zone)
+        self._offsets = np.array(
+            [self._get_prayer_offset(name) for name in TIMETABLE_COLUMNS],
+            dtype=np.float32,
+        )
+
+        # Network-backed sources, each refreshed at its own rate
+        self.quran_coordinator = QuranVerseCoordinator(hass, self)
+        self.places_coordinator = NearbyPlacesCoordinator(hass, self)
+
+    @property
+    def source_coordinators(
+        self,
+    ) -> list[MuslimAssistantSourceCoordinator]:
+        """Return the per-source coordinators owned by this entry."""
+        return [
+            self.quran_coordinator,
+            self.places_coordinator,
+        ]
 
     @property
     def options(self) -> dict[str, Any]:
         """Return the current options."""
         return self._entry.options
 
+    @property
+    def high_lat_rule(self) -> int:
+        """Return the configured high latitude adjustment rule id."""
+        rule = self.options.get(CONF_HIGH_LAT_RULE, DEFAULT_HIGH_LAT_RULE)
+        return HIGH_LAT_RULES.get(rule, HIGH_LAT_ANGLE_BASED)
+
     def _get_prayer_offset(self, prayer: str) -> int:
         """Get the user-configured offset in minutes for a prayer."""
         offset_key = PRAYER_OFFSET_MAP.get(prayer)
@@ -98,20 +177,6 @@ class MuslimAssistantCoordinator(DataUpdateCoordinator):
             return self.options.get(offset_key, 0)
         return 0
 
-    def _apply_offset(self, time_str: str, prayer: str) -> str:
-        """Apply user-configured minute offset to a prayer time string."""
-        offset = self._get_prayer_offset(prayer)
-        if offset == 0:
-            return time_str
-        try:
-            clean = time_str.split(" ")[0]
-            hour, minute = map(int, clean.split(":"))
-            dt = datetime.now().replace(hour=hour, minute=minute, second=0)
-            dt += timedelta(minutes=offset)
-            return dt.strftime("%H:%M")
-        except (ValueError, IndexError):
-            return time_str
-
     def get_quran_reciter_edition(self) -> str:
         """Get the configured Quran reciter API edition ID."""
         reciter_name = self.options.get(CONF_QURAN_RECITER, DEFAULT_RECITER)
@@ -119,250 +184,227 @@ class MuslimAssistantCoordinator(DataUpdateCoordinator):
 
     def get_quran_audio_url(self, surah: int, ayah: int | None = None) -> str:
         """Build a Quran audio URL for a surah or specific ayah."""
-        edition = self.get_quran_reciter_edition()
-        if ayah is not None:
-            return f"{QURAN_CDN_BASE}/audio/{AUDIO_BITRATE}/{edition}/{ayah}.mp3"
-        return f"{QURAN_CDN_BASE}/audio-surah/{AUDIO_BITRATE}/{edition}/{surah}.mp3"
+        return quran_audio_url(self.get_quran_reciter_edition(), surah, ayah)
 
     def get_adhan_audio_url(self) -> str:
         """Get the Adhan audio URL based on user's preference."""
         adhan_name = self.options.get(CONF_ADHAN_SOUND, DEFAULT_ADHAN)
-        adhan_map = {
-            "Makkah (Mishary Alafasy)": "https://cdn.aladhan.com/audio/adhaan/1.mp3",
-            "Madinah": "https://cdn.aladhan.com/audio/adhaan/2.mp3",
-            "Al-Aqsa": "https://cdn.aladhan.com/audio/adhaan/3.mp3",
-            "Egypt (Abdul Basit)": "https://cdn.aladhan.com/audio/adhaan/4.mp3",
-        }
-        return adhan_map.get(adhan_name, adhan_map["Makkah (Mishary Alafasy)"])
+        return ADHAN_AUDIO_URLS.get(
+            adhan_name, ADHAN_AUDIO_URLS[DEFAULT_ADHAN]
+        )
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from APIs."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                data: dict[str, Any] = {}
-
-                # Fetch prayer times
-                prayer_data = await self._fetch_prayer_times(session)
-                raw_timings = prayer_data.get("timings", {})
-                data["date"] = prayer_data.get("date", {})
-                data["meta"] = prayer_data.get("meta", {})
-
-                # Apply user offsets to prayer times
-                adjusted_timings = {}
-                for prayer in PRAYERS:
-                    raw = raw_timings.get(prayer, "")
-                    clean = raw.split(" ")[0] if raw else ""
-                    adjusted_timings[prayer] = self._apply_offset(clean, prayer)
-                data["prayer_times"] = adjusted_timings
-                data["prayer_times_raw"] = {
-                    p: raw_timings.get(p, "").split(" ")[0]
-                    for p in PRAYERS
-                }
-
-                # Calculate next prayer
-                data["next_prayer"] = self._calculate_next_prayer(
-                    adjusted_timings
-                )
+        """Calculate prayer times and daily content.
 
-                # Fetch Qibla direction
-                qibla_data = await self._fetch_qibla(session)
-                data["qibla"] = qibla_data
-
-                # Get Hijri date from prayer times response
-                hijri = data["date"].get("hijri", {})
-                data["hijri_date"] = {
-                    "day": hijri.get("day", ""),
-                    "month": hijri.get("month", {}).get("en", ""),
-                    "month_ar": hijri.get("month", {}).get("ar", ""),
-                    "month_number": hijri.get("month", {}).get("number", 0),
-                    "year": hijri.get("year", ""),
-                    "designation": hijri.get("designation", {}).get(
-                        "abbreviated", "AH"
-                    ),
-                    "weekday": hijri.get("weekday", {}).get("en", ""),
-                    "weekday_ar": hijri.get("weekday", {}).get("ar", ""),
-                    "full_date": (
-                        f"{hijri.get('day', '')} "
-                        f"{hijri.get('month', {}).get('en', '')} "
-                        f"{hijri.get('year', '')}"
-                    ),
-                }
-
-                # Check Ramadan status
-                data["ramadan"] = self._check_ramadan(data["hijri_date"])
-
-                # Get daily dua (context-aware)
-                data["daily_dua"] = self._get_daily_dua()
+        Everything here is computed locally; network-backed sources are
+        refreshed by their own coordinators at their own intervals.
+        """
+        try:
+            data: dict[str, Any] = {}
+
+            # Prayer times from the precomputed year timetable
+            now = dt_util.now(self.time_zone)
+            prayer_data = self._calculate_prayer_times(now.date())
+            raw_timings = prayer_data.get("timings", {})
+            data["date"] = prayer_data.get("date", {})
+            data["meta"] = prayer_data.get("meta", {})
+
+            # Offset-adjusted instants; sensors format them on demand
+            data["timetable"] = self.get_daily_timetable(now.date())
+            data["prayer_times_raw"] = {
+                p: raw_timings.get(p, "") for p in PRAYERS
+            }
 
-                # Fetch random Quran verse
-                quran_data = await self._fetch_random_ayah(session)
-                data["quran_verse"] = quran_data
+            # Calculate next prayer
+            data["next_prayer"] = self._calculate_next_prayer(now)
+
+            # Qibla direction (memoized per location)
+            data["qibla"] = self._get_qibla()
+
+            # Get Hijri date from the local date block
+            hijri = data["date"].get("hijri", {})
+            data["hijri_date"] = {
+                "day": hijri.get("day", ""),
+                "month": hijri.get("month", {}).get("en", ""),
+                "month_ar": hijri.get("month", {}).get("ar", ""),
+                "month_number": hijri.get("month", {}).get("number", 0),
+                "month_length": hijri.get("month", {}).get("days", 30),
+                "year": hijri.get("year", ""),
+                "designation": hijri.get("designation", {}).get(
+                    "abbreviated", "AH"
+                ),
+                "weekday": hijri.get("weekday", {}).get("en", ""),
+                "weekday_ar": hijri.get("weekday", {}).get("ar", ""),
+                "full_date": (
+                    f"{hijri.get('day', '')} "
+                    f"{hijri.get('month', {}).get('en', '')} "
+                    f"{hijri.get('year', '')}"
+                ),
+            }
 
-                # 99 Names of Allah (daily rotation)
-                data["allah_name"] = self._get_daily_allah_name()
+            # Check Ramadan status
+            data["ramadan"] = self._check_ramadan(data["hijri_date"])
 
-                # Islamic inspirational quote
-                data["islamic_quote"] = self._get_daily_quote()
+            # Get daily dua (context-aware)
+            data["daily_dua"] = self._get_daily_dua()
 
-                # Nearby mosques
-                mosques = await self._fetch_nearby_mosques(session)
-                data["nearby_mosques"] = mosques
+            # 99 Names of Allah (daily rotation)
+            data["allah_name"] = self._get_daily_allah_name()
 
-                # Nearby halal restaurants
-                halal = await self._fetch_nearby_halal(session)
-                data["nearby_halal"] = halal
+            # Islamic inspirational quote
+            data["islamic_quote"] = self._get_daily_quote()
 
-                return data
+            return data
 
-        except aiohttp.ClientError as err:
-            raise UpdateFailed(
-                f"Error communicating with API: {err}"
-            ) from err
         except Exception as err:
             raise UpdateFailed(f"Error updating data: {err}") from err
 
-    async def _fetch_prayer_times(
-        self, session: aiohttp.ClientSession
-    ) -> dict[str, Any]:
-        """Fetch prayer times from Aladhan API."""
-        now = datetime.now()
-        url = (
-            f"{ALADHAN_API_BASE}/timings/{int(now.timestamp())}"
-            f"?latitude={self.latitude}"
-            f"&longitude={self.longitude}"
-            f"&method={self.calc_method_id}"
-            f"&school={self.school_id}"
-        )
-        async with session.get(url) as resp:
-            resp.raise_for_status()
-            result = await resp.json()
-            return result.get("data", {})
-
-    async def _fetch_qibla(
-        self, session: aiohttp.ClientSession
-    ) -> dict[str, Any]:
-        """Fetch Qibla direction from Aladhan API."""
-        url = f"{ALADHAN_API_BASE}/qibla/{self.latitude}/{self.longitude}"
-        async with session.get(url) as resp:
-            resp.raise_for_status()
-            result = await resp.json()
-            qibla_data = result.get("data", {})
-            return {
-                "direction": qibla_data.get("direction", 0),
-                "latitude": qibla_data.get("latitude", self.latitude),
-                "longitude": qibla_data.get("longitude", self.longitude),
+    def _get_timetable(self, year: int) -> YearTimetable:
+        """Return the year timetable, computing it once per year."""
+        table = self._timetables.get(year)
+        if table is None:
+            table = YearTimetable.calculate(
+                year,
+                self.latitude,
+                self.longitude,
+                self.time_zone,
+                self.calc_method_id,
+                self.school_id,
+                self.high_lat_rule,
+            )
+            # Drop past years; only this year and the next (needed on
+            # 31 December for tomorrow's Fajr) are ever kept
+            current_year = dt_util.now(self.time_zone).year
+            self._timetables = {
+                y: t
+                for y, t in self._timetables.items()
+                if y >= current_year
+            }
+            self._timetables[year] = table
+        return table
+
+    def get_daily_timetable(self, day: date) -> DailyTimetable:
+        """Return a day's offset-adjusted instants, building them once."""
+        daily = self._daily.get(day)
+        if daily is None:
+            minutes = self._get_timetable(day.year).row(day) + self._offsets
+            daily = DailyTimetable.from_minutes(day, minutes, self.time_zone)
+            # Keep yesterday for Isha times that fall after midnight
+            oldest = dt_util.now(self.time_zone).date() - timedelta(days=1)
+            self._daily = {
+                d: t for d, t in self._daily.items() if d >= oldest
             }
+            self._daily[day] = daily
+        return daily
 
-    async def _fetch_random_ayah(
-        self, session: aiohttp.ClientSession
-    ) -> dict[str, Any]:
-        """Fetch a random Quran ayah."""
-        import random
+    def _calculate_prayer_times(self, today: date) -> dict[str, Any]:
+        """Return today's prayer times from the year timetable.
 
-        surah = random.randint(1, SURAH_COUNT)
-        url = f"{QURAN_API_BASE}/surah/{surah}"
-        try:
-            async with session.get(url) as resp:
-                resp.raise_for_status()
-                result = await resp.json()
-                surah_data = result.get("data", {})
-                ayahs = surah_data.get("ayahs", [])
-                if ayahs:
-                    ayah = random.choice(ayahs)
-                    ayah_num = ayah.get("numberInSurah", 1)
-                    global_num = ayah.get("number", 1)
-                    trans_url = (
-                        f"{QURAN_API_BASE}/ayah/{surah}:{ayah_num}/en.asad"
-                    )
-                    async with session.get(trans_url) as trans_resp:
-                        trans_resp.raise_for_status()
-                        trans_result = await trans_resp.json()
-                        trans_data = trans_result.get("data", {})
-                        edition = self.get_quran_reciter_edition()
-                        audio_url = (
-                            f"{QURAN_CDN_BASE}/audio/"
-                            f"{AUDIO_BITRATE}/{edition}/{global_num}.mp3"
-                        )
-                        return {
-                            "surah_name": surah_data.get("englishName", ""),
-                            "surah_name_arabic": surah_data.get("name", ""),
-                            "surah_number": surah,
-                            "ayah_number": ayah_num,
-                            "ayah_global_number": global_num,
-                            "text_arabic": ayah.get("text", ""),
-                            "text_translation": trans_data.get("text", ""),
-                            "edition": trans_data.get("edition", {}).get(
-                                "englishName", ""
-                            ),
-                            "audio_url": audio_url,
-                        }
-                return {}
-        except Exception:
-            _LOGGER.debug(
-                "Failed to fetch Quran verse, will retry next update"
-            )
-            return {}
+        Returns the same `timings`/`date`/`meta` shape as the Aladhan
+        timings endpoint.
+        """
+        return {
+            "timings": self._get_timetable(today.year).timings(today),
+            "date": self._build_date_info(today),
+            "meta": {
+                "latitude": self.latitude,
+                "longitude": self.longitude,
+                "timezone": str(self.time_zone),
+                "method": {
+                    "id": self.calc_method_id,
+                    "name": METHOD_NAMES.get(self.calc_method_id, ""),
+                    "params": CALC_METHOD_PARAMS.get(
+                        self.calc_method_id, {}
+                    ),
+                },
+                "latitudeAdjustmentMethod": self.options.get(
+                    CONF_HIGH_LAT_RULE, DEFAULT_HIGH_LAT_RULE
+                ),
+                "school": self.school,
+            },
+        }
 
-    def _calculate_next_prayer(
-        self, timings: dict[str, str]
-    ) -> dict[str, Any]:
-        """Calculate the next upcoming prayer."""
-        now = datetime.now()
+    def _build_date_info(self, today: date) -> dict[str, Any]:
+        """Build an Aladhan-style `date` block for a Gregorian date."""
+        gregorian = {
+            "date": today.strftime("%d-%m-%Y"),
+            "format": "DD-MM-YYYY",
+            "day": today.strftime("%d"),
+            "weekday": {"en": today.strftime("%A")},
+            "month": {"number": today.month, "en": today.strftime("%B")},
+            "year": str(today.year),
+        }
+        hijri = gregorian_to_hijri(
+            today, self.options.get(CONF_HIJRI_ADJUSTMENT, 0)
+        )
+        return {
+            "readable": today.strftime("%d %b %Y"),
+            "gregorian": gregorian,
+            "hijri": {
+                "date": f"{hijri.day:02d}-{hijri.month:02d}-{hijri.year}",
+                "day": f"{hijri.day:02d}",
+                "weekday": {
+                    "en": today.strftime("%A"),
+                    "ar": WEEKDAY_NAMES_AR[today.weekday()],
+                },
+                "month": {
+                    "number": hijri.month,
+                    "en": hijri.month_name,
+                    "ar": hijri.month_name_ar,
+                    "days": hijri.month_length,
+                },
+                "year": str(hijri.year),
+                "designation": {
+                    "abbreviated": "AH",
+                    "expanded": "Anno Hegirae",
+                },
+            },
+        }
 
-        for prayer in PRAYERS:
-            time_str = timings.get(prayer, "")
-            if not time_str:
-                continue
-            clean = time_str.split(" ")[0]
-            try:
-                prayer_time = datetime.strptime(clean, "%H:%M").replace(
-                    year=now.year, month=now.month, day=now.day
-                )
-                if prayer_time > now:
-                    time_remaining = prayer_time - now
-                    hours, remainder = divmod(
-                        int(time_remaining.total_seconds()), 3600
-                    )
-                    minutes, _ = divmod(remainder, 60)
-                    return {
-                        "name": prayer,
-                        "time": clean,
-                        "time_remaining": f"{hours}h {minutes}m",
-                        "timestamp": prayer_time.isoformat(),
-                    }
-            except ValueError:
-                continue
-
-        # If all prayers have passed, next prayer is Fajr tomorrow
-        fajr_str = timings.get("Fajr", "05:00").split(" ")[0]
-        try:
-            fajr_time = datetime.strptime(fajr_str, "%H:%M").replace(
-                year=now.year, month=now.month, day=now.day
-            ) + timedelta(days=1)
-            time_remaining = fajr_time - now
-            hours, remainder = divmod(
-                int(time_remaining.total_seconds()), 3600
-            )
-            minutes, _ = divmod(remainder, 60)
-            return {
-                "name": "Fajr",
-                "time": fajr_str,
-                "time_remaining": f"{hours}h {minutes}m",
-                "timestamp": fajr_time.isoformat(),
-            }
-        except ValueError:
-            return {"name": "Fajr", "time": "05:00", "time_remaining": "N/A"}
+    def next_prayer_time(self, now: datetime) -> tuple[str, datetime | None]:
+        """Return the next prayer strictly after `now` and its local time.
+
+        The time is None when no prayer occurs before tomorrow ends (high
+        latitudes).
+        """
+        timestamp = now.timestamp()
+        today = now.astimezone(self.time_zone).date()
+        # Yesterday's Isha may still be ahead if it falls after midnight
+        for offset in (-1, 0, 1):
+            daily = self.get_daily_timetable(today + timedelta(days=offset))
+            if upcoming := daily.next_after(timestamp):
+                return upcoming
+        return PRAYERS[0], None
+
+    def _calculate_next_prayer(self, now: datetime) -> dict[str, Any]:
+        """Return the next prayer; sensors format it when read."""
+        prayer, prayer_time = self.next_prayer_time(now)
+        return {"name": prayer, "time": prayer_time}
+
+    def _get_qibla(self) -> dict[str, Any]:
+        """Return the Qibla direction for the configured location."""
+        direction, distance = calculate_qibla(self.latitude, self.longitude)
+        return {
+            "direction": direction,
+            "cardinal": degrees_to_cardinal(direction),
+            "distance_km": round(distance, 1),
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+        }
 
     def _check_ramadan(self, hijri_date: dict[str, Any]) -> dict[str, Any]:
         """Check if it's currently Ramadan and return fasting info."""
         month_number = hijri_date.get("month_number", 0)
         day = hijri_date.get("day", "")
         is_ramadan = month_number == 9
+        month_length = hijri_date.get("month_length", 30)
 
         return {
             "is_ramadan": is_ramadan,
             "ramadan_day": int(day) if is_ramadan and day else 0,
-            "days_remaining": (30 - int(day)) if is_ramadan and day else 0,
+            "days_remaining": (
+                (month_length - int(day)) if is_ramadan and day else 0
+            ),
             "month_name": hijri_date.get("month", ""),
         }
 
@@ -417,207 +459,264 @@ class MuslimAssistantCoordinator(DataUpdateCoordinator):
             "arabic": quote["arabic"],
         }
 
-    async def _fetch_nearby_mosques(
-        self, session: aiohttp.ClientSession
-    ) -> list[dict[str, Any]]:
-        """Fetch nearby mosques using Overpass API."""
-        try:
-            query = f"""
-            [out:json][timeout:10];
-            (
-              node["amenity"="place_of_worship"]["religion"="muslim"](around:5000,{self.latitude},{self.longitude});
-              way["amenity"="place_of_worship"]["religion"="muslim"](around:5000,{self.latitude},{self.longitude});
-            );
-            out center 10;
-            """
-            async with session.post(
-                OVERPASS_API,
-                data={"data": query},
-                timeout=aiohttp.ClientTimeout(total=15),
-            ) as resp:
-                if resp.status == 200:
-                    result = await resp.json()
-                    mosques = []
-                    for element in result.get("elements", [])[:10]:
-                        tags = element.get("tags", {})
-                        lat = element.get("lat") or element.get(
-                            "center", {}
-                        ).get("lat", 0)
-                        lon = element.get("lon") or element.get(
-                            "center", {}
-                        ).get("lon", 0)
-                        if lat and lon:
-                            distance = self._haversine_distance(
-                                self.latitude, self.longitude, lat, lon
-                            )
-                            mosques.append(
-                                {
-                                    "name": tags.get(
-                                        "name", "Unknown Mosque"
-                                    ),
-                                    "latitude": lat,
-                                    "longitude": lon,
-                                    "distance_km": round(distance, 2),
-                                    "address": tags.get("addr:street", ""),
-                                    "city": tags.get("addr:city", ""),
-                                }
-                            )
-                    mosques.sort(key=lambda x: x["distance_km"])
-                    return mosques
-                return []
-        except Exception:
-            _LOGGER.debug("Failed to fetch nearby mosques")
-            return []
-
-    async def _fetch_nearby_halal(
-        self, session: aiohttp.ClientSession
-    ) -> list[dict[str, Any]]:
-        """Fetch nearby halal restaurants using Overpass API."""
-        try:
-            query = f"""
-            [out:json][timeout:10];
-            (
-              node["cuisine"~"halal|muslim"](around:5000,{self.latitude},{self.longitude});
-              node["diet:halal"="yes"](around:5000,{self.latitude},{self.longitude});
-              node["halal"="yes"](around:5000,{self.latitude},{self.longitude});
-              way["cuisine"~"halal|muslim"](around:5000,{self.latitude},{self.longitude});
-              way["diet:halal"="yes"](around:5000,{self.latitude},{self.longitude});
-            );
-            out center 10;
-            """
-            async with session.post(
-                OVERPASS_API,
-                data={"data": query},
-                timeout=aiohttp.ClientTimeout(total=15),
-            ) as resp:
-                if resp.status == 200:
-                    result = await resp.json()
-                    restaurants = []
-                    for element in result.get("elements", [])[:10]:
-                        tags = element.get("tags", {})
-                        lat = element.get("lat") or element.get(
-                            "center", {}
-                        ).get("lat", 0)
-                        lon = element.get("lon") or element.get(
-                            "center", {}
-                        ).get("lon", 0)
-                        if lat and lon:
-                            distance = self._haversine_distance(
-                                self.latitude, self.longitude, lat, lon
-                            )
-                            restaurants.append(
-                                {
-                                    "name": tags.get(
-                                        "name", "Unknown Restaurant"
-                                    ),
-                                    "latitude": lat,
-                                    "longitude": lon,
-                                    "distance_km": round(distance, 2),
-                                    "cuisine": tags.get("cuisine", "halal"),
-                                    "address": tags.get("addr:street", ""),
-                                    "city": tags.get("addr:city", ""),
-                                    "phone": tags.get("phone", ""),
-                                    "website": tags.get("website", ""),
-                                }
-                            )
-                    restaurants.sort(key=lambda x: x["distance_km"])
-                    return restaurants
-                return []
-        except Exception:
-            _LOGGER.debug("Failed to fetch nearby halal restaurants")
-            return []
-
-    @staticmethod
-    def _haversine_distance(
-        lat1: float, lon1: float, lat2: float, lon2: float
-    ) -> float:
-        """Calculate the great-circle distance between two points on Earth."""
-        r = 6371  # Earth's radius in km
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(math.radians(lat1))
-            * math.cos(math.radians(lat2))
-            * math.sin(dlon / 2) ** 2
+
+class MuslimAssistantSourceCoordinator(DataUpdateCoordinator):
+    """Coordinate a single upstream data source at its own interval."""
+
+    config_entry: ConfigEntry
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        parent: MuslimAssistantCoordinator,
+        name: str,
+        update_interval: timedelta | None,
+    ) -> None:
+        """Initialize the source coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"Muslim Assistant {name}",
+            update_interval=update_interval,
+            config_entry=parent.config_entry,
         )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        return r * c
-
-    async def async_get_surah(self, surah_number: int) -> dict[str, Any]:
-        """Fetch a specific surah from the Quran API."""
-        async with aiohttp.ClientSession() as session:
-            url = (
-                f"{QURAN_API_BASE}/surah/{surah_number}"
-                f"/editions/quran-uthmani,en.asad"
-            )
-            async with session.get(url) as resp:
-                resp.raise_for_status()
-                result = await resp.json()
-                data_list = result.get("data", [])
-                if len(data_list) >= 2:
-                    arabic = data_list[0]
-                    english = data_list[1]
-                    edition = self.get_quran_reciter_edition()
-                    return {
-                        "surah_number": surah_number,
-                        "name": arabic.get("englishName", ""),
-                        "name_arabic": arabic.get("name", ""),
-                        "revelation_type": arabic.get("revelationType", ""),
-                        "number_of_ayahs": arabic.get("numberOfAyahs", 0),
-                        "audio_url": (
-                            f"{QURAN_CDN_BASE}/audio-surah/"
-                            f"{AUDIO_BITRATE}/{edition}/{surah_number}.mp3"
-                        ),
-                        "ayahs": [
-                            {
-                                "number": a.get("numberInSurah", 0),
-                                "arabic": a.get("text", ""),
-                                "translation": (
-                                    english.get("ayahs", [])[i].get(
-                                        "text", ""
-                                    )
-                                    if i < len(english.get("ayahs", []))
-                                    else ""
-                                ),
-                            }
-                            for i, a in enumerate(arabic.get("ayahs", []))
-                        ],
-                    }
-                return {}
-
-    async def async_get_ayah(
-        self, surah: int, ayah: int
+        self.parent = parent
+
+    @property
+    def api(self) -> MuslimAssistantApiClient:
+        """Return the shared API client."""
+        return self.parent.api
+
+    async def _async_fetch_sections(
+        self,
+        sections: dict[str, Coroutine[Any, Any, Any]],
+        defaults: dict[str, Any],
     ) -> dict[str, Any]:
-        """Fetch a specific ayah."""
-        async with aiohttp.ClientSession() as session:
-            url = (
-                f"{QURAN_API_BASE}/ayah/{surah}:{ayah}"
-                f"/editions/quran-uthmani,en.asad"
-            )
-            async with session.get(url) as resp:
-                resp.raise_for_status()
-                result = await resp.json()
-                data_list = result.get("data", [])
-                if len(data_list) >= 2:
-                    arabic_data = data_list[0]
-                    english_data = data_list[1]
-                    global_num = arabic_data.get("number", 1)
-                    edition = self.get_quran_reciter_edition()
-                    return {
-                        "surah": arabic_data.get("surah", {}).get(
-                            "englishName", ""
-                        ),
-                        "surah_arabic": arabic_data.get("surah", {}).get(
-                            "name", ""
-                        ),
-                        "surah_number": surah,
-                        "ayah_number": ayah,
-                        "arabic": arabic_data.get("text", ""),
-                        "translation": english_data.get("text", ""),
-                        "audio_url": (
-                            f"{QURAN_CDN_BASE}/audio/"
-                            f"{AUDIO_BITRATE}/{edition}/{global_num}.mp3"
-                        ),
-                    }
-                return {}
+        """Fetch independent sections concurrently, each within a deadline.
+
+        A section that fails or runs out of time keeps its last good value
+        (or its default before the first success) instead of failing the
+        whole refresh.
+        """
+
+        async def _fetch(coro: Coroutine[Any, Any, Any]) -> Any:
+            async with asyncio.timeout(FETCH_DEADLINE):
+                return await coro
+
+        results = await asyncio.gather(
+            *(_fetch(coro) for coro in sections.values()),
+            return_exceptions=True,
+        )
+        previous = self.data or {}
+        data: dict[str, Any] = {}
+        for key, result in zip(sections, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                _LOGGER.debug(
+                    "Failed to fetch %s, keeping last value: %r", key, result
+                )
+                result = previous.get(key, defaults[key])
+            data[key] = result
+        return data
+
+    @property
+    def latitude(self) -> float:
+        """Return the latitude of the parent entry."""
+        return self.parent.latitude
+
+    @property
+    def longitude(self) -> float:
+        """Return the longitude of the parent entry."""
+        return self.parent.longitude
+
+
+class QuranVerseCoordinator(MuslimAssistantSourceCoordinator):
+    """Provide the Quran verse of the day.
+
+    The verse is fixed per day, so hourly refreshes are answered from the
+    offline corpus or the response cache and only pick up the date change.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, parent: MuslimAssistantCoordinator
+    ) -> None:
+        """Initialize the Quran verse coordinator."""
+        super().__init__(
+            hass,
+            parent,
+            "Quran Verse",
+            timedelta(seconds=UPDATE_INTERVAL_QURAN),
+        )
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Get the Quran verse of the day."""
+        return await self._async_fetch_sections(
+            {"quran_verse": self._fetch_daily_ayah()},
+            {"quran_verse": {}},
+        )
+
+    async def _fetch_daily_ayah(self) -> dict[str, Any]:
+        """Get today's ayah, locally or with a single request."""
+        number = verse_of_the_day(
+            dt_util.now(self.parent.time_zone).date(),
+            self.config_entry.entry_id,
+        )
+        surah, ayah = locate_ayah(number)
+
+        verse = await self.parent.hub.async_get_verse(number)
+        if not verse:
+            # Raise so the last good verse is kept
+            raise UpdateFailed(f"No text returned for ayah {number}")
+        return {
+            **verse,
+            "surah_number": surah,
+            "ayah_number": ayah,
+            "ayah_global_number": number,
+            "audio_url": self.parent.get_quran_audio_url(surah, number),
+        }
+
+
+class NearbyPlacesCoordinator(MuslimAssistantSourceCoordinator):
+    """Refresh nearby mosques and halal restaurants once a week.
+
+    Places within PLACES_FETCH_RADIUS_KM are kept in a persisted
+    PlaceIndex, and the finder sensors and `find_nearby` are answered
+    from it. The index is reloaded at startup and only refetched once
+    it is older than the update interval. An index imported from a local
+    OSM extract replaces Overpass until the import is cleared.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, parent: MuslimAssistantCoordinator
+    ) -> None:
+        """Initialize the nearby places coordinator."""
+        super().__init__(
+            hass,
+            parent,
+            "Nearby Places",
+            timedelta(seconds=UPDATE_INTERVAL_PLACES),
+        )
+        self.index = PlaceIndex([])
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            PLACES_STORAGE_VERSION,
+            f"{PLACES_STORAGE_KEY}.{parent.config_entry.entry_id}",
+        )
+        self._loaded = False
+        self.imported_from: str | None = None
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Refresh the place index if stale and query it for the sensors."""
+        if not self._loaded:
+            self._loaded = True
+            stored = await self._store.async_load()
+            if stored:
+                self.index = PlaceIndex(stored["places"])
+                self.imported_from = stored.get("imported_from")
+                age = time.time() - stored["fetched"]
+                if age < UPDATE_INTERVAL_PLACES:
+                    return self._sensor_data()
+        if self.imported_from:
+            return self._sensor_data()
+
+        # While Overpass fails or asks us to back off, the index serves
+        found = await self._async_fetch_sections(
+            {"places": self._fetch_nearby_places()}, {"places": None}
+        )
+        if (places := found["places"]) is None:
+            # Retry well before next week, after any backoff has passed
+            self.update_interval = timedelta(seconds=HTTP_BACKOFF_MAX)
+        else:
+            self.update_interval = timedelta(seconds=UPDATE_INTERVAL_PLACES)
+            await self._async_replace_index(places)
+        return self._sensor_data()
+
+    async def async_import_places(self, path: Path) -> int:
+        """Replace the index with the places in a local OSM extract."""
+        places = await self.hass.async_add_executor_job(
+            import_places,
+            path,
+            self.latitude,
+            self.longitude,
+            PLACES_FETCH_RADIUS_KM,
+        )
+        self.imported_from = str(path)
+        await self._async_replace_index(places)
+        self.async_set_updated_data(self._sensor_data())
+        return len(places)
+
+    async def async_clear_import(self) -> None:
+        """Drop an imported index and fetch from Overpass again.
+
+        The imported places are saved as stale rather than imported, so
+        they keep serving until a fetch succeeds, even across a restart.
+        """
+        self.imported_from = None
+        await self._store.async_save(
+            {"fetched": 0, "imported_from": None, "places": self.index.places}
+        )
+        await self.async_refresh()
+
+    async def _async_replace_index(
+        self, places: list[dict[str, Any]]
+    ) -> None:
+        """Index and persist a new set of places."""
+        self.index = PlaceIndex(places)
+        await self._store.async_save(
+            {
+                "fetched": time.time(),
+                "imported_from": self.imported_from,
+                "places": places,
+            }
+        )
+
+    def _sensor_data(self) -> dict[str, Any]:
+        """Return the places shown by the finder sensors."""
+        return {
+            "nearby_mosques": self.find_nearby(
+                PLACE_CATEGORY_MOSQUE,
+                PLACES_SENSOR_RADIUS_KM,
+                PLACES_SENSOR_LIMIT,
+            ),
+            "nearby_halal": self.find_nearby(
+                PLACE_CATEGORY_HALAL,
+                PLACES_SENSOR_RADIUS_KM,
+                PLACES_SENSOR_LIMIT,
+            ),
+        }
+
+    def find_nearby(
+        self, category: str | None, radius_km: float, limit: int
+    ) -> list[dict[str, Any]]:
+        """Return the nearest places to home within a radius."""
+        return self.index.query(
+            self.latitude,
+            self.longitude,
+            radius_km=radius_km,
+            category=category,
+            limit=limit,
+        )
+
+    async def _fetch_nearby_places(self) -> list[dict[str, Any]]:
+        """Fetch mosques and halal places in one Overpass query."""
+        around = (
+            f"(around:{PLACES_FETCH_RADIUS_KM * 1000},"
+            f"{self.latitude},{self.longitude})"
+        )
+        statements = "".join(
+            f"{selector}{around};" for selector in _OVERPASS_SELECTORS
+        )
+        query = (
+            f"[out:json][timeout:{OVERPASS_TIMEOUT}];"
+            f"({statements});out center;"
+        )
+        result = await self.api.async_post_json(
+            OVERPASS_API, {"data": query}, timeout=OVERPASS_TIMEOUT
+        )
+        # Split into categories locally; see places.place_categories
+        return [
+            place
+            for element in result.get("elements", [])
+            for place in places_from_element(element)
+        ]
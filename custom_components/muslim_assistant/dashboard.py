@@ -23,7 +23,9 @@ DASHBOARD_CONFIG = {
                             "content": (
                                 "# {{ states('sensor.muslim_assistant_next_prayer') }}\n"
                                 "## {{ state_attr('sensor.muslim_assistant_next_prayer', 'time') }}\n"
-                                "{{ state_attr('sensor.muslim_assistant_next_prayer', 'time_remaining') }} remaining\n"
+                                "{% set t = states('sensor.muslim_assistant_next_prayer_time') | as_datetime %}"
+                                "{% if t %}{% set s = (t - now()).total_seconds() | int %}"
+                                "{{ s // 3600 }}h {{ s % 3600 // 60 }}m remaining{% endif %}\n"
                             ),
                         },
                         {
@@ -0,0 +1,21 @@
+"""Diagnostics support for Muslim Assistant."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import MuslimAssistantCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return counters useful for tuning the shared caches."""
+    coordinator: MuslimAssistantCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "quran_lookup_cache": coordinator.hub.lookups.stats(),
+    }
@@ -0,0 +1,218 @@
+"""Offline Hijri (Islamic) calendar for Muslim Assistant.
+
+Dates between 1343 and 1500 AH (1924-2077) follow the Umm al-Qura
+calendar of Saudi Arabia from an embedded month-length table; dates
+outside it fall back to the arithmetical (tabular) Islamic calendar.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import date
+from itertools import accumulate
+from typing import NamedTuple
+
+import numpy as np
+
+MONTH_NAMES_EN = (
+    "Muharram",
+    "Safar",
+    "Rabi’ al-Awwal",
+    "Rabi’ al-Thani",
+    "Jumada al-Ula",
+    "Jumada al-Akhirah",
+    "Rajab",
+    "Sha’ban",
+    "Ramadhan",
+    "Shawwal",
+    "Dhu al-Qi’dah",
+    "Dhu al-Hijjah",
+)
+
+MONTH_NAMES_AR = (
+    "محرم",
+    "صفر",
+    "ربيع الأول",
+    "ربيع الثاني",
+    "جمادى الأولى",
+    "جمادى الآخرة",
+    "رجب",
+    "شعبان",
+    "رمضان",
+    "شوال",
+    "ذو القعدة",
+    "ذو الحجة",
+)
+
+# Indexed by date.weekday() (Monday = 0)
+WEEKDAY_NAMES_AR = (
+    "الإثنين",
+    "الثلاثاء",
+    "الأربعاء",
+    "الخميس",
+    "الجمعة",
+    "السبت",
+    "الأحد",
+)
+
+# ── Umm al-Qura table ─────────────────────────────────────────────
+# Three hex digits per Hijri year from UMM_AL_QURA_FIRST_YEAR; bit
+# (month - 1) is set when that month has 30 days, clear for 29.
+UMM_AL_QURA_FIRST_YEAR = 1343
+UMM_AL_QURA_FIRST_DAY = date(1924, 8, 1)  # 1 Muharram 1343
+
+_UMM_AL_QURA_MONTHS = (
+    "eed554b4566c36c0d59d5b4ab155559ad56ab554d4d5564b497d55555555"
+    "d55755d55555555d556d5555ea5d2aaaacd5655572da9555aaa55552da6d"
+    "55a55574dd53d54556d552d5d55d54d4565552da5d55aad56aad4b52aa57"
+    "4ae97656cb55aaaa554ad95d2da5d9db2ba4b4aa552b5575b6abd2bc4b89"
+    "a9552d5adb6a6d4dc9d92aa69562ae56d36ab55aaa94d49d95d2ba5b55aa"
+    "d55a9a92e26e55dada6d46a554ba9754eaae5acba9d92b2564bcab55ab55"
+    "6d2ea5e4aa9552daad36c7596d269552da5b4ba9ba3b4b69b52aa64b696d"
+    "2ec6d9eb2d54d2aa564ae96dd6ab54b29a9352ba57536ab56aae93"
+)
+
+# Early months of the published calendar that are neither 29 nor 30 days
+_IRREGULAR_MONTHS = {
+    (1343, 9): 28,
+    (1345, 5): 31,
+    (1345, 8): 28,
+    (1348, 11): 31,
+    (1348, 12): 28,
+    (1349, 10): 28,
+    (1349, 11): 31,
+    (1364, 8): 28,
+}
+
+
+def _build_month_lengths() -> list[int]:
+    """Decode the embedded table into a flat list of month lengths."""
+    lengths = []
+    for index in range(0, len(_UMM_AL_QURA_MONTHS), 3):
+        year = UMM_AL_QURA_FIRST_YEAR + index // 3
+        bits = int(_UMM_AL_QURA_MONTHS[index : index + 3], 16)
+        for month in range(1, 13):
+            length = 30 if bits >> (month - 1) & 1 else 29
+            lengths.append(_IRREGULAR_MONTHS.get((year, month), length))
+    return lengths
+
+
+_MONTH_LENGTHS = _build_month_lengths()
+
+# Ordinal of the first day of every table month, plus the day after
+_MONTH_STARTS = list(
+    accumulate(_MONTH_LENGTHS, initial=UMM_AL_QURA_FIRST_DAY.toordinal())
+)
+_MONTH_STARTS_ARRAY = np.array(_MONTH_STARTS, dtype=np.int64)
+UMM_AL_QURA_LAST_YEAR = UMM_AL_QURA_FIRST_YEAR + len(_MONTH_LENGTHS) // 12 - 1
+
+# ── Tabular calendar ──────────────────────────────────────────────
+# Civil epoch: 16 July 622 (Julian) = 19 July 622 (proleptic Gregorian)
+_TABULAR_EPOCH = 227015
+
+
+class HijriDate(NamedTuple):
+    """A Hijri calendar date."""
+    year: int
+    month: int
+    day: int
+
+    @property
+    def month_name(self) -> str:
+        """Return the English month name."""
+        return MONTH_NAMES_EN[self.month - 1]
+
+    @property
+    def month_name_ar(self) -> str:
+        """Return the Arabic month name."""
+        return MONTH_NAMES_AR[self.month - 1]
+
+    @property
+    def month_length(self) -> int:
+        """Return the number of days in this date's month."""
+        return month_length(self.year, self.month)
+
+
+def _in_table(year: int) -> bool:
+    """Return True if a Hijri year is covered by the Umm al-Qura table."""
+    return UMM_AL_QURA_FIRST_YEAR <= year <= UMM_AL_QURA_LAST_YEAR
+
+
+def _tabular_to_ordinal(year: int, month: int, day: int) -> int:
+    """Return the Gregorian ordinal of a tabular Hijri date."""
+    return (
+        _TABULAR_EPOCH
+        - 1
+        + (year - 1) * 354
+        + (3 + 11 * year) // 30
+        + 29 * (month - 1)
+        + month // 2
+        + day
+    )
+
+
+def _tabular_from_ordinal(ordinal: int) -> HijriDate:
+    """Return the tabular Hijri date of a Gregorian ordinal."""
+    year = (30 * (ordinal - _TABULAR_EPOCH) + 10646) // 10631
+    prior_days = ordinal - _tabular_to_ordinal(year, 1, 1)
+    month = (11 * prior_days + 330) // 325
+    day = ordinal - _tabular_to_ordinal(year, month, 1) + 1
+    return HijriDate(year, month, day)
+
+
+def month_length(year: int, month: int) -> int:
+    """Return the number of days in a Hijri month."""
+    if _in_table(year):
+        return _MONTH_LENGTHS[(year - UMM_AL_QURA_FIRST_YEAR) * 12 + month - 1]
+    if month % 2 or (month == 12 and (14 + 11 * year) % 30 < 11):
+        return 30
+    return 29
+
+
+def gregorian_to_hijri(day: date, adjustment: int = 0) -> HijriDate:
+    """Convert a Gregorian date to Hijri.
+
+    `adjustment` shifts the result by whole days, for communities whose
+    moon sighting differs from the calculated calendar.
+    """
+    ordinal = day.toordinal() + adjustment
+    if not _MONTH_STARTS[0] <= ordinal < _MONTH_STARTS[-1]:
+        return _tabular_from_ordinal(ordinal)
+    index = bisect_right(_MONTH_STARTS, ordinal) - 1
+    return HijriDate(
+        UMM_AL_QURA_FIRST_YEAR + index // 12,
+        index % 12 + 1,
+        ordinal - _MONTH_STARTS[index] + 1,
+    )
+
+
+def hijri_to_gregorian(
+    year: int, month: int, day: int, adjustment: int = 0
+) -> date:
+    """Convert a Hijri date to Gregorian."""
+    if _in_table(year):
+        index = (year - UMM_AL_QURA_FIRST_YEAR) * 12 + month - 1
+        ordinal = _MONTH_STARTS[index] + day - 1
+    else:
+        ordinal = _tabular_to_ordinal(year, month, day)
+    return date.fromordinal(ordinal - adjustment)
+
+
+def gregorian_to_hijri_range(
+    start: date, days: int, adjustment: int = 0
+) -> np.ndarray:
+    """Convert consecutive Gregorian days to Hijri in one pass.
+
+    Returns an int array of shape (days, 3) holding year, month, day.
+    """
+    ordinals = np.arange(days, dtype=np.int64) + start.toordinal() + adjustment
+    index = np.searchsorted(_MONTH_STARTS_ARRAY, ordinals, side="right") - 1
+    result = np.empty((days, 3), dtype=np.int64)
+    result[:, 0] = UMM_AL_QURA_FIRST_YEAR + index // 12
+    result[:, 1] = index % 12 + 1
+    result[:, 2] = ordinals - _MONTH_STARTS_ARRAY[index] + 1
+
+    outside = (ordinals < _MONTH_STARTS[0]) | (ordinals >= _MONTH_STARTS[-1])
+    for row in np.flatnonzero(outside):
+        result[row] = _tabular_from_ordinal(int(ordinals[row]))
+    return result
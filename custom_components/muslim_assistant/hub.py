@@ -0,0 +1,247 @@
+"""Domain-wide resources shared by every Muslim Assistant entry."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .api import MuslimAssistantApiClient
+from .audio import AudioCache, AudioProxyView
+from .cache import LookupCache, ResponseCache
+from .const import (
+    CACHE_TTL_FOREVER,
+    DATA_HUB,
+    DOMAIN,
+    QURAN_API_BASE,
+    QURAN_EDITION_ARABIC,
+    QURAN_EDITION_TRANSLATION,
+    QURAN_LOOKUP_CACHE_BYTES,
+    SURAH_AYAH_COUNTS,
+)
+from .quran import QuranCorpus, async_open_quran_corpus, quran_audio_url
+
+_LOGGER = logging.getLogger(__name__)
+
+_EDITIONS = f"{QURAN_EDITION_ARABIC},{QURAN_EDITION_TRANSLATION}"
+
+
+class MuslimAssistantHub:
+    """Location-independent resources, created once at integration setup.
+
+    The HTTP client and its response cache, the offline Quran corpus, the
+    audio cache and the Quran lookups do not depend on where an entry is,
+    so every entry uses the ones held here. Per-location coordinators
+    only compute what differs by location and options; memory and
+    upstream load stay flat as entries are added.
+
+    Surah and ayah lookups go through a LookupCache, so identical calls
+    made at the same time share one fetch and repeated calls are
+    answered from memory.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        self.api = MuslimAssistantApiClient(
+            async_get_clientsession(hass), ResponseCache(hass)
+        )
+        self._audio: AudioCache | None = None
+        self._corpus_task: asyncio.Task[QuranCorpus | None] | None = None
+        self.lookups = LookupCache(QURAN_LOOKUP_CACHE_BYTES)
+
+    @property
+    def audio(self) -> AudioCache:
+        """Return the audio cache, serving it on first use."""
+        if self._audio is None:
+            self._audio = AudioCache(
+                self._hass, async_get_clientsession(self._hass)
+            )
+            self._hass.http.register_view(AudioProxyView(self._audio))
+        return self._audio
+
+    @property
+    def corpus(self) -> QuranCorpus | None:
+        """Return the offline Quran corpus, or None until it has loaded."""
+        task = self._corpus_task
+        if task is None or not task.done():
+            return None
+        return task.result()
+
+    @callback
+    def async_load_corpus(self) -> None:
+        """Start loading the offline Quran unless loaded or loading."""
+        task = self._corpus_task
+        # A failed load is retried by the next entry set up
+        if task is None or (task.done() and task.result() is None):
+            self._corpus_task = self._hass.async_create_background_task(
+                async_open_quran_corpus(self._hass, self.api),
+                f"{DOMAIN}_quran_corpus",
+            )
+
+    async def async_get_surah(
+        self, surah_number: int, reciter_edition: str
+    ) -> dict[str, Any]:
+        """Get a specific surah; the result is shared, do not modify it."""
+        return await self.lookups.async_get(
+            ("surah", surah_number, reciter_edition),
+            lambda: self._async_fetch_surah(surah_number, reciter_edition),
+        )
+
+    async def async_get_ayah(
+        self, surah: int, ayah: int, reciter_edition: str
+    ) -> dict[str, Any]:
+        """Get a specific ayah; the result is shared, do not modify it."""
+        if not 1 <= surah <= len(SURAH_AYAH_COUNTS):
+            raise ServiceValidationError(f"There is no surah {surah}")
+        if not 1 <= ayah <= (count := SURAH_AYAH_COUNTS[surah - 1]):
+            raise ServiceValidationError(
+                f"Surah {surah} has {count} ayahs; there is no ayah {ayah}"
+            )
+        return await self.lookups.async_get(
+            ("ayah", surah, ayah, reciter_edition),
+            lambda: self._async_fetch_ayah(surah, ayah, reciter_edition),
+        )
+
+    async def _async_fetch_surah(
+        self, surah_number: int, reciter_edition: str
+    ) -> dict[str, Any]:
+        """Build a surah, from the offline corpus when loaded."""
+        audio_url = quran_audio_url(reciter_edition, surah_number)
+        corpus = self.corpus
+        if corpus is not None:
+            info = corpus.surahs[surah_number - 1]
+            arabic = corpus.surah_texts(QURAN_EDITION_ARABIC, surah_number)
+            english = corpus.surah_texts(
+                QURAN_EDITION_TRANSLATION, surah_number
+            )
+            return {
+                "surah_number": surah_number,
+                "name": info["englishName"],
+                "name_arabic": info["name"],
+                "revelation_type": info["revelationType"],
+                "number_of_ayahs": info["ayahs"],
+                "audio_url": audio_url,
+                "ayahs": [
+                    {"number": i, "arabic": text, "translation": translation}
+                    for i, (text, translation) in enumerate(
+                        zip(arabic, english), start=1
+                    )
+                ],
+            }
+
+        result = await self.api.async_get_json(
+            f"{QURAN_API_BASE}/surah/{surah_number}/editions/{_EDITIONS}",
+            ttl=CACHE_TTL_FOREVER,
+        )
+        data_list = result.get("data", [])
+        if len(data_list) < 2:
+            return {}
+        arabic, english = data_list[0], data_list[1]
+        translations = english.get("ayahs", [])
+        return {
+            "surah_number": surah_number,
+            "name": arabic.get("englishName", ""),
+            "name_arabic": arabic.get("name", ""),
+            "revelation_type": arabic.get("revelationType", ""),
+            "number_of_ayahs": arabic.get("numberOfAyahs", 0),
+            "audio_url": audio_url,
+            "ayahs": [
+                {
+                    "number": a.get("numberInSurah", 0),
+                    "arabic": a.get("text", ""),
+                    "translation": (
+                        translations[i].get("text", "")
+                        if i < len(translations)
+                        else ""
+                    ),
+                }
+                for i, a in enumerate(arabic.get("ayahs", []))
+            ],
+        }
+
+    async def _async_fetch_ayah(
+        self, surah: int, ayah: int, reciter_edition: str
+    ) -> dict[str, Any]:
+        """Build an ayah, from the offline corpus when loaded."""
+        corpus = self.corpus
+        if corpus is not None:
+            number = corpus.global_number(surah, ayah)
+            info = corpus.surahs[surah - 1]
+            return {
+                "surah": info["englishName"],
+                "surah_arabic": info["name"],
+                "surah_number": surah,
+                "ayah_number": ayah,
+                "arabic": corpus.text(QURAN_EDITION_ARABIC, number),
+                "translation": corpus.text(
+                    QURAN_EDITION_TRANSLATION, number
+                ),
+                "audio_url": quran_audio_url(reciter_edition, surah, number),
+            }
+
+        result = await self.api.async_get_json(
+            f"{QURAN_API_BASE}/ayah/{surah}:{ayah}/editions/{_EDITIONS}",
+            ttl=CACHE_TTL_FOREVER,
+        )
+        data_list = result.get("data", [])
+        if len(data_list) < 2:
+            return {}
+        arabic_data, english_data = data_list[0], data_list[1]
+        global_num = arabic_data.get("number", 1)
+        return {
+            "surah": arabic_data.get("surah", {}).get("englishName", ""),
+            "surah_arabic": arabic_data.get("surah", {}).get("name", ""),
+            "surah_number": surah,
+            "ayah_number": ayah,
+            "arabic": arabic_data.get("text", ""),
+            "translation": english_data.get("text", ""),
+            "audio_url": quran_audio_url(reciter_edition, surah, global_num),
+        }
+
+    async def async_get_verse(self, number: int) -> dict[str, Any]:
+        """Get the text of an ayah by global number, without audio."""
+        corpus = self.corpus
+        if corpus is not None:
+            surah, _ = corpus.locate(number)
+            info = corpus.surahs[surah - 1]
+            return {
+                "surah_name": info["englishName"],
+                "surah_name_arabic": info["name"],
+                "text_arabic": corpus.text(QURAN_EDITION_ARABIC, number),
+                "text_translation": corpus.text(
+                    QURAN_EDITION_TRANSLATION, number
+                ),
+                "edition": corpus.edition_names[
+                    corpus.editions.index(QURAN_EDITION_TRANSLATION)
+                ],
+            }
+
+        result = await self.api.async_get_json(
+            f"{QURAN_API_BASE}/ayah/{number}/editions/{_EDITIONS}",
+            ttl=CACHE_TTL_FOREVER,
+        )
+        data_list = result.get("data", [])
+        if len(data_list) < 2:
+            return {}
+        arabic_data, english_data = data_list[0], data_list[1]
+        return {
+            "surah_name": arabic_data.get("surah", {}).get("englishName", ""),
+            "surah_name_arabic": arabic_data.get("surah", {}).get("name", ""),
+            "text_arabic": arabic_data.get("text", ""),
+            "text_translation": english_data.get("text", ""),
+            "edition": english_data.get("edition", {}).get("englishName", ""),
+        }
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> MuslimAssistantHub:
+    """Return the domain-wide hub, creating it if setup has not yet."""
+    hub: MuslimAssistantHub | None = hass.data.get(DATA_HUB)
+    if hub is None:
+        hub = hass.data[DATA_HUB] = MuslimAssistantHub(hass)
+    return hub
@@ -2,13 +2,17 @@
 
 Provides a virtual media player entity that proxies Adhan and Quran audio
 to any Home Assistant media player (Alexa, Google Home, Sonos, phones, etc.).
-Supports multiple target devices simultaneously.
+Supports multiple target devices simultaneously. Speakers are handed
+LAN URLs served from the local audio cache rather than CDN URLs.
 """
 
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+from datetime import datetime, timedelta
 import logging
+import time
 from typing import Any
 
 from homeassistant.components.media_player import (
@@ -19,17 +23,32 @@ from homeassistant.components.media_player import (
     MediaType,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    ATTR_SUPPORTED_FEATURES,
+    STATE_OFF,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
 
+from .audio import AudioCache
 from .const import (
+    AUDIO_PREWARM_LEAD,
+    CONF_AUTO_ADHAN,
     CONF_QURAN_RECITER,
     CONF_TARGET_PLAYER,
     DEFAULT_RECITER,
     DOMAIN,
+    PRAYER_SUNRISE,
+    SPEAKER_CALL_DEADLINE,
+    SPEAKER_PREROLL_LEAD,
     VERSION,
 )
 from .coordinator import MuslimAssistantCoordinator
+from .speakers import TargetHealth
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,7 +60,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up Muslim Assistant media player."""
     coordinator: MuslimAssistantCoordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities([MuslimAssistantMediaPlayer(coordinator, entry)])
+    async_add_entities(
+        [
+            MuslimAssistantMediaPlayer(
+                coordinator, entry, coordinator.hub.audio
+            )
+        ]
+    )
 
 
 class MuslimAssistantMediaPlayer(MediaPlayerEntity):
@@ -50,6 +75,10 @@ class MuslimAssistantMediaPlayer(MediaPlayerEntity):
     This entity acts as a controller. When you call play_media on it,
     it forwards the audio URL to ALL configured target media players
     (e.g., Alexa, Google Home, Sonos, phones via companion app).
+
+    The configured Adhan is cached locally ahead of each prayer, and when
+    it is played automatically the target speakers are woken shortly
+    before, so it starts on time in every room.
     """
 
     _attr_has_entity_name = True
@@ -67,10 +96,15 @@ class MuslimAssistantMediaPlayer(MediaPlayerEntity):
         self,
         coordinator: MuslimAssistantCoordinator,
         entry: ConfigEntry,
+        audio: AudioCache,
     ) -> None:
         """Initialize the media player."""
         self.coordinator = coordinator
         self._entry = entry
+        self._audio = audio
+        self._unsub_prewarm: list[CALLBACK_TYPE] = []
+        self._unreachable_targets: list[str] = []
+        self._health: dict[str, TargetHealth] = {}
         self._attr_unique_id = f"{entry.entry_id}_media_player"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry.entry_id)},
@@ -84,6 +118,100 @@ class MuslimAssistantMediaPlayer(MediaPlayerEntity):
         self._media_artist: str | None = None
         self._media_content_id: str | None = None
 
+    async def async_added_to_hass(self) -> None:
+        """Start preparing for each prayer ahead of time."""
+        self._async_arm_prewarm(dt_util.now())
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop the preparation timers."""
+        self._async_cancel_prewarm()
+
+    @callback
+    def _async_cancel_prewarm(self) -> None:
+        """Cancel the armed preparation timers."""
+        while self._unsub_prewarm:
+            self._unsub_prewarm.pop()()
+
+    @callback
+    def _async_arm_prewarm(self, now: datetime) -> None:
+        """Arm the stages that prepare for the next prayer.
+
+        The Adhan is cached AUDIO_PREWARM_LEAD seconds ahead. When it
+        will be played automatically, the speakers are also woken
+        SPEAKER_PREROLL_LEAD seconds ahead. At the prayer instant the
+        stages are armed again for the following prayer.
+        """
+        prayer, prayer_time = self.coordinator.next_prayer_time(now)
+        if prayer_time is None:
+            # No prayer before tomorrow ends; look again in a day
+            prayer, prayer_time = None, now + timedelta(days=1)
+        stages: list[tuple[int, Callable[[datetime], Awaitable[None]]]] = [
+            (AUDIO_PREWARM_LEAD, self._async_cache_adhan)
+        ]
+        if (
+            self._entry.options.get(CONF_AUTO_ADHAN, False)
+            and prayer is not None
+            and prayer != PRAYER_SUNRISE
+        ):
+            stages.append((SPEAKER_PREROLL_LEAD, self._async_preroll))
+
+        @callback
+        def _async_rearm(fired: datetime) -> None:
+            self._async_cancel_prewarm()
+            self._async_arm_prewarm(prayer_time)
+
+        for lead, action in stages:
+            when = max(prayer_time - timedelta(seconds=lead), now)
+            self._unsub_prewarm.append(
+                async_track_point_in_time(self.hass, action, when)
+            )
+        self._unsub_prewarm.append(
+            async_track_point_in_time(self.hass, _async_rearm, prayer_time)
+        )
+
+    async def _async_cache_adhan(self, fired: datetime) -> None:
+        """Download the configured Adhan if it is not cached."""
+        await self._audio.async_prefetch(
+            self.coordinator.get_adhan_audio_url()
+        )
+
+    async def _async_preroll(self, fired: datetime) -> None:
+        """Wake the target speakers and have the Adhan ready to stream.
+
+        Targets that are off and can be turned on are woken now, so they
+        have connected by the prayer instant; targets that are missing
+        or unavailable are reported rather than waited for.
+        """
+        await self._async_cache_adhan(fired)
+        wake = []
+        self._unreachable_targets = []
+        for target in self._get_target_entity_ids():
+            state = self.hass.states.get(target)
+            if state is None or state.state in (
+                STATE_UNAVAILABLE,
+                STATE_UNKNOWN,
+            ):
+                self._unreachable_targets.append(target)
+            elif state.state == STATE_OFF and (
+                state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
+                & MediaPlayerEntityFeature.TURN_ON
+            ):
+                wake.append(target)
+        if self._unreachable_targets:
+            _LOGGER.warning(
+                "Speakers unreachable before the Adhan: %s",
+                ", ".join(self._unreachable_targets),
+            )
+        if wake:
+            _LOGGER.debug("Waking %s for the Adhan", ", ".join(wake))
+            await self.hass.services.async_call(
+                "media_player",
+                "turn_on",
+                {"entity_id": wake},
+                blocking=False,
+            )
+        self.async_write_ha_state()
+
     @property
     def state(self) -> MediaPlayerState:
         """Return the state of the media player."""
@@ -115,6 +243,12 @@ class MuslimAssistantMediaPlayer(MediaPlayerEntity):
             "quran_reciter": reciter,
             "target_media_players": targets,
             "target_count": len(targets),
+            "unreachable_targets": self._unreachable_targets,
+            "target_stats": {
+                target: self._health[target].as_dict()
+                for target in targets
+                if target in self._health
+            },
         }
 
     def _get_target_entity_ids(self) -> list[str]:
@@ -130,7 +264,13 @@ class MuslimAssistantMediaPlayer(MediaPlayerEntity):
     async def _forward_to_targets(
         self, service: str, data: dict[str, Any] | None = None
     ) -> None:
-        """Forward a media_player service call to ALL target speakers."""
+        """Forward a media_player service call to ALL target speakers.
+
+        Calls are dispatched to every target at once and confirmed in
+        the background, each within SPEAKER_CALL_DEADLINE seconds, so a
+        slow or unreachable speaker delays neither the others nor the
+        caller. Targets that keep failing are skipped for a while.
+        """
         targets = self._get_target_entity_ids()
         if not targets:
             _LOGGER.warning(
@@ -140,30 +280,60 @@ class MuslimAssistantMediaPlayer(MediaPlayerEntity):
             )
             return
 
-        # Call service on all targets simultaneously
-        tasks = []
+        calls = []
         for target in targets:
+            health = self._health.setdefault(target, TargetHealth())
+            if health.skipped:
+                _LOGGER.debug(
+                    "Skipping %s after %d failed calls",
+                    target,
+                    health.consecutive_failures,
+                )
+                continue
             service_data = {"entity_id": target}
             if data:
                 service_data.update(data)
-            tasks.append(
-                self.hass.services.async_call(
+            calls.append(self._async_call_target(service, service_data))
+        if calls:
+            self.hass.async_create_background_task(
+                self._async_confirm(calls), f"{DOMAIN}_{service}"
+            )
+
+    async def _async_confirm(
+        self, calls: list[Coroutine[Any, Any, None]]
+    ) -> None:
+        """Wait for dispatched calls and publish the updated statistics."""
+        await asyncio.gather(*calls)
+        self.async_write_ha_state()
+
+    async def _async_call_target(
+        self, service: str, service_data: dict[str, Any]
+    ) -> None:
+        """Call a service on one target within its deadline."""
+        target = service_data["entity_id"]
+        health = self._health[target]
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout(SPEAKER_CALL_DEADLINE):
+                await self.hass.services.async_call(
                     "media_player",
                     service,
                     service_data,
                     blocking=True,
                 )
+        except TimeoutError:
+            health.record_failure("timeout")
+            _LOGGER.warning(
+                "%s on %s did not complete within %ds",
+                service,
+                target,
+                SPEAKER_CALL_DEADLINE,
             )
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                _LOGGER.error(
-                    "Error calling %s on %s: %s",
-                    service,
-                    targets[i],
-                    result,
-                )
+        except Exception as err:  # noqa: BLE001
+            health.record_failure(str(err) or type(err).__name__)
+            _LOGGER.error("Error calling %s on %s: %s", service, target, err)
+        else:
+            health.record_success(time.monotonic() - start)
 
     async def async_play_media(
         self,
@@ -210,7 +380,9 @@ class MuslimAssistantMediaPlayer(MediaPlayerEntity):
 
     async def async_play_adhan(self) -> None:
         """Play the Adhan audio on all targets."""
-        url = self.coordinator.get_adhan_audio_url()
+        url = await self._audio.async_local_url(
+            self.coordinator.get_adhan_audio_url()
+        )
         self._media_title = "Adhan"
         self._media_artist = "Muslim Assistant"
         await self.async_play_media(MediaType.MUSIC, url)
@@ -219,7 +391,9 @@ class MuslimAssistantMediaPlayer(MediaPlayerEntity):
         self, surah: int, ayah: int | None = None
     ) -> None:
         """Play Quran audio on all targets."""
-        url = self.coordinator.get_quran_audio_url(surah, ayah)
+        url = await self._audio.async_local_url(
+            self.coordinator.get_quran_audio_url(surah, ayah)
+        )
         reciter = self._entry.options.get(
             CONF_QURAN_RECITER, DEFAULT_RECITER
         )
@@ -0,0 +1,269 @@
+"""Offline import of nearby places from OpenStreetMap extracts.
+
+Supported inputs:
+
+- GeoJSON FeatureCollections (`.geojson`, `.json`)
+- GeoJSON text sequences, one feature per line (`.geojsonseq`,
+  `.geojsonl`, `.ndjson`), as written by `osmium export`
+- OSM PBF extracts (`.osm.pbf`, `.pbf`), when the optional `osmium`
+  package (pyosmium) is installed
+
+Files are read as a stream. Only mosques and halal places survive the
+tag filter, and those are kept only if they lie within a radius of
+home, so memory stays bounded by the places kept rather than by the
+size of the extract.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import json
+import logging
+from pathlib import Path
+import tempfile
+from typing import IO, Any
+
+import numpy as np
+
+from .places import haversine_km, place_categories, place_from_tags
+
+_LOGGER = logging.getLogger(__name__)
+
+GEOJSON_SEQ_SUFFIXES = (".geojsonseq", ".geojsonl", ".ndjson")
+PBF_SUFFIX = ".pbf"
+
+_CHUNK_SIZE = 1 << 16
+_BATCH_SIZE = 4096
+_RECORD_SEPARATOR = "\x1e"
+
+
+def import_places(
+    path: Path, latitude: float, longitude: float, radius_km: float
+) -> list[dict[str, Any]]:
+    """Return the places in an extract within a radius of a point.
+
+    This does blocking I/O.
+    """
+    collector = _NearbyCollector(latitude, longitude, radius_km)
+    name = path.name.lower()
+    if name.endswith(PBF_SUFFIX):
+        _read_pbf(path, collector)
+    else:
+        if name.endswith(GEOJSON_SEQ_SUFFIXES):
+            features = _iter_geojson_seq(path)
+        else:
+            features = _iter_geojson_features(path)
+        for place in _iter_feature_places(features):
+            collector.add(place)
+    places = collector.finish()
+    _LOGGER.debug("Imported %d places from %s", len(places), path)
+    return places
+
+
+class _NearbyCollector:
+    """Keep the places within a radius, measured in vectorised batches."""
+
+    def __init__(
+        self, latitude: float, longitude: float, radius_km: float
+    ) -> None:
+        """Initialize the collector."""
+        self._latitude = latitude
+        self._longitude = longitude
+        self._radius_km = radius_km
+        self._batch: list[dict[str, Any]] = []
+        self._kept: list[dict[str, Any]] = []
+
+    def add(self, place: dict[str, Any]) -> None:
+        """Offer a place."""
+        self._batch.append(place)
+        if len(self._batch) >= _BATCH_SIZE:
+            self._flush()
+
+    def finish(self) -> list[dict[str, Any]]:
+        """Return every place kept."""
+        self._flush()
+        return self._kept
+
+    def _flush(self) -> None:
+        """Measure the pending batch and keep the places inside."""
+        if not self._batch:
+            return
+        distances = haversine_km(
+            self._latitude,
+            self._longitude,
+            np.array([place["latitude"] for place in self._batch]),
+            np.array([place["longitude"] for place in self._batch]),
+        )
+        self._kept += [
+            self._batch[index]
+            for index in np.flatnonzero(distances <= self._radius_km)
+        ]
+        self._batch = []
+
+
+# ── GeoJSON ───────────────────────────────────────────────────────
+
+
+def _iter_geojson_seq(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the features of a GeoJSON text sequence."""
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip().lstrip(_RECORD_SEPARATOR)
+            if line:
+                yield json.loads(line)
+
+
+def _iter_geojson_features(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the features of a FeatureCollection one at a time.
+
+    The `features` array is decoded element by element from a sliding
+    buffer, so only one feature and one chunk are in memory at once.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as file:
+        buffer, position = _seek_features(file)
+        while True:
+            buffer, position = _skip(file, buffer, position, " \t\r\n,")
+            if position >= len(buffer) or buffer[position] == "]":
+                return
+            while True:
+                try:
+                    feature, end = decoder.raw_decode(buffer, position)
+                    break
+                except json.JSONDecodeError:
+                    chunk = file.read(_CHUNK_SIZE)
+                    if not chunk:
+                        raise
+                    buffer = buffer[position:] + chunk
+                    position = 0
+            yield feature
+            position = end
+
+
+def _seek_features(file: IO[str]) -> tuple[str, int]:
+    """Read up to the opening bracket of the `features` array."""
+    buffer = ""
+    while True:
+        chunk = file.read(_CHUNK_SIZE)
+        if not chunk:
+            raise ValueError("No GeoJSON features array found")
+        buffer += chunk
+        key = buffer.find('"features"')
+        if key >= 0:
+            bracket = buffer.find("[", key)
+            if bracket >= 0:
+                return buffer, bracket + 1
+        # Keep enough of the tail to match a key split across chunks
+        buffer = buffer[-_CHUNK_SIZE:]
+
+
+def _skip(
+    file: IO[str], buffer: str, position: int, characters: str
+) -> tuple[str, int]:
+    """Advance past separator characters, reading more as needed."""
+    while True:
+        while position < len(buffer) and buffer[position] in characters:
+            position += 1
+        if position < len(buffer):
+            return buffer, position
+        buffer = file.read(_CHUNK_SIZE)
+        position = 0
+        if not buffer:
+            return buffer, position
+
+
+def _iter_feature_places(
+    features: Iterable[dict[str, Any]],
+) -> Iterator[dict[str, Any]]:
+    """Yield a place for every category of each matching feature."""
+    for feature in features:
+        properties = feature.get("properties") or {}
+        # Some exporters nest the OSM tags, others flatten them
+        tags = properties.get("tags", properties)
+        if not isinstance(tags, dict):
+            continue
+        categories = place_categories(tags)
+        if not categories:
+            continue
+        point = _representative_point(feature.get("geometry"))
+        if point is None:
+            continue
+        longitude, latitude = point
+        for category in categories:
+            yield place_from_tags(category, latitude, longitude, tags)
+
+
+def _representative_point(
+    geometry: dict[str, Any] | None,
+) -> tuple[float, float] | None:
+    """Return a Point's position or the mean vertex of other geometries."""
+    if not geometry:
+        return None
+    coordinates = geometry.get("coordinates")
+    if geometry.get("type") == "Point":
+        return coordinates[0], coordinates[1]
+    vertices = np.asarray(_flatten(coordinates), dtype=np.float64)
+    if not vertices.size:
+        return None
+    longitude, latitude = vertices.reshape(-1, 2).mean(axis=0)
+    return float(longitude), float(latitude)
+
+
+def _flatten(coordinates: Any) -> list[float]:
+    """Return the [lon, lat] pairs of nested GeoJSON coordinates, flat."""
+    if not coordinates:
+        return []
+    if isinstance(coordinates[0], (int, float)):
+        return [coordinates[0], coordinates[1]]
+    return [value for item in coordinates for value in _flatten(item)]
+
+
+# ── OSM PBF ───────────────────────────────────────────────────────
+
+
+def _read_pbf(path: Path, collector: _NearbyCollector) -> None:
+    """Offer the places of an OSM PBF extract, using pyosmium."""
+    try:
+        import osmium  # noqa: PLC0415
+    except ImportError as err:
+        raise ValueError(
+            "Importing .osm.pbf files needs the 'osmium' package"
+        ) from err
+
+    class _Handler(osmium.SimpleHandler):
+        """Collect tagged nodes and way centres."""
+
+        def node(self, node: Any) -> None:
+            tags = dict(node.tags)
+            for category in place_categories(tags):
+                collector.add(
+                    place_from_tags(
+                        category, node.location.lat, node.location.lon, tags
+                    )
+                )
+
+        def way(self, way: Any) -> None:
+            tags = dict(way.tags)
+            categories = place_categories(tags)
+            if not categories:
+                return
+            points = [
+                (way_node.lat, way_node.lon)
+                for way_node in way.nodes
+                if way_node.location.valid()
+            ]
+            if not points:
+                return
+            latitude, longitude = np.mean(points, axis=0).tolist()
+            for category in categories:
+                collector.add(
+                    place_from_tags(category, latitude, longitude, tags)
+                )
+
+    # Way centres need node locations; keep that index on disk, not in RAM
+    with tempfile.TemporaryDirectory() as directory:
+        _Handler().apply_file(
+            str(path),
+            locations=True,
+            idx=f"sparse_file_array,{Path(directory) / 'locations'}",
+        )
@@ -0,0 +1,223 @@
+"""Nearby places index for Muslim Assistant.
+
+Places (mosques and halal food) around the home location are fetched
+rarely, over a wide radius, and kept in a PlaceIndex. Sensors and the
+`find_nearby` service query the index locally.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+import math
+import re
+from typing import Any
+
+import numpy as np
+
+from .const import (
+    PLACE_CATEGORIES,
+    PLACE_CATEGORY_HALAL,
+    PLACE_CATEGORY_MOSQUE,
+    PLACES_GRID_DEGREES,
+)
+from .qibla import EARTH_RADIUS_KM
+
+_HALAL_CUISINE = re.compile("halal|muslim")
+
+_DEFAULT_NAMES = {
+    PLACE_CATEGORY_MOSQUE: "Unknown Mosque",
+    PLACE_CATEGORY_HALAL: "Unknown Restaurant",
+}
+
+
+def haversine_km(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+) -> np.ndarray:
+    """Return great-circle distances in km from one point to many."""
+    phi1 = math.radians(latitude)
+    phi2 = np.radians(latitudes)
+    a = (
+        np.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1)
+        * np.cos(phi2)
+        * np.sin(np.radians(longitudes - longitude) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def place_from_tags(
+    category: str, latitude: float, longitude: float, tags: dict[str, Any]
+) -> dict[str, Any]:
+    """Return the stored form of a place from its OSM tags."""
+    place = {
+        "category": category,
+        "name": tags.get("name", _DEFAULT_NAMES[category]),
+        "latitude": latitude,
+        "longitude": longitude,
+        "address": tags.get("addr:street", ""),
+        "city": tags.get("addr:city", ""),
+    }
+    if category == PLACE_CATEGORY_HALAL:
+        place["cuisine"] = tags.get("cuisine", "halal")
+        place["phone"] = tags.get("phone", "")
+        place["website"] = tags.get("website", "")
+    return place
+
+
+def place_categories(tags: dict[str, Any]) -> list[str]:
+    """Return the categories an OSM feature belongs to, if any."""
+    categories = []
+    if (
+        tags.get("amenity") == "place_of_worship"
+        and tags.get("religion") == "muslim"
+    ):
+        categories.append(PLACE_CATEGORY_MOSQUE)
+    if (
+        _HALAL_CUISINE.search(tags.get("cuisine", ""))
+        or tags.get("diet:halal") == "yes"
+        or tags.get("halal") == "yes"
+    ):
+        categories.append(PLACE_CATEGORY_HALAL)
+    return categories
+
+
+def places_from_element(element: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return one place per category of an Overpass element."""
+    center = element.get("center", {})
+    latitude = element.get("lat") or center.get("lat")
+    longitude = element.get("lon") or center.get("lon")
+    if not latitude or not longitude:
+        return []
+    tags = element.get("tags", {})
+    return [
+        place_from_tags(category, latitude, longitude, tags)
+        for category in place_categories(tags)
+    ]
+
+
+class PlaceIndex:
+    """Places bucketed on a latitude/longitude grid.
+
+    Coordinates and categories are held in NumPy arrays alongside the
+    place dicts. Radius queries only measure the places in grid cells
+    that overlap the search box; every query is exact.
+    """
+
+    __slots__ = (
+        "places",
+        "_latitudes",
+        "_longitudes",
+        "_categories",
+        "_cells",
+    )
+
+    def __init__(self, places: list[dict[str, Any]]) -> None:
+        """Build the index."""
+        self.places = places
+        self._latitudes = np.array(
+            [place["latitude"] for place in places], dtype=np.float64
+        )
+        self._longitudes = np.array(
+            [place["longitude"] for place in places], dtype=np.float64
+        )
+        self._categories = np.array(
+            [PLACE_CATEGORIES.index(place["category"]) for place in places],
+            dtype=np.int8,
+        )
+        rows = np.floor(self._latitudes / PLACES_GRID_DEGREES).astype(int)
+        cols = np.floor(self._longitudes / PLACES_GRID_DEGREES).astype(int)
+        cells: dict[tuple[int, int], list[int]] = defaultdict(list)
+        for index, cell in enumerate(zip(rows.tolist(), cols.tolist())):
+            cells[cell].append(index)
+        self._cells = {
+            cell: np.array(indices, dtype=np.intp)
+            for cell, indices in cells.items()
+        }
+
+    def __len__(self) -> int:
+        """Return the number of places."""
+        return len(self.places)
+
+    def query(
+        self,
+        latitude: float,
+        longitude: float,
+        *,
+        radius_km: float | None = None,
+        category: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return places nearest first, each with its `distance_km`."""
+        candidates = self._candidates(latitude, longitude, radius_km)
+        if category is not None:
+            code = PLACE_CATEGORIES.index(category)
+            candidates = candidates[self._categories[candidates] == code]
+        distances = haversine_km(
+            latitude,
+            longitude,
+            self._latitudes[candidates],
+            self._longitudes[candidates],
+        )
+        if radius_km is not None:
+            inside = distances <= radius_km
+            candidates = candidates[inside]
+            distances = distances[inside]
+        if limit is not None and limit < len(distances):
+            # Only the nearest `limit` need sorting
+            order = np.argpartition(distances, limit - 1)[:limit]
+            order = order[np.argsort(distances[order])]
+        else:
+            order = np.argsort(distances)
+        return [
+            {
+                **self.places[candidates[index]],
+                "distance_km": round(float(distances[index]), 2),
+            }
+            for index in order
+        ]
+
+    def _candidates(
+        self, latitude: float, longitude: float, radius_km: float | None
+    ) -> np.ndarray:
+        """Return the indices of places that may lie within the radius."""
+        everything = np.arange(len(self.places))
+        if radius_km is None:
+            return everything
+        angle = radius_km / EARTH_RADIUS_KM
+        delta_lat = math.degrees(angle)
+        if abs(latitude) + delta_lat >= 90:
+            return everything
+        # Widest longitude span of a spherical cap around the point
+        delta_lon = math.degrees(
+            math.asin(math.sin(angle) / math.cos(math.radians(latitude)))
+        )
+        if abs(longitude) + delta_lon >= 180:
+            # The box crosses the antimeridian; rare enough to scan
+            return everything
+
+        def span(value: float, delta: float) -> range:
+            return range(
+                math.floor((value - delta) / PLACES_GRID_DEGREES),
+                math.floor((value + delta) / PLACES_GRID_DEGREES) + 1,
+            )
+
+        rows = span(latitude, delta_lat)
+        cols = span(longitude, delta_lon)
+        if len(rows) * len(cols) > len(self._cells):
+            selected = [
+                indices
+                for (row, col), indices in self._cells.items()
+                if row in rows and col in cols
+            ]
+        else:
+            selected = [
+                self._cells[cell]
+                for cell in ((row, col) for row in rows for col in cols)
+                if cell in self._cells
+            ]
+        if not selected:
+            return everything[:0]
+        return np.concatenate(selected)
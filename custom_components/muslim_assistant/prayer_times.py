@@ -0,0 +1,273 @@
+"""Offline prayer time engine for Muslim Assistant.
+
+Computes the daily timetable locally from the position of the sun, so
+prayer times no longer need a round-trip to the Aladhan API. The
+astronomy follows the PrayTimes.org formulation that Aladhan itself is
+built on, using the same method parameters, Asr shadow factors and high
+latitude rules.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from datetime import date
+
+import numpy as np
+
+from .const import (
+    CALC_METHOD_PARAMS,
+    HIGH_LAT_ANGLE_BASED,
+    HIGH_LAT_MIDDLE_OF_NIGHT,
+    HIGH_LAT_ONE_SEVENTH,
+    MIDNIGHT_JAFARI,
+    SCHOOL_HANAFI,
+)
+
+# Apparent altitude of the sun's upper limb at sunrise/sunset (refraction
+# plus semi-diameter), in degrees.
+SUNRISE_ANGLE = 0.833
+
+# Imsak is a fixed interval before Fajr, as on Aladhan.
+IMSAK_MINUTES = 10
+
+# Column order of the vectorized year timetable
+TIMETABLE_COLUMNS = (
+    "Fajr",
+    "Sunrise",
+    "Dhuhr",
+    "Asr",
+    "Sunset",
+    "Maghrib",
+    "Isha",
+    "Imsak",
+    "Midnight",
+    "Firstthird",
+    "Lastthird",
+)
+
+_SUNRISE = TIMETABLE_COLUMNS.index("Sunrise")
+_SUNSET = TIMETABLE_COLUMNS.index("Sunset")
+
+# Polar days borrow the times of the nearest latitude, searched in steps
+# toward the equator; the sun rises and sets every day below the limit.
+POLAR_FALLBACK_STEP = 0.5  # degrees
+POLAR_FALLBACK_MIN_LATITUDE = 65.0
+
+# Initial guesses (hours) used to evaluate the sun position for each time.
+_INITIAL_HOURS = {
+    "Fajr": 5.0,
+    "Sunrise": 6.0,
+    "Dhuhr": 12.0,
+    "Asr": 13.0,
+    "Sunset": 18.0,
+    "Maghrib": 18.0,
+    "Isha": 18.0,
+}
+
+
+def julian_day(day: date) -> float:
+    """Return the Julian day number at 00:00 UT for a Gregorian date."""
+    year, month = day.year, day.month
+    if month <= 2:
+        year -= 1
+        month += 12
+    a = year // 100
+    b = 2 - a + a // 4
+    return (
+        math.floor(365.25 * (year + 4716))
+        + math.floor(30.6001 * (month + 1))
+        + day.day
+        + b
+        - 1524.5
+    )
+
+
+def _sun_position(jd: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the sun's declination (deg) and equation of time (hours)."""
+    d = jd - 2451545.0
+    g = np.radians(np.mod(357.529 + 0.98560028 * d, 360.0))
+    q = np.mod(280.459 + 0.98564736 * d, 360.0)
+    lon = np.radians(
+        np.mod(q + 1.915 * np.sin(g) + 0.020 * np.sin(2 * g), 360.0)
+    )
+    e = np.radians(23.439 - 0.00000036 * d)
+
+    ra = np.degrees(np.arctan2(np.cos(e) * np.sin(lon), np.cos(lon))) / 15.0
+    eqt = q / 15.0 - np.mod(ra, 24.0)
+    decl = np.degrees(np.arcsin(np.sin(e) * np.sin(lon)))
+    return decl, eqt
+
+
+class _SolarDays:
+    """Sun geometry for one location over a run of consecutive dates."""
+
+    __slots__ = ("_jd", "_lat")
+
+    def __init__(
+        self, start: date, days: int, latitude: float, longitude: float
+    ) -> None:
+        self._jd = (
+            julian_day(start)
+            + np.arange(days, dtype=np.float64)
+            - longitude / (15.0 * 24.0)
+        )
+        self._lat = math.radians(latitude)
+
+    def mid_day(self, hours: float) -> np.ndarray:
+        _, eqt = _sun_position(self._jd + hours / 24.0)
+        return np.mod(12.0 - eqt, 24.0)
+
+    def sun_angle_time(
+        self, angle: float | np.ndarray, hours: float, ccw: bool = False
+    ) -> np.ndarray:
+        decl, _ = _sun_position(self._jd + hours / 24.0)
+        decl = np.radians(decl)
+        noon = self.mid_day(hours)
+        cos_t = (
+            -np.sin(np.radians(angle)) - np.sin(decl) * math.sin(self._lat)
+        ) / (np.cos(decl) * math.cos(self._lat))
+        with np.errstate(invalid="ignore"):
+            t = np.degrees(np.arccos(cos_t)) / 15.0
+        return noon - t if ccw else noon + t
+
+    def asr_time(self, factor: int, hours: float) -> np.ndarray:
+        decl, _ = _sun_position(self._jd + hours / 24.0)
+        lat = math.degrees(self._lat)
+        angle = -np.degrees(
+            np.arctan(1.0 / (factor + np.tan(np.radians(np.abs(lat - decl)))))
+        )
+        return self.sun_angle_time(angle, hours)
+
+
+def _adjust_high_lat(
+    value: np.ndarray,
+    base: np.ndarray,
+    angle: float,
+    night: np.ndarray,
+    rule: int,
+    ccw: bool = False,
+) -> np.ndarray:
+    """Clamp twilight times to a portion of the night."""
+    if rule == HIGH_LAT_MIDDLE_OF_NIGHT:
+        portion = night / 2.0
+    elif rule == HIGH_LAT_ONE_SEVENTH:
+        portion = night / 7.0
+    else:
+        portion = night * angle / 60.0
+
+    diff = np.mod(base - value, 24.0) if ccw else np.mod(value - base, 24.0)
+    with np.errstate(invalid="ignore"):
+        clamp = np.isnan(value) | (diff > portion)
+    clamped = base - portion if ccw else base + portion
+    return np.where(clamp & ~np.isnan(night), clamped, value)
+
+
+def calculate_year_hours(
+    start: date,
+    latitude: float,
+    longitude: float,
+    utc_offsets: Sequence[float],
+    method_id: int,
+    school_id: int,
+    high_lat_rule: int = HIGH_LAT_ANGLE_BASED,
+) -> np.ndarray:
+    """Calculate a timetable for consecutive days in one vectorized pass.
+
+    Returns a float array of shape (days, len(TIMETABLE_COLUMNS)) holding
+    local fractional hours, one row per day starting at `start`, where
+    `utc_offsets` gives the UTC offset (hours) of each day.
+
+    On days the sun does not rise or set (polar day or night) there is
+    no night for the high latitude rule to divide, so those days take
+    the times of the nearest latitude where the sun still rises and sets.
+    """
+    hours = _calculate_hours(
+        start, latitude, longitude, utc_offsets, method_id, school_id,
+        high_lat_rule,
+    )
+    fallback = latitude
+    while True:
+        polar = np.isnan(hours[:, _SUNRISE]) | np.isnan(hours[:, _SUNSET])
+        if not polar.any() or abs(fallback) <= POLAR_FALLBACK_MIN_LATITUDE:
+            return hours
+        fallback -= math.copysign(POLAR_FALLBACK_STEP, latitude)
+        nearer = _calculate_hours(
+            start, fallback, longitude, utc_offsets, method_id, school_id,
+            high_lat_rule,
+        )
+        hours[polar] = nearer[polar]
+
+
+def _calculate_hours(
+    start: date,
+    latitude: float,
+    longitude: float,
+    utc_offsets: Sequence[float],
+    method_id: int,
+    school_id: int,
+    high_lat_rule: int,
+) -> np.ndarray:
+    """Calculate a timetable at exactly one latitude; see above."""
+    params = CALC_METHOD_PARAMS.get(method_id, CALC_METHOD_PARAMS[2])
+    fajr_angle = params["fajr"]
+    isha_angle = params.get("isha")
+    maghrib_angle = params.get("maghrib")
+    asr_factor = 2 if school_id == SCHOOL_HANAFI else 1
+
+    offsets = np.asarray(utc_offsets, dtype=np.float64)
+    solar = _SolarDays(start, len(offsets), latitude, longitude)
+    guess = _INITIAL_HOURS
+    shift = offsets - longitude / 15.0
+
+    fajr = solar.sun_angle_time(fajr_angle, guess["Fajr"], ccw=True) + shift
+    sunrise = (
+        solar.sun_angle_time(SUNRISE_ANGLE, guess["Sunrise"], ccw=True)
+        + shift
+    )
+    dhuhr = solar.mid_day(guess["Dhuhr"]) + shift
+    asr = solar.asr_time(asr_factor, guess["Asr"]) + shift
+    sunset = solar.sun_angle_time(SUNRISE_ANGLE, guess["Sunset"]) + shift
+    if maghrib_angle is not None:
+        maghrib = solar.sun_angle_time(maghrib_angle, guess["Maghrib"]) + shift
+    else:
+        maghrib = sunset.copy()
+    if isha_angle is not None:
+        isha = solar.sun_angle_time(isha_angle, guess["Isha"]) + shift
+    else:
+        isha = np.full_like(sunset, np.nan)
+
+    night = np.mod(sunrise - sunset, 24.0)
+    fajr = _adjust_high_lat(
+        fajr, sunrise, fajr_angle, night, high_lat_rule, ccw=True
+    )
+    if isha_angle is not None:
+        isha = _adjust_high_lat(
+            isha, sunset, isha_angle, night, high_lat_rule
+        )
+    if maghrib_angle is not None:
+        maghrib = _adjust_high_lat(
+            maghrib, sunset, maghrib_angle, night, high_lat_rule
+        )
+
+    if "isha_minutes" in params:
+        isha = maghrib + params["isha_minutes"] / 60.0
+    imsak = fajr - IMSAK_MINUTES / 60.0
+
+    night_end = fajr if params.get("midnight") == MIDNIGHT_JAFARI else sunrise
+    night_length = np.mod(night_end - sunset, 24.0)
+
+    columns = {
+        "Fajr": fajr,
+        "Sunrise": sunrise,
+        "Dhuhr": dhuhr,
+        "Asr": asr,
+        "Sunset": sunset,
+        "Maghrib": maghrib,
+        "Isha": isha,
+        "Imsak": imsak,
+        "Midnight": sunset + night_length / 2.0,
+        "Firstthird": sunset + night_length / 3.0,
+        "Lastthird": sunset + 2.0 * night_length / 3.0,
+    }
+    return np.column_stack([columns[name] for name in TIMETABLE_COLUMNS])
@@ -0,0 +1,77 @@
+"""Local Qibla direction calculation for Muslim Assistant."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+import math
+
+import numpy as np
+
+from .const import KAABA_LATITUDE, KAABA_LONGITUDE
+
+EARTH_RADIUS_KM = 6371.0
+
+CARDINAL_DIRECTIONS = (
+    "N", "NNE", "NE", "ENE",
+    "E", "ESE", "SE", "SSE",
+    "S", "SSW", "SW", "WSW",
+    "W", "WNW", "NW", "NNW",
+)
+
+
+@lru_cache(maxsize=64)
+def calculate_qibla(latitude: float, longitude: float) -> tuple[float, float]:
+    """Return the Qibla bearing and the distance to the Kaaba.
+
+    The bearing is the initial great-circle bearing in degrees clockwise
+    from true north; the distance is the great-circle distance in km.
+    """
+    phi1 = math.radians(latitude)
+    phi2 = math.radians(KAABA_LATITUDE)
+    delta_lambda = math.radians(KAABA_LONGITUDE - longitude)
+
+    bearing = math.degrees(
+        math.atan2(
+            math.sin(delta_lambda) * math.cos(phi2),
+            math.cos(phi1) * math.sin(phi2)
+            - math.sin(phi1) * math.cos(phi2) * math.cos(delta_lambda),
+        )
+    )
+
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
+    )
+    distance = 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+    return bearing % 360, distance
+
+
+def calculate_qibla_batch(
+    latitudes: np.ndarray, longitudes: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return Qibla bearings and Kaaba distances for many points at once."""
+    phi1 = np.radians(np.asarray(latitudes, dtype=np.float64))
+    phi2 = math.radians(KAABA_LATITUDE)
+    delta_lambda = np.radians(
+        KAABA_LONGITUDE - np.asarray(longitudes, dtype=np.float64)
+    )
+
+    bearing = np.degrees(
+        np.arctan2(
+            np.sin(delta_lambda) * math.cos(phi2),
+            np.cos(phi1) * math.sin(phi2)
+            - np.sin(phi1) * math.cos(phi2) * np.cos(delta_lambda),
+        )
+    )
+
+    a = (
+        np.sin((phi2 - phi1) / 2) ** 2
+        + np.cos(phi1) * math.cos(phi2) * np.sin(delta_lambda / 2) ** 2
+    )
+    distance = 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+    return bearing % 360, distance
+
+
+def degrees_to_cardinal(degrees: float) -> str:
+    """Convert a bearing in degrees to a 16-point cardinal direction."""
+    return CARDINAL_DIRECTIONS[round(degrees / 22.5) % 16]
@@ -0,0 +1,287 @@
+"""Offline Quran corpus for Muslim Assistant.
+
+The Arabic text and translation of all 6,236 ayahs are kept in a single
+binary pack that is memory-mapped rather than loaded into Python
+objects. Layout:
+
+    magic (4 bytes) | header length (uint32) | JSON header | padding
+    | ayah offsets (uint32, editions x (ayahs + 1)) | UTF-8 text
+
+The JSON header carries the edition identifiers and per-surah metadata.
+Ayah N of edition E is text[offsets[E, N - 1]:offsets[E, N]].
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import date
+from itertools import accumulate
+import hashlib
+import json
+import logging
+import mmap
+import os
+from pathlib import Path
+import struct
+from typing import Any
+
+import numpy as np
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .api import MuslimAssistantApiClient
+from .const import (
+    AUDIO_BITRATE,
+    AYAH_COUNT,
+    QURAN_API_BASE,
+    QURAN_CDN_BASE,
+    QURAN_EDITION_ARABIC,
+    QURAN_EDITION_TRANSLATION,
+    QURAN_PACK_FILE,
+    QURAN_PACK_TIMEOUT,
+    SURAH_AYAH_COUNTS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+QURAN_PACK_MAGIC = b"MAQP"
+QURAN_PACK_VERSION = 1
+
+# A pack shipped with the integration takes precedence over a built one
+BUNDLED_PACK_PATH = Path(__file__).parent / "data" / "quran.bin"
+
+_PREFIX = struct.Struct("<4sI")
+
+# Global number of the first ayah of each surah, minus one
+_SURAH_STARTS = list(accumulate(SURAH_AYAH_COUNTS, initial=0))
+
+
+def locate_ayah(number: int) -> tuple[int, int]:
+    """Return (surah, ayah) for a global ayah number (1-6236)."""
+    if not 1 <= number <= AYAH_COUNT:
+        raise ValueError(f"Invalid ayah number {number}")
+    surah = bisect_right(_SURAH_STARTS, number - 1)
+    return surah, number - _SURAH_STARTS[surah - 1]
+
+
+def quran_audio_url(edition: str, surah: int, ayah: int | None = None) -> str:
+    """Return the recitation URL of a surah, or of one global ayah."""
+    if ayah is not None:
+        return f"{QURAN_CDN_BASE}/audio/{AUDIO_BITRATE}/{edition}/{ayah}.mp3"
+    return (
+        f"{QURAN_CDN_BASE}/audio-surah/{AUDIO_BITRATE}/{edition}/{surah}.mp3"
+    )
+
+
+def verse_of_the_day(day: date, seed: str = "") -> int:
+    """Return the global ayah number chosen for a day.
+
+    The choice is a stable hash of the date, so every refresh on the same
+    day agrees; a `seed` (such as a config entry id) varies the sequence.
+    """
+    digest = hashlib.sha256(f"{seed}:{day.isoformat()}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") % AYAH_COUNT + 1
+
+
+class QuranCorpus:
+    """Read-only, memory-mapped view of a Quran pack."""
+
+    __slots__ = (
+        "_file",
+        "_mmap",
+        "_offsets",
+        "_text_start",
+        "_surah_starts",
+        "edition_names",
+        "editions",
+        "surahs",
+    )
+
+    def __init__(self, path: Path) -> None:
+        """Map a pack file. This does blocking I/O."""
+        self._file = open(path, "rb")  # noqa: SIM115
+        try:
+            self._mmap = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+            magic, header_length = _PREFIX.unpack_from(self._mmap)
+            if magic != QURAN_PACK_MAGIC:
+                raise ValueError(f"{path} is not a Quran pack")
+            header_end = _PREFIX.size + header_length
+            header = json.loads(self._mmap[_PREFIX.size : header_end])
+            if header.get("version") != QURAN_PACK_VERSION:
+                raise ValueError(f"Unsupported Quran pack version in {path}")
+        except Exception:
+            self.close()
+            raise
+
+        self.editions: list[str] = header["editions"]
+        self.edition_names: list[str] = header.get(
+            "edition_names", self.editions
+        )
+        self.surahs: list[dict[str, Any]] = header["surahs"]
+        # Global number of the first ayah of each surah, minus one
+        self._surah_starts = list(
+            accumulate((s["ayahs"] for s in self.surahs), initial=0)
+        )
+
+        offsets_start = _aligned(header_end)
+        count = len(self.editions) * (self.ayah_count + 1)
+        self._offsets = np.frombuffer(
+            self._mmap, dtype="<u4", count=count, offset=offsets_start
+        ).reshape(len(self.editions), self.ayah_count + 1)
+        self._text_start = offsets_start + self._offsets.nbytes
+
+    def close(self) -> None:
+        """Unmap and close the pack."""
+        if getattr(self, "_offsets", None) is not None:
+            # Release the buffer export before closing the map
+            self._offsets = None
+        if getattr(self, "_mmap", None) is not None:
+            self._mmap.close()
+        self._file.close()
+
+    @property
+    def ayah_count(self) -> int:
+        """Return the total number of ayahs."""
+        return self._surah_starts[-1]
+
+    def global_number(self, surah: int, ayah: int) -> int:
+        """Return the global ayah number (1-6236) of surah:ayah."""
+        if not 1 <= surah <= len(self.surahs):
+            raise ValueError(f"Invalid surah number {surah}")
+        if not 1 <= ayah <= self.surahs[surah - 1]["ayahs"]:
+            raise ValueError(f"Surah {surah} has no ayah {ayah}")
+        return self._surah_starts[surah - 1] + ayah
+
+    def locate(self, number: int) -> tuple[int, int]:
+        """Return (surah, ayah) for a global ayah number."""
+        if not 1 <= number <= self.ayah_count:
+            raise ValueError(f"Invalid ayah number {number}")
+        surah = bisect_right(self._surah_starts, number - 1)
+        return surah, number - self._surah_starts[surah - 1]
+
+    def text(self, edition: str, number: int) -> str:
+        """Return the text of a global ayah number in an edition."""
+        row = self._offsets[self.editions.index(edition)]
+        start = self._text_start + int(row[number - 1])
+        end = self._text_start + int(row[number])
+        return self._mmap[start:end].decode()
+
+    def surah_texts(self, edition: str, surah: int) -> list[str]:
+        """Return the texts of every ayah in a surah, in order."""
+        first = self._surah_starts[surah - 1]
+        last = self._surah_starts[surah]
+        row = self._offsets[self.editions.index(edition)]
+        bounds = (row[first : last + 1] + self._text_start).tolist()
+        return [
+            self._mmap[start:end].decode()
+            for start, end in zip(bounds, bounds[1:])
+        ]
+
+
+def _aligned(offset: int) -> int:
+    """Round an offset up to a 4-byte boundary."""
+    return (offset + 3) & ~3
+
+
+def write_quran_pack(path: Path, editions: list[dict[str, Any]]) -> None:
+    """Write a pack from full-Quran API responses, one per edition.
+
+    Each item is the `data` object of an alquran.cloud `/quran/{edition}`
+    response. The file is replaced atomically. This does blocking I/O.
+    """
+    surahs = [
+        {
+            "number": surah["number"],
+            "name": surah.get("name", ""),
+            "englishName": surah.get("englishName", ""),
+            "englishNameTranslation": surah.get(
+                "englishNameTranslation", ""
+            ),
+            "revelationType": surah.get("revelationType", ""),
+            "ayahs": len(surah["ayahs"]),
+        }
+        for surah in editions[0]["surahs"]
+    ]
+    header = json.dumps(
+        {
+            "version": QURAN_PACK_VERSION,
+            "editions": [e["edition"]["identifier"] for e in editions],
+            "edition_names": [
+                e["edition"].get("englishName", "") for e in editions
+            ],
+            "surahs": surahs,
+        },
+        ensure_ascii=False,
+    ).encode()
+
+    blob = bytearray()
+    offsets = []
+    for edition in editions:
+        row = [len(blob)]
+        for surah in edition["surahs"]:
+            for ayah in surah["ayahs"]:
+                blob += ayah["text"].encode()
+                row.append(len(blob))
+        offsets.append(row)
+    offsets_array = np.array(offsets, dtype="<u4")
+
+    prefix = _PREFIX.pack(QURAN_PACK_MAGIC, len(header)) + header
+    padding = b"\0" * (_aligned(len(prefix)) - len(prefix))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as file:
+        file.write(prefix)
+        file.write(padding)
+        file.write(offsets_array.tobytes())
+        file.write(blob)
+    os.replace(tmp_path, path)
+
+
+def _open_existing_pack(path: Path) -> QuranCorpus | None:
+    """Open the bundled pack, or a built one, if either exists.
+
+    This does blocking I/O.
+    """
+    for candidate in (BUNDLED_PACK_PATH, path):
+        if candidate.exists():
+            return QuranCorpus(candidate)
+    return None
+
+
+async def async_open_quran_corpus(
+    hass: HomeAssistant, api: MuslimAssistantApiClient
+) -> QuranCorpus | None:
+    """Open the Quran pack, downloading and building it if needed."""
+    path = Path(hass.config.path(".storage", QURAN_PACK_FILE))
+    try:
+        corpus = await hass.async_add_executor_job(_open_existing_pack, path)
+        if corpus is None:
+            _LOGGER.info("Downloading the Quran text for offline use")
+            editions = []
+            for edition in (QURAN_EDITION_ARABIC, QURAN_EDITION_TRANSLATION):
+                result = await api.async_get_json(
+                    f"{QURAN_API_BASE}/quran/{edition}",
+                    timeout=QURAN_PACK_TIMEOUT,
+                )
+                editions.append(result["data"])
+            await hass.async_add_executor_job(
+                write_quran_pack, path, editions
+            )
+            corpus = await hass.async_add_executor_job(QuranCorpus, path)
+    except Exception as err:  # noqa: BLE001
+        _LOGGER.warning(
+            "Offline Quran unavailable, using the online API: %s", err
+        )
+        return None
+
+    @callback
+    def _close(event: Event) -> None:
+        corpus.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _close)
+    _LOGGER.debug("Loaded offline Quran (%d ayahs)", corpus.ayah_count)
+    return corpus
@@ -0,0 +1,88 @@
+"""Exact-time prayer scheduling for Muslim Assistant."""
+
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import EVENT_PRAYER_TIME
+from .coordinator import MuslimAssistantCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PrayerScheduler:
+    """Fire an event at the exact instant of each prayer.
+
+    A single timer is armed for the next prayer from the cached timetable,
+    or for local midnight if that comes first so the day's times roll
+    over. When it fires, the scheduler emits `muslim_assistant_prayer_time`,
+    refreshes the coordinator so the next-prayer sensor moves on, and arms
+    the following instant.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: MuslimAssistantCoordinator
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._unsub: CALLBACK_TYPE | None = None
+        self._pending: tuple[str, datetime] | None = None
+        self._running = False
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Arm the first timer and return a callback that stops scheduling."""
+        self._running = True
+        self._async_arm(dt_util.now(self._coordinator.time_zone))
+        return self.async_stop
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the armed timer."""
+        self._running = False
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_arm(self, now: datetime) -> None:
+        """Arm the timer for the next prayer or midnight."""
+        prayer, prayer_time = self._coordinator.next_prayer_time(now)
+        # Midnight where the prayers are, which may not be Home Assistant's
+        midnight = datetime.combine(
+            now.date() + timedelta(days=1), time(), now.tzinfo
+        )
+        if prayer_time is not None and prayer_time <= midnight:
+            self._pending = (prayer, prayer_time)
+            when = prayer_time
+        else:
+            self._pending = None
+            when = midnight
+        _LOGGER.debug("Next prayer event: %s at %s", self._pending, when)
+        self._unsub = async_track_point_in_time(
+            self._hass, self._async_handle_time, when
+        )
+
+    async def _async_handle_time(self, now: datetime) -> None:
+        """Emit the prayer event and arm the next timer."""
+        self._unsub = None
+        if self._pending is not None:
+            prayer, prayer_time = self._pending
+            self._hass.bus.async_fire(
+                EVENT_PRAYER_TIME,
+                {
+                    "entry_id": self._coordinator.config_entry.entry_id,
+                    "prayer": prayer,
+                    "time": prayer_time.strftime("%H:%M"),
+                    "timestamp": prayer_time.isoformat(),
+                },
+            )
+        await self._coordinator.async_refresh()
+        if self._running:
+            self._async_arm(dt_util.now(self._coordinator.time_zone))
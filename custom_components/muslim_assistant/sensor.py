@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 import logging
 from typing import Any
 
@@ -14,10 +15,24 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import DEGREE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
 
-from .const import DOMAIN, MAKKAH_LIVE_STREAM_URL, PRAYERS, VERSION
-from .coordinator import MuslimAssistantCoordinator
+from .const import (
+    DOMAIN,
+    KAABA_LATITUDE,
+    KAABA_LONGITUDE,
+    MAKKAH_LIVE_STREAM_URL,
+    PRAYERS,
+    VERSION,
+)
+from .coordinator import (
+    MuslimAssistantCoordinator,
+    NearbyPlacesCoordinator,
+    QuranVerseCoordinator,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,29 +51,38 @@ async def async_setup_entry(
         entities.append(PrayerTimeSensor(coordinator, entry, prayer))
 
     entities.append(NextPrayerSensor(coordinator, entry))
+    entities.append(NextPrayerTimeSensor(coordinator, entry))
     entities.append(QiblaSensor(coordinator, entry))
     entities.append(HijriDateSensor(coordinator, entry))
     entities.append(DailyDuaSensor(coordinator, entry))
-    entities.append(QuranVerseSensor(coordinator, entry))
+    entities.append(QuranVerseSensor(coordinator.quran_coordinator, entry))
     entities.append(RamadanSensor(coordinator, entry))
     entities.append(TasbihCounterSensor(coordinator, entry))
     entities.append(AllahNamesSensor(coordinator, entry))
     entities.append(IslamicQuoteSensor(coordinator, entry))
-    entities.append(MosqueFinderSensor(coordinator, entry))
-    entities.append(HalalFinderSensor(coordinator, entry))
+    entities.append(
+        MosqueFinderSensor(coordinator.places_coordinator, entry)
+    )
+    entities.append(
+        HalalFinderSensor(coordinator.places_coordinator, entry)
+    )
     entities.append(MakkahLiveSensor(coordinator, entry))
 
     async_add_entities(entities)
 
 
 class MuslimAssistantEntity(CoordinatorEntity):
-    """Base entity for Muslim Assistant."""
+    """Base entity for Muslim Assistant.
+
+    Each entity subscribes to the coordinator of the one data source it
+    displays, so it only updates when that source refreshes.
+    """
 
     _attr_has_entity_name = True
 
     def __init__(
         self,
-        coordinator: MuslimAssistantCoordinator,
+        coordinator: DataUpdateCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the entity."""
@@ -95,9 +119,8 @@ class PrayerTimeSensor(MuslimAssistantEntity, SensorEntity):
     def native_value(self) -> str | None:
         """Return the adjusted prayer time."""
         if self.coordinator.data:
-            timings = self.coordinator.data.get("prayer_times", {})
-            time_str = timings.get(self._prayer, "")
-            return time_str if time_str else None
+            timetable = self.coordinator.data["timetable"]
+            return timetable.time(self._prayer) or None
         return None
 
     @property
@@ -147,14 +170,50 @@ class NextPrayerSensor(MuslimAssistantEntity, SensorEntity):
         """Return additional attributes."""
         if self.coordinator.data:
             next_prayer = self.coordinator.data.get("next_prayer", {})
-            return {
-                "time": next_prayer.get("time", ""),
-                "time_remaining": next_prayer.get("time_remaining", ""),
-                "timestamp": next_prayer.get("timestamp", ""),
-                "all_prayer_times": self.coordinator.data.get(
-                    "prayer_times", {}
-                ),
-            }
+            attrs: dict[str, Any] = {"time": "", "timestamp": ""}
+            if prayer_time := next_prayer.get("time"):
+                attrs["time"] = prayer_time.strftime("%H:%M")
+                attrs["timestamp"] = prayer_time.isoformat()
+            attrs["all_prayer_times"] = self.coordinator.data[
+                "timetable"
+            ].timings()
+            return attrs
+        return {}
+
+
+class NextPrayerTimeSensor(MuslimAssistantEntity, SensorEntity):
+    """Sensor for the instant of the next prayer.
+
+    The frontend renders a timestamp as a live countdown, so the state
+    only changes when the next prayer does.
+    """
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:timer-sand"
+    _attr_name = "Next Prayer Time"
+
+    def __init__(
+        self,
+        coordinator: MuslimAssistantCoordinator,
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the next prayer time sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_next_prayer_time"
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return when the next prayer begins."""
+        if self.coordinator.data:
+            return self.coordinator.data.get("next_prayer", {}).get("time")
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the name of the next prayer."""
+        if self.coordinator.data:
+            next_prayer = self.coordinator.data.get("next_prayer", {})
+            return {"prayer": next_prayer.get("name")}
         return {}
 
 
@@ -191,13 +250,14 @@ class QiblaSensor(MuslimAssistantEntity, SensorEntity):
         if self.coordinator.data:
             qibla = self.coordinator.data.get("qibla", {})
             direction = qibla.get("direction", 0)
-            cardinal = self._degrees_to_cardinal(float(direction))
+            cardinal = qibla.get("cardinal", "")
             return {
                 "cardinal_direction": cardinal,
+                "distance_km": qibla.get("distance_km"),
                 "latitude": self.coordinator.latitude,
                 "longitude": self.coordinator.longitude,
-                "kaaba_latitude": 21.4225,
-                "kaaba_longitude": 39.8262,
+                "kaaba_latitude": KAABA_LATITUDE,
+                "kaaba_longitude": KAABA_LONGITUDE,
                 "instructions": (
                     f"Face {cardinal} ({round(float(direction), 1)}\u00b0) "
                     f"from your location to face the Qibla"
@@ -205,18 +265,6 @@ class QiblaSensor(MuslimAssistantEntity, SensorEntity):
             }
         return {}
 
-    @staticmethod
-    def _degrees_to_cardinal(degrees: float) -> str:
-        """Convert degrees to cardinal direction."""
-        dirs = [
-            "N", "NNE", "NE", "ENE",
-            "E", "ESE", "SE", "SSE",
-            "S", "SSW", "SW", "WSW",
-            "W", "WNW", "NW", "NNW",
-        ]
-        idx = round(degrees / 22.5) % 16
-        return dirs[idx]
-
 
 class HijriDateSensor(MuslimAssistantEntity, SensorEntity):
     """Sensor for Hijri (Islamic) calendar date."""
@@ -254,6 +302,7 @@ class HijriDateSensor(MuslimAssistantEntity, SensorEntity):
                 "hijri_month": hijri.get("month", ""),
                 "hijri_month_arabic": hijri.get("month_ar", ""),
                 "hijri_month_number": hijri.get("month_number", 0),
+                "hijri_month_days": hijri.get("month_length", 30),
                 "hijri_year": hijri.get("year", ""),
                 "hijri_weekday": hijri.get("weekday", ""),
                 "hijri_weekday_arabic": hijri.get("weekday_ar", ""),
@@ -315,7 +364,7 @@ class QuranVerseSensor(MuslimAssistantEntity, SensorEntity):
 
     def __init__(
         self,
-        coordinator: MuslimAssistantCoordinator,
+        coordinator: QuranVerseCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the Quran verse sensor."""
@@ -383,7 +432,7 @@ class RamadanSensor(MuslimAssistantEntity, SensorEntity):
         """Return Ramadan details."""
         if self.coordinator.data:
             ramadan = self.coordinator.data.get("ramadan", {})
-            timings = self.coordinator.data.get("prayer_times", {})
+            timetable = self.coordinator.data["timetable"]
             attrs: dict[str, Any] = {
                 "is_ramadan": ramadan.get("is_ramadan", False),
                 "ramadan_day": ramadan.get("ramadan_day", 0),
@@ -391,8 +440,8 @@ class RamadanSensor(MuslimAssistantEntity, SensorEntity):
                 "current_hijri_month": ramadan.get("month_name", ""),
             }
             if ramadan.get("is_ramadan"):
-                attrs["suhoor_ends"] = timings.get("Fajr", "")
-                attrs["iftar_time"] = timings.get("Maghrib", "")
+                attrs["suhoor_ends"] = timetable.time("Fajr")
+                attrs["iftar_time"] = timetable.time("Maghrib")
             return attrs
         return {}
 
@@ -411,52 +460,31 @@ class TasbihCounterSensor(MuslimAssistantEntity, SensorEntity):
         """Initialize the Tasbih counter sensor."""
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_tasbih"
-        self._count = 0
-        self._target = 33
-        self._dhikr = "SubhanAllah"
+        self._tasbih = coordinator.tasbih
+
+    async def async_added_to_hass(self) -> None:
+        """Write state when the counter publishes a change."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._tasbih.async_add_listener(self.async_write_ha_state)
+        )
 
     @property
     def native_value(self) -> int:
         """Return the current count."""
-        return self._count
+        return self._tasbih.count
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return tasbih details."""
         return {
-            "count": self._count,
-            "target": self._target,
-            "dhikr": self._dhikr,
-            "completed_sets": (
-                self._count // self._target if self._target else 0
-            ),
-            "remaining": (
-                max(0, self._target - (self._count % self._target))
-                if self._target
-                else 0
-            ),
+            "count": self._tasbih.count,
+            "target": self._tasbih.target,
+            "dhikr": self._tasbih.dhikr,
+            "completed_sets": self._tasbih.completed_sets,
+            "remaining": self._tasbih.remaining,
         }
 
-    def increment(self, amount: int = 1) -> None:
-        """Increment the counter."""
-        self._count += amount
-        self.async_write_ha_state()
-
-    def reset(self) -> None:
-        """Reset the counter."""
-        self._count = 0
-        self.async_write_ha_state()
-
-    def set_target(self, target: int) -> None:
-        """Set the target count."""
-        self._target = target
-        self.async_write_ha_state()
-
-    def set_dhikr(self, dhikr: str) -> None:
-        """Set the dhikr text."""
-        self._dhikr = dhikr
-        self.async_write_ha_state()
-
 
 class AllahNamesSensor(MuslimAssistantEntity, SensorEntity):
     """Sensor for the 99 Names of Allah (Asma ul Husna)."""
@@ -540,7 +568,7 @@ class MosqueFinderSensor(MuslimAssistantEntity, SensorEntity):
 
     def __init__(
         self,
-        coordinator: MuslimAssistantCoordinator,
+        coordinator: NearbyPlacesCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the mosque finder sensor."""
@@ -581,7 +609,7 @@ class HalalFinderSensor(MuslimAssistantEntity, SensorEntity):
 
     def __init__(
         self,
-        coordinator: MuslimAssistantCoordinator,
+        coordinator: NearbyPlacesCoordinator,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the halal finder sensor."""
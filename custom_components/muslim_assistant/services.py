@@ -3,14 +3,34 @@
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import entity_registry as er
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity_registry as er,
+)
 
-from .const import DOMAIN
+from .const import (
+    DEFAULT_RECITER,
+    DOMAIN,
+    PLACE_CATEGORIES,
+    PLACES_FETCH_RADIUS_KM,
+    PLACES_SENSOR_LIMIT,
+    PLACES_SENSOR_RADIUS_KM,
+    QURAN_RECITERS,
+)
+from .coordinator import MuslimAssistantCoordinator
+from .hub import async_get_hub
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +40,7 @@ SERVICE_TASBIH_INCREMENT = "tasbih_increment"
 SERVICE_TASBIH_RESET = "tasbih_reset"
 SERVICE_TASBIH_SET_TARGET = "tasbih_set_target"
 SERVICE_TASBIH_SET_DHIKR = "tasbih_set_dhikr"
+SERVICE_TASBIH_STATS = "tasbih_stats"
 SERVICE_GET_DUA = "get_dua"
 SERVICE_CALCULATE_ZAKAT = "calculate_zakat"
 SERVICE_GET_HAJJ_GUIDE = "get_hajj_guide"
@@ -29,12 +50,37 @@ SERVICE_PRAYER_REQUEST = "prayer_request"
 SERVICE_GET_ALLAH_NAMES = "get_allah_names"
 SERVICE_PLAY_ADHAN = "play_adhan"
 SERVICE_PLAY_QURAN = "play_quran"
+SERVICE_FIND_NEARBY = "find_nearby"
+SERVICE_IMPORT_PLACES = "import_places"
+
+# Parts of an ayah that callers can leave out of a response
+QURAN_FIELDS = ["arabic", "translation"]
+
+# Results are returned as service responses; events only when asked
+FIRE_EVENT = {vol.Optional("fire_event", default=False): cv.boolean}
+
+# Per-location results name their entry; optional with a single entry
+CONFIG_ENTRY = {vol.Optional("config_entry_id"): cv.string}
+
+QURAN_FIELDS_SCHEMA = {
+    vol.Optional("fields", default=QURAN_FIELDS): vol.All(
+        cv.ensure_list, [vol.In(QURAN_FIELDS)]
+    ),
+}
 
 SCHEMA_GET_SURAH = vol.Schema(
     {
         vol.Required("surah_number"): vol.All(
             vol.Coerce(int), vol.Range(min=1, max=114)
         ),
+        vol.Optional("offset", default=0): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=285)
+        ),
+        vol.Optional("limit"): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=286)
+        ),
+        **QURAN_FIELDS_SCHEMA,
+        **FIRE_EVENT,
     }
 )
 
@@ -46,6 +92,8 @@ SCHEMA_GET_AYAH = vol.Schema(
         vol.Required("ayah_number"): vol.All(
             vol.Coerce(int), vol.Range(min=1, max=286)
         ),
+        **QURAN_FIELDS_SCHEMA,
+        **FIRE_EVENT,
     }
 )
 
@@ -71,9 +119,18 @@ SCHEMA_TASBIH_SET_DHIKR = vol.Schema(
     }
 )
 
+SCHEMA_TASBIH_STATS = vol.Schema(
+    {
+        vol.Optional("dhikr"): str,
+        **CONFIG_ENTRY,
+        **FIRE_EVENT,
+    }
+)
+
 SCHEMA_GET_DUA = vol.Schema(
     {
         vol.Optional("category"): str,
+        **FIRE_EVENT,
     }
 )
 
@@ -112,10 +169,36 @@ SCHEMA_GET_ALLAH_NAMES = vol.Schema(
         vol.Optional("number"): vol.All(
             vol.Coerce(int), vol.Range(min=1, max=99)
         ),
+        **FIRE_EVENT,
+    }
+)
+
+SCHEMA_FIND_NEARBY = vol.Schema(
+    {
+        vol.Optional("category"): vol.In(PLACE_CATEGORIES),
+        vol.Optional("radius_km", default=PLACES_SENSOR_RADIUS_KM): vol.All(
+            vol.Coerce(float),
+            vol.Range(min=0.1, max=PLACES_FETCH_RADIUS_KM),
+        ),
+        vol.Optional("limit", default=PLACES_SENSOR_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+        **CONFIG_ENTRY,
+        **FIRE_EVENT,
+    }
+)
+
+SCHEMA_IMPORT_PLACES = vol.Schema(
+    {
+        vol.Optional("path"): str,
     }
 )
 
-SCHEMA_PLAY_ADHAN = vol.Schema({})
+SCHEMA_PLAY_ADHAN = vol.Schema(
+    {
+        **CONFIG_ENTRY,
+    }
+)
 
 SCHEMA_PLAY_QURAN = vol.Schema(
     {
@@ -125,112 +208,142 @@ SCHEMA_PLAY_QURAN = vol.Schema(
         vol.Optional("ayah_number"): vol.All(
             vol.Coerce(int), vol.Range(min=1, max=286)
         ),
+        **CONFIG_ENTRY,
     }
 )
 
 
+def _select_fields(
+    item: dict[str, Any], fields: list[str]
+) -> dict[str, Any]:
+    """Return a copy of an ayah without the Quran fields not asked for."""
+    return {
+        key: value
+        for key, value in item.items()
+        if key not in QURAN_FIELDS or key in fields
+    }
+
+
+def _entry_coordinator(
+    hass: HomeAssistant, call: ServiceCall
+) -> MuslimAssistantCoordinator:
+    """Return the coordinator of the entry a call is for."""
+    coordinators: dict[str, MuslimAssistantCoordinator] = hass.data.get(
+        DOMAIN, {}
+    )
+    if (entry_id := call.data.get("config_entry_id")) is not None:
+        if entry_id not in coordinators:
+            raise HomeAssistantError(
+                f"{entry_id} is not a loaded Muslim Assistant entry"
+            )
+        return coordinators[entry_id]
+    if len(coordinators) != 1:
+        raise HomeAssistantError(
+            "config_entry_id is required unless exactly one Muslim "
+            "Assistant entry is loaded"
+        )
+    return next(iter(coordinators.values()))
+
+
+def _reciter_edition(hass: HomeAssistant) -> str:
+    """Return the reciter of the first entry, for audio URLs."""
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        return coordinator.get_quran_reciter_edition()
+    return QURAN_RECITERS[DEFAULT_RECITER]
+
+
 async def async_register_services(hass: HomeAssistant) -> None:
     """Register Muslim Assistant services."""
+    hub = async_get_hub(hass)
 
-    async def handle_get_surah(call: ServiceCall) -> dict[str, Any]:
-        """Handle get_surah service call."""
+    async def handle_get_surah(call: ServiceCall) -> ServiceResponse:
+        """Handle get_surah service call, one page of ayahs at a time."""
         surah_number = call.data["surah_number"]
+        offset = call.data["offset"]
+        limit = call.data.get("limit")
+        fields = call.data["fields"]
 
-        for coordinator in hass.data.get(DOMAIN, {}).values():
-            result = await coordinator.async_get_surah(surah_number)
-            if result:
-                hass.bus.async_fire(
-                    f"{DOMAIN}_surah",
-                    {"surah_number": surah_number, "data": result},
-                )
-                return result
-        return {}
+        surah = await hub.async_get_surah(
+            surah_number, _reciter_edition(hass)
+        )
+        if not surah:
+            return {}
+        # The surah is shared with other callers; build a new result
+        ayahs = surah["ayahs"]
+        end = len(ayahs) if limit is None else offset + limit
+        result = {
+            **surah,
+            "offset": offset,
+            "next_offset": end if end < len(ayahs) else None,
+            "ayahs": [
+                _select_fields(ayah, fields) for ayah in ayahs[offset:end]
+            ],
+        }
+        if call.data["fire_event"]:
+            hass.bus.async_fire(
+                f"{DOMAIN}_surah",
+                {"surah_number": surah_number, "data": result},
+            )
+        return result
 
-    async def handle_get_ayah(call: ServiceCall) -> dict[str, Any]:
+    async def handle_get_ayah(call: ServiceCall) -> ServiceResponse:
         """Handle get_ayah service call."""
         surah_number = call.data["surah_number"]
         ayah_number = call.data["ayah_number"]
 
-        for coordinator in hass.data.get(DOMAIN, {}).values():
-            result = await coordinator.async_get_ayah(
-                surah_number, ayah_number
+        ayah = await hub.async_get_ayah(
+            surah_number, ayah_number, _reciter_edition(hass)
+        )
+        result = _select_fields(ayah, call.data["fields"])
+        if result and call.data["fire_event"]:
+            hass.bus.async_fire(
+                f"{DOMAIN}_ayah",
+                {
+                    "surah_number": surah_number,
+                    "ayah_number": ayah_number,
+                    "data": result,
+                },
             )
-            if result:
-                hass.bus.async_fire(
-                    f"{DOMAIN}_ayah",
-                    {
-                        "surah_number": surah_number,
-                        "ayah_number": ayah_number,
-                        "data": result,
-                    },
-                )
-                return result
-        return {}
+        return result
 
     async def handle_tasbih_increment(call: ServiceCall) -> None:
         """Handle tasbih_increment service call."""
         amount = call.data.get("amount", 1)
-        entity_reg = er.async_get(hass)
 
-        for entry_id in hass.data.get(DOMAIN, {}):
-            entity_id = entity_reg.async_get_entity_id(
-                "sensor", DOMAIN, f"{entry_id}_tasbih"
-            )
-            if entity_id:
-                entity = hass.data["entity_components"]["sensor"].get_entity(
-                    entity_id
-                )
-                if entity and hasattr(entity, "increment"):
-                    entity.increment(amount)
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            await coordinator.tasbih.async_increment(amount)
 
     async def handle_tasbih_reset(call: ServiceCall) -> None:
         """Handle tasbih_reset service call."""
-        entity_reg = er.async_get(hass)
-
-        for entry_id in hass.data.get(DOMAIN, {}):
-            entity_id = entity_reg.async_get_entity_id(
-                "sensor", DOMAIN, f"{entry_id}_tasbih"
-            )
-            if entity_id:
-                entity = hass.data["entity_components"]["sensor"].get_entity(
-                    entity_id
-                )
-                if entity and hasattr(entity, "reset"):
-                    entity.reset()
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            await coordinator.tasbih.async_reset()
 
     async def handle_tasbih_set_target(call: ServiceCall) -> None:
         """Handle tasbih_set_target service call."""
         target = call.data["target"]
-        entity_reg = er.async_get(hass)
 
-        for entry_id in hass.data.get(DOMAIN, {}):
-            entity_id = entity_reg.async_get_entity_id(
-                "sensor", DOMAIN, f"{entry_id}_tasbih"
-            )
-            if entity_id:
-                entity = hass.data["entity_components"]["sensor"].get_entity(
-                    entity_id
-                )
-                if entity and hasattr(entity, "set_target"):
-                    entity.set_target(target)
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            await coordinator.tasbih.async_set_target(target)
 
     async def handle_tasbih_set_dhikr(call: ServiceCall) -> None:
         """Handle tasbih_set_dhikr service call."""
         dhikr = call.data["dhikr"]
-        entity_reg = er.async_get(hass)
 
-        for entry_id in hass.data.get(DOMAIN, {}):
-            entity_id = entity_reg.async_get_entity_id(
-                "sensor", DOMAIN, f"{entry_id}_tasbih"
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            await coordinator.tasbih.async_set_dhikr(dhikr)
+
+    async def handle_tasbih_stats(call: ServiceCall) -> ServiceResponse:
+        """Handle tasbih_stats service call."""
+        coordinator = _entry_coordinator(hass, call)
+        result = coordinator.tasbih.stats(call.data.get("dhikr"))
+        if call.data["fire_event"]:
+            hass.bus.async_fire(
+                f"{DOMAIN}_tasbih_stats",
+                {"entry_id": coordinator.config_entry.entry_id, **result},
             )
-            if entity_id:
-                entity = hass.data["entity_components"]["sensor"].get_entity(
-                    entity_id
-                )
-                if entity and hasattr(entity, "set_dhikr"):
-                    entity.set_dhikr(dhikr)
+        return result
 
-    async def handle_get_dua(call: ServiceCall) -> None:
+    async def handle_get_dua(call: ServiceCall) -> ServiceResponse:
         """Handle get_dua service call."""
         from .const import DAILY_DUAS
 
@@ -242,7 +355,10 @@ async def async_register_services(hass: HomeAssistant) -> None:
         else:
             duas = DAILY_DUAS
 
-        hass.bus.async_fire(f"{DOMAIN}_duas", {"duas": duas})
+        result = {"duas": duas}
+        if call.data["fire_event"]:
+            hass.bus.async_fire(f"{DOMAIN}_duas", result)
+        return result
 
     async def handle_calculate_zakat(call: ServiceCall) -> None:
         """Handle calculate_zakat service call."""
@@ -349,7 +465,7 @@ async def async_register_services(hass: HomeAssistant) -> None:
             },
         )
 
-    async def handle_get_allah_names(call: ServiceCall) -> None:
+    async def handle_get_allah_names(call: ServiceCall) -> ServiceResponse:
         """Handle get_allah_names service call."""
         from .const import NAMES_OF_ALLAH
 
@@ -359,42 +475,102 @@ async def async_register_services(hass: HomeAssistant) -> None:
         else:
             names = NAMES_OF_ALLAH
 
-        hass.bus.async_fire(
-            f"{DOMAIN}_allah_names",
-            {"names": names, "total": len(NAMES_OF_ALLAH)},
+        result = {"names": names, "total": len(NAMES_OF_ALLAH)}
+        if call.data["fire_event"]:
+            hass.bus.async_fire(f"{DOMAIN}_allah_names", result)
+        return result
+
+    async def handle_find_nearby(call: ServiceCall) -> ServiceResponse:
+        """Handle find_nearby service call."""
+        category = call.data.get("category")
+        radius_km = call.data["radius_km"]
+
+        coordinator = _entry_coordinator(hass, call)
+        places = coordinator.places_coordinator.find_nearby(
+            category, radius_km, call.data["limit"]
         )
+        result = {
+            "category": category,
+            "radius_km": radius_km,
+            "count": len(places),
+            "places": places,
+        }
+        if call.data["fire_event"]:
+            hass.bus.async_fire(
+                f"{DOMAIN}_nearby",
+                {"entry_id": coordinator.config_entry.entry_id, **result},
+            )
+        return result
+
+    async def handle_import_places(call: ServiceCall) -> None:
+        """Handle import_places service call."""
+        if "path" not in call.data:
+            for coordinator in hass.data.get(DOMAIN, {}).values():
+                await coordinator.places_coordinator.async_clear_import()
+            return
+
+        path = Path(hass.config.path(call.data["path"]))
+        if not hass.config.is_allowed_path(str(path)):
+            raise HomeAssistantError(
+                f"{path} is not in allowlist_external_dirs"
+            )
+        if not await hass.async_add_executor_job(path.is_file):
+            raise HomeAssistantError(f"{path} does not exist")
 
-    async def handle_play_adhan(call: ServiceCall) -> None:
-        """Handle play_adhan service - play Adhan on the configured speaker."""
-        entity_reg = er.async_get(hass)
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            places = coordinator.places_coordinator
+            try:
+                count = await places.async_import_places(path)
+            except (OSError, ValueError) as err:
+                raise HomeAssistantError(
+                    f"Could not import places from {path}: {err}"
+                ) from err
+            _LOGGER.info("Imported %d nearby places from %s", count, path)
+
+    def _media_players(call: ServiceCall) -> list[Any]:
+        """Return the speakers a playback call is for.
+
+        A call naming a config entry plays on that entry's speaker only;
+        without one it plays on every entry's speaker.
+        """
+        entry_ids = list(hass.data.get(DOMAIN, {}))
+        if (entry_id := call.data.get("config_entry_id")) is not None:
+            if entry_id not in entry_ids:
+                raise HomeAssistantError(
+                    f"{entry_id} is not a loaded Muslim Assistant entry"
+                )
+            entry_ids = [entry_id]
+
+        component = hass.data.get("entity_components", {}).get(
+            "media_player"
+        )
+        if component is None:
+            return []
 
-        for entry_id in hass.data.get(DOMAIN, {}):
+        entity_reg = er.async_get(hass)
+        players = []
+        for entry_id in entry_ids:
             entity_id = entity_reg.async_get_entity_id(
                 "media_player", DOMAIN, f"{entry_id}_media_player"
             )
-            if entity_id:
-                entity = hass.data["entity_components"][
-                    "media_player"
-                ].get_entity(entity_id)
-                if entity and hasattr(entity, "async_play_adhan"):
-                    await entity.async_play_adhan()
+            if entity_id and (entity := component.get_entity(entity_id)):
+                players.append(entity)
+        return players
+
+    async def handle_play_adhan(call: ServiceCall) -> None:
+        """Handle play_adhan service - play Adhan on the configured speaker."""
+        for entity in _media_players(call):
+            if hasattr(entity, "async_play_adhan"):
+                await entity.async_play_adhan()
 
     async def handle_play_quran(call: ServiceCall) -> None:
         """Handle play_quran service - play Quran on the configured speaker."""
         surah_number = call.data["surah_number"]
         ayah_number = call.data.get("ayah_number")
-        entity_reg = er.async_get(hass)
 
-        for entry_id in hass.data.get(DOMAIN, {}):
-            entity_id = entity_reg.async_get_entity_id(
-                "media_player", DOMAIN, f"{entry_id}_media_player"
-            )
-            if entity_id:
-                entity = hass.data["entity_components"][
-                    "media_player"
-                ].get_entity(entity_id)
-                if entity and hasattr(entity, "async_play_quran"):
-                    await entity.async_play_quran(surah_number, ayah_number)
+        for entity in _media_players(call):
+            if hasattr(entity, "async_play_quran"):
+                await entity.async_play_quran(surah_number, ayah_number)
 
     # Register all services
     service_registrations = [
@@ -404,6 +580,7 @@ async def async_register_services(hass: HomeAssistant) -> None:
         (SERVICE_TASBIH_RESET, handle_tasbih_reset, None),
         (SERVICE_TASBIH_SET_TARGET, handle_tasbih_set_target, SCHEMA_TASBIH_SET_TARGET),
         (SERVICE_TASBIH_SET_DHIKR, handle_tasbih_set_dhikr, SCHEMA_TASBIH_SET_DHIKR),
+        (SERVICE_TASBIH_STATS, handle_tasbih_stats, SCHEMA_TASBIH_STATS),
         (SERVICE_GET_DUA, handle_get_dua, SCHEMA_GET_DUA),
         (SERVICE_CALCULATE_ZAKAT, handle_calculate_zakat, SCHEMA_CALCULATE_ZAKAT),
         (SERVICE_GET_HAJJ_GUIDE, handle_get_hajj_guide, None),
@@ -413,10 +590,31 @@ async def async_register_services(hass: HomeAssistant) -> None:
         (SERVICE_GET_ALLAH_NAMES, handle_get_allah_names, SCHEMA_GET_ALLAH_NAMES),
         (SERVICE_PLAY_ADHAN, handle_play_adhan, SCHEMA_PLAY_ADHAN),
         (SERVICE_PLAY_QURAN, handle_play_quran, SCHEMA_PLAY_QURAN),
+        (SERVICE_FIND_NEARBY, handle_find_nearby, SCHEMA_FIND_NEARBY),
+        (SERVICE_IMPORT_PLACES, handle_import_places, SCHEMA_IMPORT_PLACES),
     ]
 
+    # Lookups answer with a service response; calls that do not ask for
+    # one keep working, and can still fire the result as an event
+    response_services = {
+        SERVICE_GET_SURAH,
+        SERVICE_GET_AYAH,
+        SERVICE_TASBIH_STATS,
+        SERVICE_GET_DUA,
+        SERVICE_GET_ALLAH_NAMES,
+        SERVICE_FIND_NEARBY,
+    }
+
     for service_name, handler, schema in service_registrations:
         if not hass.services.has_service(DOMAIN, service_name):
             hass.services.async_register(
-                DOMAIN, service_name, handler, schema=schema
+                DOMAIN,
+                service_name,
+                handler,
+                schema=schema,
+                supports_response=(
+                    SupportsResponse.OPTIONAL
+                    if service_name in response_services
+                    else SupportsResponse.NONE
+                ),
             )
@@ -0,0 +1,93 @@
+"""Per-speaker call statistics for Muslim Assistant."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import numpy as np
+
+from .const import (
+    SPEAKER_SKIP_AFTER_FAILURES,
+    SPEAKER_SKIP_COOLDOWN,
+    SPEAKER_STATS_WINDOW,
+)
+
+
+class TargetHealth:
+    """Rolling latency and failures of calls to one target speaker.
+
+    The last SPEAKER_STATS_WINDOW calls are kept in a ring buffer of
+    latencies, NaN for a failed call. A target that fails
+    SPEAKER_SKIP_AFTER_FAILURES times in a row is skipped for
+    SPEAKER_SKIP_COOLDOWN seconds; the next call after that is a probe,
+    and one success clears the record.
+    """
+
+    __slots__ = (
+        "calls",
+        "failures",
+        "consecutive_failures",
+        "last_error",
+        "_latencies",
+        "_skip_until",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty record."""
+        self.calls = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_error: str | None = None
+        self._latencies = np.full(SPEAKER_STATS_WINDOW, np.nan)
+        self._skip_until = 0.0
+
+    @property
+    def skipped(self) -> bool:
+        """Return True while the target is being skipped."""
+        return time.monotonic() < self._skip_until
+
+    def record_success(self, latency: float) -> None:
+        """Record a call confirmed after `latency` seconds."""
+        self._record(latency)
+        self.consecutive_failures = 0
+        self._skip_until = 0.0
+
+    def record_failure(self, error: str) -> None:
+        """Record a call that failed or missed its deadline."""
+        self._record(np.nan)
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = error
+        if self.consecutive_failures >= SPEAKER_SKIP_AFTER_FAILURES:
+            self._skip_until = time.monotonic() + SPEAKER_SKIP_COOLDOWN
+
+    def _record(self, latency: float) -> None:
+        """Write one call into the ring buffer."""
+        self._latencies[self.calls % SPEAKER_STATS_WINDOW] = latency
+        self.calls += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as state attributes."""
+        window = self._latencies[: min(self.calls, SPEAKER_STATS_WINDOW)]
+        confirmed = window[~np.isnan(window)]
+        result: dict[str, Any] = {
+            "calls": self.calls,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "recent_failure_rate": (
+                round(1 - confirmed.size / window.size, 2)
+                if window.size
+                else 0.0
+            ),
+            "latency_ms_mean": None,
+            "latency_ms_p95": None,
+            "last_error": self.last_error,
+            "skipped": self.skipped,
+        }
+        if confirmed.size:
+            result["latency_ms_mean"] = round(float(confirmed.mean()) * 1000)
+            result["latency_ms_p95"] = round(
+                float(np.percentile(confirmed, 95)) * 1000
+            )
+        return result
@@ -0,0 +1,351 @@
+"""Tasbih (dhikr) counter engine for Muslim Assistant."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, tzinfo
+import logging
+from typing import Any
+
+import numpy as np
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DEFAULT_TASBIH_DHIKR,
+    DEFAULT_TASBIH_TARGET,
+    TASBIH_HISTORY_DAYS,
+    TASBIH_HISTORY_MAX_DHIKR,
+    TASBIH_PUBLISH_COOLDOWN,
+    TASBIH_SAVE_DELAY,
+    TASBIH_STORAGE_KEY,
+    TASBIH_STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rows of a dhikr's history array
+_DAY, _COUNT, _SETS = range(3)
+
+
+class TasbihHistory:
+    """Daily totals per dhikr in fixed-size ring buffers.
+
+    Each dhikr has an int64 array of shape (3, TASBIH_HISTORY_DAYS)
+    holding the day ordinal, bead count and completed sets, where day
+    `d` lives in slot `d % TASBIH_HISTORY_DAYS`. Memory per dhikr is
+    fixed; a slot is recycled when its day falls out of the window.
+    """
+
+    __slots__ = ("_dhikrs",)
+
+    def __init__(self) -> None:
+        """Initialize an empty history."""
+        self._dhikrs: dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, dict[str, list[int]]]
+    ) -> TasbihHistory:
+        """Restore a history saved with as_dict."""
+        history = cls()
+        for dhikr, days in data.items():
+            for day, count, sets in zip(
+                days["days"], days["counts"], days["sets"]
+            ):
+                history.record(dhikr, date.fromordinal(day), count, sets)
+        return history
+
+    def as_dict(self) -> dict[str, dict[str, list[int]]]:
+        """Return the occupied slots in a JSON-serializable form."""
+        result = {}
+        for dhikr, table in self._dhikrs.items():
+            used = table[:, table[_DAY] > 0]
+            result[dhikr] = {
+                "days": used[_DAY].tolist(),
+                "counts": used[_COUNT].tolist(),
+                "sets": used[_SETS].tolist(),
+            }
+        return result
+
+    def merge(self, other: TasbihHistory) -> None:
+        """Add another history's totals into this one."""
+        for dhikr, days in other.as_dict().items():
+            for day, count, sets in zip(
+                days["days"], days["counts"], days["sets"]
+            ):
+                self.record(dhikr, date.fromordinal(day), count, sets)
+
+    def record(self, dhikr: str, day: date, count: int, sets: int) -> None:
+        """Add beads and completed sets to a day's totals."""
+        table = self._dhikrs.get(dhikr)
+        if table is None:
+            if len(self._dhikrs) >= TASBIH_HISTORY_MAX_DHIKR:
+                stalest = min(
+                    self._dhikrs, key=lambda d: self._dhikrs[d][_DAY].max()
+                )
+                del self._dhikrs[stalest]
+            table = self._dhikrs[dhikr] = np.zeros(
+                (3, TASBIH_HISTORY_DAYS), dtype=np.int64
+            )
+        ordinal = day.toordinal()
+        slot = ordinal % TASBIH_HISTORY_DAYS
+        if table[_DAY, slot] != ordinal:
+            table[:, slot] = (ordinal, 0, 0)
+        table[_COUNT, slot] += count
+        table[_SETS, slot] += sets
+
+    def stats(self, dhikr: str, today: date) -> dict[str, Any]:
+        """Return totals, best day and streaks for a dhikr."""
+        table = self._dhikrs.get(dhikr)
+        if table is None:
+            table = np.zeros((3, 0), dtype=np.int64)
+        # Keep the window ending today; a slot not yet recycled can hold
+        # an older day, and one dated after today means the clock moved
+        age = today.toordinal() - table[_DAY]
+        table = table[:, (age >= 0) & (age < TASBIH_HISTORY_DAYS)]
+        age = today.toordinal() - table[_DAY]
+        counts = table[_COUNT]
+
+        def total(days: int) -> int:
+            return int(counts[age < days].sum())
+
+        counted = np.sort(table[_DAY, counts > 0])
+        best: dict[str, Any] = {"date": None, "count": 0}
+        if counted.size:
+            index = int(np.argmax(counts))
+            best = {
+                "date": date.fromordinal(int(table[_DAY, index])).isoformat(),
+                "count": int(counts[index]),
+            }
+
+        return {
+            "dhikr": dhikr,
+            "today": total(1),
+            "completed_sets_today": int(table[_SETS, age == 0].sum()),
+            "week": total(7),
+            "month": total(30),
+            "total": int(counts.sum()),
+            "completed_sets": int(table[_SETS].sum()),
+            "days_counted": int(counted.size),
+            "best_day": best,
+            "current_streak": _current_streak(counted, today.toordinal()),
+            "longest_streak": _longest_streak(counted),
+        }
+
+
+def _current_streak(days: np.ndarray, today: int) -> int:
+    """Return the run of consecutive days ending today or yesterday."""
+    if not days.size or days[-1] < today - 1:
+        return 0
+    # Days are sorted and unique: the run starts after the last gap
+    gaps = np.flatnonzero(np.diff(days) != 1)
+    start = gaps[-1] + 1 if gaps.size else 0
+    return int(days.size - start)
+
+
+def _longest_streak(days: np.ndarray) -> int:
+    """Return the longest run of consecutive days."""
+    if not days.size:
+        return 0
+    breaks = np.flatnonzero(np.diff(days) != 1)
+    bounds = np.concatenate(([-1], breaks, [days.size - 1]))
+    return int(np.diff(bounds).max())
+
+
+class TasbihCounter:
+    """Live tasbih state for one config entry.
+
+    Counting only updates integers. Publishing to listeners, which means a
+    state write and a recorder row, is coalesced. A burst of presses
+    produces at most one publish per cooldown, plus a trailing publish
+    that carries the final count.
+
+    The state is persisted write-behind: the first change schedules one
+    delayed save that writes whatever the state is by then, and unloading
+    or stopping Home Assistant writes anything still pending.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, time_zone: tzinfo
+    ) -> None:
+        """Initialize the counter.
+
+        History days follow `time_zone`, the entry's time zone.
+        """
+        self.count = 0
+        self.target = DEFAULT_TASBIH_TARGET
+        self.dhikr = DEFAULT_TASBIH_DHIKR
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._dirty = False
+        self._store = _tasbih_store(hass, entry_id)
+        # Changes made before the stored state was restored, and the
+        # fields they explicitly set
+        self._changed_before_load = False
+        self._set_before_load: set[str] = set()
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self._save_pending = False
+        self.history = TasbihHistory()
+        self._time_zone = time_zone
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=TASBIH_PUBLISH_COOLDOWN,
+            immediate=True,
+            function=self._async_publish,
+        )
+
+    @property
+    def completed_sets(self) -> int:
+        """Return the number of completed sets of the target."""
+        return self.count // self.target if self.target else 0
+
+    @property
+    def remaining(self) -> int:
+        """Return the counts left in the current set."""
+        if not self.target:
+            return 0
+        return max(0, self.target - (self.count % self.target))
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for published changes; returns a callback to stop."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    async def async_load(self) -> None:
+        """Restore the persisted state under any changes made meanwhile.
+
+        Beads counted while loading are added to the stored count; a
+        reset, target or dhikr set while loading wins over the stored one.
+        """
+        async with self._load_lock:
+            if not self._loaded:
+                await self._async_restore()
+
+    async def _async_restore(self) -> None:
+        """Merge the stored state into the live one."""
+        stored = await self._store.async_load()
+        self._loaded = True
+        if stored:
+            history = TasbihHistory.from_dict(stored.get("history", {}))
+            history.merge(self.history)
+            self.history = history
+            if "count" not in self._set_before_load:
+                self.count += stored.get("count", 0)
+            if "target" not in self._set_before_load:
+                self.target = stored.get("target", DEFAULT_TASBIH_TARGET)
+            if "dhikr" not in self._set_before_load:
+                self.dhikr = stored.get("dhikr", DEFAULT_TASBIH_DHIKR)
+            self._async_publish()
+        if self._changed_before_load:
+            self._async_schedule_save()
+        self._changed_before_load = False
+        self._set_before_load.clear()
+
+    async def async_increment(self, amount: int = 1) -> None:
+        """Add `amount` beads to the count."""
+        sets_before = self.completed_sets
+        self.count += amount
+        self.history.record(
+            self.dhikr,
+            dt_util.now(self._time_zone).date(),
+            amount,
+            self.completed_sets - sets_before,
+        )
+        await self._async_changed()
+
+    def stats(self, dhikr: str | None = None) -> dict[str, Any]:
+        """Return history aggregates for a dhikr, by default the current."""
+        return self.history.stats(
+            dhikr or self.dhikr, dt_util.now(self._time_zone).date()
+        )
+
+    async def async_reset(self) -> None:
+        """Reset the count to zero."""
+        self.count = 0
+        await self._async_changed("count")
+
+    async def async_set_target(self, target: int) -> None:
+        """Set the target count of one set."""
+        self.target = target
+        await self._async_changed("target")
+
+    async def async_set_dhikr(self, dhikr: str) -> None:
+        """Set the dhikr being counted."""
+        self.dhikr = dhikr
+        await self._async_changed("dhikr")
+
+    async def async_shutdown(self) -> None:
+        """Stop publishing and flush changes held back for later."""
+        await self._debouncer.async_shutdown()
+        if self._changed_before_load:
+            # Merge before saving, or the stored state would be lost
+            await self.async_load()
+        if self._dirty:
+            self._async_publish()
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    async def _async_changed(self, field: str | None = None) -> None:
+        """Mark the state changed; publish and save it when allowed."""
+        self._dirty = True
+        if self._loaded:
+            self._async_schedule_save()
+        else:
+            # A pending save would be read back as the stored state, so
+            # saving waits until the restore has merged it
+            self._changed_before_load = True
+            if field is not None:
+                self._set_before_load.add(field)
+        await self._debouncer.async_call()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save the state once after a quiet period."""
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, TASBIH_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the state to persist; called when the save happens."""
+        self._save_pending = False
+        return {
+            "count": self.count,
+            "target": self.target,
+            "dhikr": self.dhikr,
+            "history": self.history.as_dict(),
+        }
+
+    @callback
+    def _async_publish(self) -> None:
+        """Notify listeners of the current state."""
+        self._dirty = False
+        for update_callback in list(self._listeners):
+            update_callback()
+
+
+def _tasbih_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding one entry's tasbih state."""
+    return Store(
+        hass, TASBIH_STORAGE_VERSION, f"{TASBIH_STORAGE_KEY}.{entry_id}"
+    )
+
+
+async def async_remove_tasbih_store(
+    hass: HomeAssistant, entry_id: str
+) -> None:
+    """Delete the persisted tasbih state of a removed entry."""
+    await _tasbih_store(hass, entry_id).async_remove()
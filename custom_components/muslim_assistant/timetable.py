@@ -0,0 +1,156 @@
+"""Precomputed prayer timetables for Muslim Assistant."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta, tzinfo
+import math
+
+import numpy as np
+
+from .const import PRAYERS
+from .prayer_times import TIMETABLE_COLUMNS, calculate_year_hours
+
+COLUMN_INDEX = {name: index for index, name in enumerate(TIMETABLE_COLUMNS)}
+
+
+def format_minutes(minutes: float) -> str:
+    """Format minutes after local midnight as "HH:MM"."""
+    if np.isnan(minutes):
+        return ""
+    hours, mins = divmod(int(minutes) % 1440, 60)
+    return f"{hours:02d}:{mins:02d}"
+
+
+class YearTimetable:
+    """A whole year of prayer times for one location.
+
+    Times are held in a single float32 array of shape
+    (days in year, len(TIMETABLE_COLUMNS)) as whole minutes after local
+    midnight, NaN where a time does not exist. Values may exceed 1440
+    when a time (usually Isha or Midnight) falls after midnight.
+    """
+
+    __slots__ = ("year", "_minutes")
+
+    def __init__(self, year: int, minutes: np.ndarray) -> None:
+        """Initialize the timetable."""
+        self.year = year
+        self._minutes = minutes
+
+    @classmethod
+    def calculate(
+        cls,
+        year: int,
+        latitude: float,
+        longitude: float,
+        time_zone: tzinfo,
+        method_id: int,
+        school_id: int,
+        high_lat_rule: int,
+    ) -> YearTimetable:
+        """Calculate the timetable for a full calendar year."""
+        start = date(year, 1, 1)
+        days = (date(year + 1, 1, 1) - start).days
+        utc_offsets = []
+        for index in range(days):
+            day = start + timedelta(days=index)
+            noon = datetime(day.year, day.month, day.day, 12, tzinfo=time_zone)
+            offset = noon.utcoffset() or timedelta()
+            utc_offsets.append(offset.total_seconds() / 3600)
+
+        hours = calculate_year_hours(
+            start,
+            latitude,
+            longitude,
+            utc_offsets,
+            method_id,
+            school_id,
+            high_lat_rule,
+        )
+        minutes = np.floor(hours * 60.0 + 0.5).astype(np.float32)
+        return cls(year, minutes)
+
+    def row(self, day: date) -> np.ndarray:
+        """Return the minutes row for a day, in TIMETABLE_COLUMNS order."""
+        return self._minutes[day.timetuple().tm_yday - 1]
+
+    def timings(self, day: date) -> dict[str, str]:
+        """Return a day in the Aladhan `timings` shape."""
+        row = self.row(day)
+        return {
+            name: format_minutes(row[index])
+            for name, index in COLUMN_INDEX.items()
+        }
+
+
+class DailyTimetable:
+    """One day's prayer times as timezone-aware instants.
+
+    Times are held as UTC epoch seconds in a float64 array in
+    TIMETABLE_COLUMNS order, NaN where a time does not exist, with the
+    user's offsets already applied. They are only formatted on request.
+    """
+
+    __slots__ = ("day", "time_zone", "_epochs", "_prayers", "_prayer_epochs")
+
+    def __init__(
+        self, day: date, time_zone: tzinfo, epochs: np.ndarray
+    ) -> None:
+        """Initialize the timetable."""
+        self.day = day
+        self.time_zone = time_zone
+        self._epochs = epochs
+        # Prayers that occur on this day, in time order, for bisection
+        upcoming = sorted(
+            (float(epochs[COLUMN_INDEX[name]]), name)
+            for name in PRAYERS
+            if not np.isnan(epochs[COLUMN_INDEX[name]])
+        )
+        self._prayer_epochs = [epoch for epoch, _ in upcoming]
+        self._prayers = [name for _, name in upcoming]
+
+    @classmethod
+    def from_minutes(
+        cls, day: date, minutes: np.ndarray, time_zone: tzinfo
+    ) -> DailyTimetable:
+        """Build a day from minutes after local midnight.
+
+        Minutes are wall-clock times, so each is resolved against the UTC
+        offset in force at that local time; a DST change during the day
+        does not shift the instants.
+        """
+        midnight = datetime(day.year, day.month, day.day, tzinfo=time_zone)
+        epochs = np.full(len(minutes), np.nan)
+        for index, value in enumerate(minutes.tolist()):
+            if not math.isnan(value):
+                local = midnight + timedelta(minutes=value)
+                epochs[index] = local.timestamp()
+        return cls(day, time_zone, epochs)
+
+    def instant(self, name: str) -> datetime | None:
+        """Return the local time of a prayer, or None if it does not occur."""
+        epoch = self._epochs[COLUMN_INDEX[name]]
+        if np.isnan(epoch):
+            return None
+        return datetime.fromtimestamp(float(epoch), self.time_zone)
+
+    def time(self, name: str) -> str:
+        """Return a prayer time as "HH:MM", or "" if it does not occur."""
+        if (instant := self.instant(name)) is None:
+            return ""
+        return instant.strftime("%H:%M")
+
+    def timings(self, names: Iterable[str] = PRAYERS) -> dict[str, str]:
+        """Return "HH:MM" times keyed by name."""
+        return {name: self.time(name) for name in names}
+
+    def next_after(self, timestamp: float) -> tuple[str, datetime] | None:
+        """Return the first prayer strictly after a UTC epoch timestamp."""
+        index = bisect_right(self._prayer_epochs, timestamp)
+        if index == len(self._prayers):
+            return None
+        return self._prayers[index], datetime.fromtimestamp(
+            self._prayer_epochs[index], self.time_zone
+        )
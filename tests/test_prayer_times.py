@@ -0,0 +1,45 @@
+"""Tests for the offline prayer time engine."""
+
+from datetime import date
+
+import numpy as np
+
+from custom_components.muslim_assistant.const import HIGH_LAT_ANGLE_BASED
+from custom_components.muslim_assistant.prayer_times import (
+    TIMETABLE_COLUMNS,
+    calculate_year_hours,
+)
+
+# Tromsø, Norway: the sun does not set from late May to late July
+TROMSO = (69.65, 18.96)
+MWL = 3
+
+
+def _day(day: date, utc_offset: float) -> dict[str, float]:
+    hours = calculate_year_hours(
+        day, *TROMSO, [utc_offset], MWL, 0, HIGH_LAT_ANGLE_BASED
+    )
+    return dict(zip(TIMETABLE_COLUMNS, hours[0]))
+
+
+def test_polar_day_has_every_time() -> None:
+    """Midsummer above the Arctic Circle still yields a full timetable."""
+    times = _day(date(2026, 6, 21), 2.0)
+    assert not any(np.isnan(value) for value in times.values())
+    assert times["Fajr"] < times["Sunrise"] < times["Dhuhr"]
+    assert times["Dhuhr"] < times["Asr"] < times["Sunset"]
+    assert times["Sunset"] <= times["Maghrib"] <= times["Isha"]
+
+
+def test_polar_night_has_every_time() -> None:
+    """Midwinter, when the sun does not rise, yields a full timetable."""
+    times = _day(date(2026, 12, 21), 1.0)
+    assert not any(np.isnan(value) for value in times.values())
+    assert times["Sunrise"] < times["Dhuhr"] < times["Sunset"]
+
+
+def test_ordinary_day_is_unchanged() -> None:
+    """Days with a sunrise and sunset use the location's own latitude."""
+    times = _day(date(2026, 3, 20), 1.0)
+    # Equinox: about twelve hours of daylight at any latitude
+    assert 11.5 < times["Sunset"] - times["Sunrise"] < 13.0